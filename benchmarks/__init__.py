@@ -0,0 +1,6 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+性能基准测试
+包含合成学习路线生成器和各模块的基准测试脚本
+"""
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LearningData 基准测试
+在不同规模的合成学习路线上测量构建、缓存载入和各查询接口的耗时，
+结果写为JSON，并与已保存的基线比较，超出容忍倍数时以非零状态退出；
+从编译缓存载入不快于直接解析和构建时同样以非零状态退出。
+
+用法:
+    python -m benchmarks.bench_learning_data --days 1000 10000
+    python -m benchmarks.bench_learning_data --days 100000 --queries 2000 -o results.json
+    python -m benchmarks.bench_learning_data --update-baseline
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from benchmarks.common import compare_with_baseline, print_table, time_calls, time_once, write_results
+from benchmarks.synthetic import load_vocabulary, generate_curriculum
+from src.data.learning_data import LearningData
+
+SUITE = 'learning_data'
+DEFAULT_BASELINE = Path(__file__).resolve().parent / 'baselines' / f'{SUITE}.json'
+
+
+def run_size(days: int, queries: int, repeat: int, seed: int) -> Dict[str, Dict]:
+    """在指定天数的合成学习路线上运行全部基准，结果名称为 "操作@天数" """
+    learning_path = generate_curriculum(days=days, seed=seed)
+    rng = random.Random(seed)
+    results = {}
+
+    def record(name: str, result: Dict):
+        results[f"{name}@{days}"] = result
+
+    record('construct', time_once(lambda: LearningData(learning_path), repeat))
+    data = LearningData(learning_path)
+    record('build_search_index', time_once(lambda: LearningData(learning_path).search_index, repeat))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pack_path = Path(temp_dir) / f"synthetic-{days}.json"
+        with open(pack_path, 'w', encoding='utf-8') as f:
+            json.dump(learning_path, f, ensure_ascii=False)
+        cache_dir = Path(temp_dir) / 'cache'
+        LearningData.from_content_pack(pack_path, cache_dir).search_index  # 预热编译缓存和搜索索引缓存
+        record('load_uncached_pack', time_once(lambda: LearningData.from_content_pack(pack_path, None), repeat))
+        record('load_cached_pack', time_once(lambda: LearningData.from_content_pack(pack_path, cache_dir), repeat))
+        record('load_cached_search_index', time_once(
+            lambda: LearningData.from_content_pack(pack_path, cache_dir).search_index, repeat
+        ))
+
+    data.search_index  # 查询基准不计入索引构建
+    total_days = data.get_indexed_days()
+    stages = data.get_all_stages()
+    stage_ids = [stage["id"] for stage in stages]
+    weeks = [week_detail["week"] for stage in stages for week_detail in stage["weeks_detail"]]
+    vocabulary = load_vocabulary()
+
+    record('get_task_by_day', time_calls(
+        data.get_task_by_day, [rng.randint(1, total_days) for _ in range(queries)]
+    ))
+    keywords = [rng.choice(vocabulary) for _ in range(max(1, queries // 10))]
+    record('search_tasks', time_calls(lambda keyword: data.search_tasks(keyword, 20), keywords))
+    record('search_tasks_unlimited', time_calls(data.search_tasks, keywords))
+    record('get_week_tasks', time_calls(data.get_week_tasks, [rng.choice(weeks) for _ in range(queries)]))
+    record('get_stage_progress', time_calls(
+        lambda arguments: data.get_stage_progress(*arguments),
+        [(rng.choice(stage_ids), rng.randint(0, total_days)) for _ in range(queries)]
+    ))
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="LearningData 基准测试")
+    parser.add_argument("--days", type=int, nargs='+', default=[1000, 10000], help="合成学习路线的天数（可指定多个）")
+    parser.add_argument("--queries", type=int, default=5000, help="每个查询基准的调用次数")
+    parser.add_argument("--repeat", type=int, default=3, help="构建和载入基准的重复次数")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    parser.add_argument("-o", "--output", help="结果JSON输出路径")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="基线JSON路径")
+    parser.add_argument("--metric", default='p50_us', help="与基线比较的指标")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="允许相对基线变慢的倍数")
+    parser.add_argument("--update-baseline", action='store_true', help="将本次结果保存为新的基线")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for days in args.days:
+        print(f"运行 {days} 天 ...", flush=True)
+        results.update(run_size(days, args.queries, args.repeat, args.seed))
+
+    print()
+    print_table(results)
+    parameters = {'days': args.days, 'queries': args.queries, 'repeat': args.repeat, 'seed': args.seed}
+    if args.output:
+        write_results(args.output, SUITE, results, parameters)
+
+    if args.update_baseline:
+        write_results(args.baseline, SUITE, results, parameters)
+        print(f"\n已更新基线: {args.baseline}")
+        return 0
+
+    slower = [days for days in args.days
+              if results[f"load_cached_pack@{days}"][args.metric] >= results[f"load_uncached_pack@{days}"][args.metric]]
+    if slower:
+        print(f"\n从编译缓存载入不快于不使用缓存: {', '.join(f'{days} 天' for days in slower)}")
+        return 1
+
+    regressions = compare_with_baseline(results, args.baseline, args.metric, args.tolerance)
+    if regressions is None:
+        print(f"\n基线不存在，跳过比较: {args.baseline}")
+        return 0
+    if regressions:
+        print(f"\n{len(regressions)} 项超出基线 {args.tolerance:.2f} 倍: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
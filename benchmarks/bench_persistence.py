@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+进度持久化基准测试
+用同一份模拟学习记录驱动 AppManager：大量完成任务、编辑较大的Markdown笔记、
+连续进入下一天、导出/导入进度，并重新加载进度。在各存储后端上分别运行，
+报告每种操作的耗时分位数、写入字节数和fsync次数。
+
+用法:
+    python -m benchmarks.bench_persistence
+    python -m benchmarks.bench_persistence --backends json journal --completions 5000 -o results.json
+"""
+
+import argparse
+import json
+import logging
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Tuple
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from benchmarks.common import (IOCounter, compare_with_baseline, print_table, summarize, time_calls,
+                               write_results)
+from benchmarks.synthetic import generate_curriculum, load_vocabulary
+from src.core.app_manager import AppManager
+from src.core.profiles import LearnerProfile
+from src.core.storage import (JournalProgressStorage, JsonProgressStorage, ProgressStorage,
+                              SqliteProgressStorage, WriteBehindStorage)
+
+SUITE = 'persistence'
+DEFAULT_BASELINE = Path(__file__).resolve().parent / 'baselines' / f'{SUITE}.json'
+
+# 后端名称 -> (在工作目录中创建存储的函数, 保存间隔（分钟）)
+# 保存间隔为0时每次修改立即写入；write-behind 即应用默认配置（SQLite + 5分钟延迟保存）
+BACKENDS: Dict[str, Tuple[Callable[[Path], ProgressStorage], float]] = {
+    'json': (lambda directory: JsonProgressStorage(str(directory / 'progress.json')), 0),
+    'sqlite': (lambda directory: SqliteProgressStorage(str(directory / 'progress.db'), legacy_json_path=None), 0),
+    'journal': (lambda directory: JournalProgressStorage(str(directory / 'journal')), 0),
+    'write-behind': (lambda directory: SqliteProgressStorage(str(directory / 'progress.db'), legacy_json_path=None), 5),
+    'json+write-behind': (lambda directory: JsonProgressStorage(str(directory / 'progress.json')), 5),
+    'journal+write-behind': (lambda directory: JournalProgressStorage(str(directory / 'journal')), 5),
+}
+DEFAULT_BACKENDS = ['json', 'sqlite', 'journal', 'write-behind']
+
+
+class BenchmarkSettings:
+    """AppManager 使用的最小设置对象"""
+
+    def __init__(self, values: Dict):
+        self.values = values
+
+    def get(self, key: str, default=None):
+        return self.values.get(key, default)
+
+
+def markdown_note(rng: random.Random, vocabulary: List[str], size: int) -> str:
+    """生成约 size 字节（UTF-8）的Markdown笔记"""
+    def phrase(count: int) -> str:
+        return "".join(rng.choice(vocabulary) for _ in range(count))
+
+    blocks = []
+    length = 0
+    while length < size:
+        kind = rng.randrange(4)
+        if kind == 0:
+            block = f"## {phrase(2)}"
+        elif kind == 1:
+            block = "\n".join(f"- {phrase(3)}" for _ in range(rng.randint(2, 6)))
+        elif kind == 2:
+            block = "```python\n" + "\n".join(
+                f"{rng.choice(vocabulary).lower()}_{line} = {line} * 2  # {phrase(1)}"
+                for line in range(rng.randint(3, 10))
+            ) + "\n```"
+        else:
+            block = "，".join(phrase(2) for _ in range(rng.randint(5, 15))) + "。"
+        blocks.append(block)
+        length += len(block.encode('utf-8')) + 2
+    return "\n\n".join(blocks)
+
+
+class Workload:
+    """一次模拟学习记录（所有后端使用同一份）"""
+
+    def __init__(self, days: int, completions: int, notes: int, note_edits: int, note_bytes: int,
+                 next_days: int, round_trips: int, seed: int):
+        rng = random.Random(seed)
+        vocabulary = load_vocabulary()
+
+        self.completion_days = rng.sample(range(1, days + 1), min(completions, days))
+        self.uncomplete_days = rng.sample(self.completion_days, len(self.completion_days) // 10)
+        note_days = rng.sample(range(1, days + 1), min(notes, days))
+        # 每篇笔记编辑多次（模拟边写边自动保存），每次在上一版基础上追加
+        self.note_edits: List[Tuple[int, str]] = []
+        for day in note_days:
+            note = ""
+            for _ in range(note_edits):
+                note += markdown_note(rng, vocabulary, note_bytes // note_edits) + "\n\n"
+                self.note_edits.append((day, note))
+        self.next_days = next_days
+        self.round_trips = round_trips
+
+
+def measure(func: Callable, arguments: Iterable) -> Dict:
+    """统计耗时分位数、写入字节数和fsync次数"""
+    with IOCounter() as counter:
+        result = time_calls(func, arguments)
+    result['bytes_written'] = counter.bytes_written
+    result['fsyncs'] = counter.fsyncs
+    return result
+
+
+def directory_size(directory: Path) -> int:
+    """目录中所有文件的总大小"""
+    return sum(path.stat().st_size for path in directory.rglob('*') if path.is_file())
+
+
+def run_backend(name: str, pack_path: Path, workload: Workload, reloads: int) -> Dict[str, Dict]:
+    """在一个存储后端上运行整套模拟，结果名称为 "操作@后端" """
+    create_storage, save_interval = BACKENDS[name]
+    settings = BenchmarkSettings({
+        'data.content_pack': str(pack_path),
+        'data.content_cache_dir': str(pack_path.parent / 'cache'),  # 编译缓存写入临时目录，不写入仓库
+        'behavior.auto_save': True,
+        'behavior.save_interval': save_interval
+    })
+    results = {}
+
+    def record(operation: str, result: Dict):
+        results[f"{operation}@{name}"] = result
+
+    work_dir = Path(tempfile.mkdtemp(prefix=f"bench-{name.replace('+', '-')}-"))
+    storage_dir = work_dir / 'storage'
+    try:
+        manager = AppManager(storage=create_storage(storage_dir), settings=settings)
+
+        record('mark_task_completed', measure(manager.mark_task_completed, workload.completion_days))
+        record('mark_task_incomplete', measure(manager.mark_task_incomplete, workload.uncomplete_days))
+        record('set_task_note', measure(lambda edit: manager.set_task_note(*edit), workload.note_edits))
+        record('next_day', measure(lambda _: manager.next_day(), range(workload.next_days)))
+
+        # 导出和导入交替进行，各自累计耗时和写入量
+        export_path = work_dir / 'export.json'
+        round_trip = (('export_progress', manager.export_progress), ('import_progress', manager.import_progress))
+        samples = {operation: [] for operation, _ in round_trip}
+        written = {operation: [0, 0] for operation, _ in round_trip}
+        for _ in range(workload.round_trips):
+            for operation, func in round_trip:
+                with IOCounter() as counter:
+                    start = time.perf_counter()
+                    func(str(export_path))
+                    samples[operation].append((time.perf_counter() - start) * 1e6)
+                written[operation][0] += counter.bytes_written or 0
+                written[operation][1] += counter.fsyncs
+        for operation, _ in round_trip:
+            if samples[operation]:
+                record(operation, dict(summarize(samples[operation]),
+                                       bytes_written=written[operation][0], fsyncs=written[operation][1]))
+
+        record('flush', measure(lambda _: manager.save_all_data(), range(1)))
+        manager.profile.release()
+
+        # 重新加载：与 AppManager 启动时相同的路径（不含笔记），再首次访问笔记
+        reload_samples = []
+        with IOCounter() as counter:
+            for _ in range(reloads):
+                storage = WriteBehindStorage(create_storage(storage_dir), interval=save_interval * 60)
+                start = time.perf_counter()
+                profile = LearnerProfile('default', storage, manager.learning_data)
+                profile.load(include_notes=False)
+                profile.notes
+                reload_samples.append((time.perf_counter() - start) * 1e6)
+                profile.release()
+        record('reload', dict(summarize(reload_samples), bytes_written=counter.bytes_written, fsyncs=counter.fsyncs))
+
+        record('disk_usage', {'bytes': directory_size(storage_dir)})
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="进度持久化基准测试")
+    parser.add_argument("--backends", nargs='+', choices=sorted(BACKENDS), default=DEFAULT_BACKENDS,
+                        help="要比较的存储后端")
+    parser.add_argument("--days", type=int, default=5000, help="合成学习路线的天数")
+    parser.add_argument("--completions", type=int, default=3000, help="完成的任务数（其中十分之一随后取消）")
+    parser.add_argument("--notes", type=int, default=200, help="写笔记的天数")
+    parser.add_argument("--note-edits", type=int, default=3, help="每篇笔记的编辑次数")
+    parser.add_argument("--note-kb", type=int, default=16, help="每篇笔记的最终大小（KB）")
+    parser.add_argument("--next-days", type=int, default=500, help="进入下一天的次数")
+    parser.add_argument("--round-trips", type=int, default=5, help="导出/导入往返次数")
+    parser.add_argument("--reloads", type=int, default=5, help="重新加载进度的次数")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    parser.add_argument("-o", "--output", help="结果JSON输出路径")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="基线JSON路径")
+    parser.add_argument("--metric", default='p50_us', help="与基线比较的指标")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="允许相对基线变慢的倍数")
+    parser.add_argument("--update-baseline", action='store_true', help="将本次结果保存为新的基线")
+    args = parser.parse_args(argv)
+
+    workload = Workload(args.days, args.completions, args.notes, max(1, args.note_edits), args.note_kb * 1024,
+                        args.next_days, args.round_trips, args.seed)
+    parameters = {key: value for key, value in vars(args).items()
+                  if key not in ('output', 'baseline', 'metric', 'tolerance', 'update_baseline')}
+
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pack_path = Path(temp_dir) / f"synthetic-{args.days}.json"
+        with open(pack_path, 'w', encoding='utf-8') as f:
+            json.dump(generate_curriculum(days=args.days, seed=args.seed), f, ensure_ascii=False)
+
+        # 日志会写入日志文件，计入写入字节数，运行期间关闭
+        logging.disable(logging.CRITICAL)
+        try:
+            for name in args.backends:
+                print(f"运行 {name} ...", flush=True)
+                results.update(run_backend(name, pack_path, workload, args.reloads))
+        finally:
+            logging.disable(logging.NOTSET)
+
+    print()
+    print_table(results, ('runs', 'p50_us', 'p95_us', 'p99_us', 'bytes_written', 'fsyncs', 'bytes'))
+    if args.output:
+        write_results(args.output, SUITE, results, parameters)
+
+    if args.update_baseline:
+        write_results(args.baseline, SUITE, results, parameters)
+        print(f"\n已更新基线: {args.baseline}")
+        return 0
+
+    regressions = compare_with_baseline(results, args.baseline, args.metric, args.tolerance)
+    if regressions is None:
+        print(f"\n基线不存在，跳过比较: {args.baseline}")
+        return 0
+    if regressions:
+        print(f"\n{len(regressions)} 项超出基线 {args.tolerance:.2f} 倍: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
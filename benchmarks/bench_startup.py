@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+冷启动基准测试
+在新进程中多次以 --profile-startup 启动应用（启动到首帧绘制完成后退出）
+或命令行工具（执行一条命令后退出），取各阶段和各包导入耗时的中位数，
+与启动时间预算比较，超出时以非零状态退出。
+
+用法:
+    python -m benchmarks.bench_startup --runs 5
+    python -m benchmarks.bench_startup --target cli
+    python -m benchmarks.bench_startup --budget benchmarks/baselines/startup_budget.json -o startup.json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.utils.startup_profiler import check_budget, load_budget, print_report
+
+BASELINES_DIR = Path(__file__).resolve().parent / 'baselines'
+
+# 启动目标 -> (命令行, 默认启动预算)；命令行中的 {work_dir} 替换为临时目录
+TARGETS = {
+    'app': ([str(project_root / 'main.py')], BASELINES_DIR / 'startup_budget.json'),
+    # 使用临时进度文件，不读写 data/progress.db 中的真实学习进度
+    'cli': (['-m', 'src', '-p', '{work_dir}/progress.db', 'status'], BASELINES_DIR / 'cli_startup_budget.json'),
+}
+
+
+def run_once(command: List[str], report_path: Path) -> Dict:
+    """在新进程中启动一次并读取启动报告"""
+    command = [argument.format(work_dir=report_path.parent) for argument in command]
+    completed = subprocess.run(
+        [sys.executable] + command + ['--profile-startup', '--startup-report', str(report_path)],
+        cwd=str(project_root), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    if not report_path.exists():
+        raise RuntimeError(f"启动失败（退出码 {completed.returncode}）:\n{completed.stderr[-2000:]}")
+    with open(report_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def median_report(reports: List[Dict]) -> Dict:
+    """多次启动报告的逐项中位数（模块导入明细取总耗时为中位数的那一次）"""
+    def median_of(section: str) -> Dict[str, float]:
+        names = {}
+        for report in reports:
+            for name in report[section]:
+                names.setdefault(name, None)
+        return {
+            name: round(statistics.median(report[section].get(name, 0.0) for report in reports), 3)
+            for name in names
+        }
+
+    totals = sorted(reports, key=lambda report: report['total_ms'])
+    return {
+        'total_ms': round(statistics.median(report['total_ms'] for report in reports), 3),
+        'phases': median_of('phases'),
+        'packages': dict(sorted(median_of('packages').items(), key=lambda item: -item[1])),
+        'imports': totals[len(totals) // 2]['imports']
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="冷启动基准测试")
+    parser.add_argument("--runs", type=int, default=5, help="启动次数")
+    parser.add_argument("--target", choices=sorted(TARGETS), default='app', help="启动目标：应用界面或命令行工具")
+    parser.add_argument("--budget", help="启动时间预算JSON路径，默认按启动目标选择")
+    parser.add_argument("-o", "--output", help="中位数报告的JSON输出路径")
+    args = parser.parse_args(argv)
+    command, default_budget = TARGETS[args.target]
+    budget_path = Path(args.budget) if args.budget else default_budget
+
+    reports = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for run in range(args.runs):
+            reports.append(run_once(command, Path(temp_dir) / f"startup-{run}.json"))
+            print(f"第{run + 1}次启动: {reports[-1]['total_ms']:.1f}ms", flush=True)
+
+    report = median_report(reports)
+    print()
+    print_report(report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if not budget_path.exists():
+        print(f"\n启动预算不存在，跳过检查: {budget_path}")
+        return 0
+    violations = check_budget(report, load_budget(budget_path))
+    for violation in violations:
+        print(f"超出启动预算: {violation}")
+    return 1 if violations else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
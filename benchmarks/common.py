@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+基准测试公共工具
+计时统计、JSON结果输出，以及与已保存基线的比较
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """已排序数据的分位数（线性插值）"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(samples_us: List[float]) -> Dict[str, float]:
+    """汇总单次耗时样本（微秒）"""
+    samples_us = sorted(samples_us)
+    return {
+        'runs': len(samples_us),
+        'mean_us': round(sum(samples_us) / len(samples_us), 3) if samples_us else 0.0,
+        'p50_us': round(percentile(samples_us, 0.5), 3),
+        'p95_us': round(percentile(samples_us, 0.95), 3),
+        'p99_us': round(percentile(samples_us, 0.99), 3),
+        'max_us': round(samples_us[-1], 3) if samples_us else 0.0
+    }
+
+
+def time_calls(func: Callable, arguments: Iterable) -> Dict[str, float]:
+    """逐次调用 func(argument) 并统计耗时"""
+    samples = []
+    for argument in arguments:
+        start = time.perf_counter()
+        func(argument)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return summarize(samples)
+
+
+def time_once(func: Callable[[], object], repeat: int = 1) -> Dict[str, float]:
+    """重复调用无参函数并统计耗时（用于构建等较慢的操作）"""
+    return time_calls(lambda _: func(), range(repeat))
+
+
+class IOCounter:
+    """统计一段代码写入的字节数和fsync次数
+
+    写入字节数取自 /proc/self/io 的 wchar（进程通过write类系统调用写出的字节，
+    包括后台线程；非Linux平台为None）。fsync次数只统计Python层的
+    os.fsync/os.fdatasync调用，SQLite等C库内部的同步不在其中。
+    """
+
+    _PROC_IO = Path('/proc/self/io')
+
+    def __init__(self):
+        self.bytes_written: Optional[int] = None
+        self.fsyncs = 0
+        self._start_bytes: Optional[int] = None
+        self._originals = {}
+
+    @classmethod
+    def _read_wchar(cls) -> Optional[int]:
+        try:
+            with open(cls._PROC_IO, 'r') as f:
+                for line in f:
+                    if line.startswith('wchar:'):
+                        return int(line.split()[1])
+        except OSError:
+            pass
+        return None
+
+    def _wrap(self, name: str):
+        original = getattr(os, name, None)
+        if original is None:
+            return
+        self._originals[name] = original
+
+        def counted(fd):
+            self.fsyncs += 1
+            return original(fd)
+
+        setattr(os, name, counted)
+
+    def __enter__(self) -> 'IOCounter':
+        self._wrap('fsync')
+        self._wrap('fdatasync')
+        self._start_bytes = self._read_wchar()
+        return self
+
+    def __exit__(self, *exc_info):
+        end_bytes = self._read_wchar()
+        if self._start_bytes is not None and end_bytes is not None:
+            self.bytes_written = end_bytes - self._start_bytes
+        for name, original in self._originals.items():
+            setattr(os, name, original)
+        self._originals.clear()
+
+
+def environment() -> Dict[str, str]:
+    """运行环境信息，随结果一起保存以便判断基线是否可比"""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'timestamp': datetime.now().isoformat(timespec='seconds')
+    }
+
+
+def write_results(path: Union[str, Path], suite: str, results: Dict[str, Dict], parameters: Dict):
+    """以JSON格式写入结果"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'suite': suite,
+            'environment': environment(),
+            'parameters': parameters,
+            'results': results
+        }, f, ensure_ascii=False, indent=2)
+
+
+def compare_with_baseline(
+    results: Dict[str, Dict],
+    baseline_path: Union[str, Path],
+    metric: str = 'p50_us',
+    tolerance: float = 1.5
+) -> Optional[List[str]]:
+    """与基线比较，返回超出容忍倍数的结果名称；基线不存在时返回None
+
+    只比较基线和本次结果中都有的项目，并打印每项的倍数。
+    """
+    baseline_path = Path(baseline_path)
+    if not baseline_path.exists():
+        return None
+
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+
+    regressions = []
+    print(f"\n与基线比较（{metric}，容忍 {tolerance:.2f} 倍）: {baseline_path}")
+    for name, current in results.items():
+        reference = baseline.get(name, {}).get(metric)
+        value = current.get(metric)
+        if not reference or value is None:
+            continue
+        ratio = value / reference
+        flag = "  <-- 退化" if ratio > tolerance else ""
+        print(f"  {name:<40} {reference:>12.1f} -> {value:>12.1f}  x{ratio:.2f}{flag}")
+        if ratio > tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def print_table(results: Dict[str, Dict], columns: Sequence[str] = ('runs', 'mean_us', 'p50_us', 'p95_us')):
+    """以表格打印结果"""
+    print(f"{'benchmark':<40}" + "".join(f"{column:>14}" for column in columns))
+    for name, result in results.items():
+        print(f"{name:<40}" + "".join(f"{result.get(column, ''):>14}" for column in columns))
+    sys.stdout.flush()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+合成学习路线生成器
+按指定的阶段、周、天数和任务规模生成与内置内容包结构相同的学习路线，
+文本取自内置学习路线的词汇，使分词和搜索的开销接近真实数据。
+
+用法:
+    python -m benchmarks.synthetic --days 100000 -o data/cache/synthetic-100k.json
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.data.content_pack import DEFAULT_CONTENT_PACK, read_content_pack
+
+_DIFFICULTIES = ('入门', '基础', '中级', '进阶', '高级')
+_ESTIMATED_TIMES = ('30分钟', '1小时', '1-2小时', '2-3小时', '3-4小时')
+
+
+def load_vocabulary() -> List[str]:
+    """从内置学习路线中提取词汇（中文短语和英文单词）"""
+    words = set()
+    for stage in read_content_pack(DEFAULT_CONTENT_PACK)["stages"]:
+        for week_detail in stage["weeks_detail"]:
+            for day_data in week_detail["days"]:
+                text = " ".join([day_data["title"], day_data["content"]] + day_data.get("tasks", []))
+                words.update(re.findall(r'[一-鿿]{2,4}|[A-Za-z][A-Za-z0-9]+', text))
+    return sorted(words)
+
+
+def generate_curriculum(
+    days: int = 1000,
+    stages: int = 6,
+    days_per_week: int = 7,
+    tasks_per_day: int = 4,
+    code_examples_per_day: int = 1,
+    code_lines: int = 10,
+    seed: int = 0
+) -> Dict:
+    """生成合成学习路线
+
+    Args:
+        days: 总天数
+        stages: 阶段数，周按顺序平均分配到各阶段
+        days_per_week: 每周天数
+        tasks_per_day: 每天的任务条数
+        code_examples_per_day: 每天的代码示例数
+        code_lines: 每个代码示例的行数
+        seed: 随机种子，相同参数生成相同的学习路线
+
+    Returns:
+        学习路线数据（与内容包格式相同）
+    """
+    rng = random.Random(seed)
+    vocabulary = load_vocabulary()
+
+    def phrase(count: int) -> str:
+        return "".join(rng.choice(vocabulary) for _ in range(count))
+
+    week_count = max(1, -(-days // days_per_week))
+    stages = max(1, min(stages, week_count))
+    weeks_per_stage = -(-week_count // stages)
+
+    learning_path = {
+        "title": f"合成学习路线（{days}天）",
+        "description": "基准测试用的合成数据",
+        "total_weeks": week_count,
+        "total_days": days,
+        "stages": []
+    }
+
+    day = 1
+    week = 1
+    for stage_id in range(1, stages + 1):
+        stage = {
+            "id": stage_id,
+            "name": f"阶段{stage_id} {phrase(2)}",
+            "weeks": f"第{week}-{min(week + weeks_per_stage - 1, week_count)}周",
+            "description": phrase(4),
+            "color": "#2196F3",
+            "weeks_detail": []
+        }
+        for _ in range(weeks_per_stage):
+            if day > days:
+                break
+            week_detail = {"week": week, "title": phrase(2), "days": []}
+            for _ in range(days_per_week):
+                if day > days:
+                    break
+                week_detail["days"].append({
+                    "day": day,
+                    "title": phrase(2),
+                    "content": "、".join(phrase(2) for _ in range(4)),
+                    "tasks": [phrase(3) for _ in range(tasks_per_day)],
+                    "estimated_time": rng.choice(_ESTIMATED_TIMES),
+                    "difficulty": _DIFFICULTIES[min(len(_DIFFICULTIES) - 1, (stage_id - 1) * len(_DIFFICULTIES) // stages)],
+                    "code_examples": [
+                        {
+                            "title": phrase(2),
+                            "code": "\n".join(f"# {phrase(1)}\nx_{line} = {line} * 2" for line in range(code_lines))
+                        }
+                        for _ in range(code_examples_per_day)
+                    ]
+                })
+                day += 1
+            stage["weeks_detail"].append(week_detail)
+            week += 1
+        learning_path["stages"].append(stage)
+
+    return learning_path
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="生成合成学习路线内容包")
+    parser.add_argument("--days", type=int, default=1000, help="总天数")
+    parser.add_argument("--stages", type=int, default=6, help="阶段数")
+    parser.add_argument("--days-per-week", type=int, default=7, help="每周天数")
+    parser.add_argument("--tasks", type=int, default=4, help="每天的任务条数")
+    parser.add_argument("--code-examples", type=int, default=1, help="每天的代码示例数")
+    parser.add_argument("--code-lines", type=int, default=10, help="每个代码示例的行数")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    parser.add_argument("-o", "--output", required=True, help="输出的内容包路径（.json）")
+    args = parser.parse_args(argv)
+
+    learning_path = generate_curriculum(
+        days=args.days, stages=args.stages, days_per_week=args.days_per_week,
+        tasks_per_day=args.tasks, code_examples_per_day=args.code_examples,
+        code_lines=args.code_lines, seed=args.seed
+    )
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(learning_path, f, ensure_ascii=False)
+    print(f"已生成 {args.days} 天的学习路线: {output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -15,6 +15,10 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+# 启动性能分析（--profile-startup）：需在导入Kivy之前启用，并在Kivy解析命令行参数之前移除自己的参数
+from src.utils.startup_profiler import StartupProfiler
+profiler = StartupProfiler.from_argv(sys.argv)
+
 from kivy.app import App
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.screenmanager import ScreenManager, Screen
@@ -32,10 +36,12 @@ from kivy.core.window import Window
 from kivy.core.text import LabelBase
 from kivy.resources import resource_add_path
 import os
+profiler.mark('import_kivy')
 
 from src.core.app_manager import AppManager
 from src.utils.logger import setup_logger
 from src.config.settings import AppSettings
+profiler.mark('import_app')
 
 class HomeScreen(Screen):
     """主页面"""
@@ -385,13 +391,18 @@ class MathModelingApp(App):
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        profiler.mark('app_init')
         
         # 配置中文字体支持
         self.setup_chinese_font()
+        profiler.mark('fonts')
         
         self.logger = setup_logger('MathModelingApp')
+        profiler.mark('logger')
         self.settings = AppSettings()
-        self.app_manager = AppManager()
+        profiler.mark('settings')
+        self.app_manager = AppManager(settings=self.settings)
+        profiler.mark('app_manager')
         
         self.logger.info("数学建模学习应用启动")
     
@@ -442,6 +453,7 @@ class MathModelingApp(App):
     
     def build(self):
         """构建应用界面"""
+        profiler.mark('app_run')
         try:
             # 设置窗口
             Window.clearcolor = (0.05, 0.05, 0.05, 1)
@@ -498,6 +510,27 @@ class MathModelingApp(App):
             ))
             return error_layout
     
+    def on_start(self):
+        """界面构建完成"""
+        profiler.mark('build')
+        if profiler.enabled:
+            Window.bind(on_flip=self._on_first_frame)
+    
+    def _on_first_frame(self, window):
+        """首帧绘制完成后结束启动分析，分析模式下随即退出"""
+        window.unbind(on_flip=self._on_first_frame)
+        profiler.mark('first_frame')
+        profiler.finish()
+        self.stop()
+    
+    def on_pause(self):
+        """应用切换到后台时立即保存（Android可能在后台直接结束应用，不会调用on_stop）"""
+        try:
+            self.app_manager.save_all_data()
+        except Exception as e:
+            self.logger.error(f"切换到后台时保存数据失败: {e}")
+        return True
+    
     def on_stop(self):
         """应用停止时的清理"""
         try:
@@ -516,6 +549,10 @@ def main():
     # 创建并运行应用
     app = MathModelingApp()
     app.run()
+    
+    # 启动分析模式下超出启动时间预算时以非零状态退出
+    if profiler.exit_code:
+        sys.exit(profiler.exit_code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
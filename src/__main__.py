@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+python -m src：无界面的命令行入口
+"""
+
+import sys
+
+# 支持与 main.py 相同的启动分析参数（--profile-startup 等），未使用时不导入分析器
+if any(argument.startswith(('--profile-startup', '--startup-report', '--startup-budget'))
+       for argument in sys.argv[1:]):
+    from .utils.startup_profiler import StartupProfiler
+    profiler = StartupProfiler.from_argv(sys.argv)
+else:
+    profiler = None
+
+from .cli import main
+
+if __name__ == '__main__':
+    if profiler is None:
+        sys.exit(main(sys.argv[1:]))
+
+    profiler.mark('import_cli')
+    exit_code = main(sys.argv[1:])
+    profiler.mark('command')
+    sys.exit(profiler.finish() or exit_code)
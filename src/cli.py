@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+命令行入口（无界面）
+不导入任何GUI工具包，核心模块在执行命令时才导入，可在脚本中批量处理多个进度文件。
+
+用法:
+    python -m src status
+    python -m src complete 1-5 8
+    python -m src -p alice.db -p bob.json --json stats
+    python -m src --profiles-dir data/profiles export backup/{profile}.json
+    python -m src search 回归 --limit 5
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+# 批量导出/导入时文件路径中替换为档案名称的占位符
+PROFILE_PLACEHOLDER = '{profile}'
+
+
+def parse_days(values: List[str]) -> List[int]:
+    """解析天数参数，支持 "3"、"1-10" 和 "2,4" 形式"""
+    days = []
+    for value in values:
+        for part in value.split(','):
+            if not part:
+                continue
+            start, _, end = part.partition('-')
+            if end:
+                days.extend(range(int(start), int(end) + 1))
+            else:
+                days.append(int(start))
+    return days
+
+
+def open_storage(path: Path):
+    """按路径选择进度存储后端：.json 为JSON文件，.db/.sqlite 为SQLite，其他为日志存储目录"""
+    from .core.storage import JournalProgressStorage, JsonProgressStorage, SqliteProgressStorage
+
+    if path.suffix == '.json':
+        return JsonProgressStorage(str(path))
+    if path.suffix in ('.db', '.sqlite'):
+        return SqliteProgressStorage(str(path), legacy_json_path=None)
+    return JournalProgressStorage(str(path))
+
+
+def load_learning_data(args, settings):
+    """加载学习路线（命令行参数优先于设置中的内容包），加载失败时使用内置学习路线"""
+    from .data.learning_data import LearningData
+    from .utils.logger import get_logger
+
+    content_pack = args.content_pack or settings.get('data.content_pack', '')
+    memory_mapped = settings.get('data.memory_mapped_curriculum', False)
+    cache_dir = settings.get('data.content_cache_dir', 'data/cache')
+    try:
+        return LearningData.from_content_pack(content_pack or None, cache_dir, memory_mapped=memory_mapped)
+    except Exception as e:
+        get_logger(__name__).error(f"加载内容包失败，使用内置学习路线: {e}")
+        return LearningData()
+
+
+def iter_managers(args, settings, learning_data) -> Iterator[Tuple[str, object]]:
+    """依次打开要处理的每个学习进度，返回 (档案名称, AppManager)
+
+    处理完一个进度后立即写入并释放其存储，所有进度共享同一份学习路线数据。
+    """
+    from .core.app_manager import AppManager
+
+    if args.profiles_dir:
+        manager = None
+        try:
+            names = args.profile
+            if not names:
+                from .core.profiles import ProfileManager
+                names = ProfileManager(learning_data, args.profiles_dir).list_profiles()
+            for name in names:
+                if manager is None:
+                    manager = AppManager(settings=settings, profiles_dir=args.profiles_dir, profile=name,
+                                         learning_data=learning_data)
+                elif not manager.switch_profile(name):
+                    continue
+                yield name, manager
+        finally:
+            if manager is not None:
+                manager.profiles.close()
+    elif args.progress:
+        for path in args.progress:
+            manager = AppManager(storage=open_storage(Path(path)), settings=settings, learning_data=learning_data)
+            try:
+                yield path, manager
+            finally:
+                manager.profile.release()
+    else:
+        # 与应用相同的默认进度存储
+        manager = AppManager(settings=settings, learning_data=learning_data)
+        try:
+            yield manager.profile.name, manager
+        finally:
+            manager.profile.release()
+
+
+def task_summary(task) -> Dict:
+    """任务的简要信息"""
+    return {
+        'day': task.day,
+        'title': task.title,
+        'difficulty': task.difficulty,
+        'estimated_time': task.estimated_time
+    }
+
+
+def command_status(manager, args) -> Dict:
+    """当前天数、进度和当前任务"""
+    stats = manager.get_learning_stats()
+    task = manager.get_current_task()
+    return {
+        'current_day': stats.get('current_day'),
+        'current_stage': stats.get('current_stage'),
+        'current_week': stats.get('current_week'),
+        'completed_days': stats.get('completed_days'),
+        'total_days': stats.get('total_days'),
+        'completion_rate': round(stats.get('completion_rate', 0), 2),
+        'current_task': task_summary(task) if task else None,
+        'current_task_completed': manager.is_task_completed(stats.get('current_day', 1))
+    }
+
+
+def command_complete(manager, args) -> Dict:
+    """标记天数为已完成（--undo 为未完成），未指定天数时完成当前任务"""
+    days = parse_days(args.days) if args.days else [manager.progress['current_day']]
+    mark = manager.mark_task_incomplete if args.undo else manager.mark_task_completed
+    changed = [day for day in days if mark(day)]
+    changed_days = set(changed)
+    return {
+        'changed': changed,
+        'unchanged': [day for day in days if day not in changed_days],
+        'completed_days': len(manager.completed)
+    }
+
+
+def _profile_path(template: str, profile: str, batch: bool) -> str:
+    if PROFILE_PLACEHOLDER in template:
+        return template.replace(PROFILE_PLACEHOLDER, Path(profile).stem)
+    if batch:
+        raise ValueError(f"处理多个进度时文件路径需包含 {PROFILE_PLACEHOLDER}")
+    return template
+
+
+def command_export(manager, args) -> Dict:
+    """导出学习进度"""
+    path = _profile_path(args.file, args.profile_name, args.batch)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    return {'file': path, 'ok': manager.export_progress(path)}
+
+
+def command_import(manager, args) -> Dict:
+    """导入学习进度"""
+    path = _profile_path(args.file, args.profile_name, args.batch)
+    return {'file': path, 'ok': manager.import_progress(path)}
+
+
+def command_stats(manager, args) -> Dict:
+    """学习统计、已完成任务分析和剩余时间估算"""
+    stats = dict(manager.get_learning_stats())
+    stats['completion_rate'] = round(stats.get('completion_rate', 0), 2)
+    analytics = manager.get_task_analytics()
+    return {
+        'stats': stats,
+        'analytics': {
+            'average_difficulty': analytics['average_difficulty'],
+            'difficulty': analytics['difficulty'],
+            'time': analytics['time'],
+            'total_minutes': analytics['total_minutes']
+        },
+        'projection': manager.get_time_projection()
+    }
+
+
+PROFILE_COMMANDS: Dict[str, Callable] = {
+    'status': command_status,
+    'complete': command_complete,
+    'export': command_export,
+    'import': command_import,
+    'stats': command_stats,
+}
+
+
+def print_result(result, as_json: bool, indent: str = ''):
+    """输出一条结果：JSON模式为一行JSON，否则为缩进的键值"""
+    if as_json:
+        print(json.dumps(result, ensure_ascii=False))
+        return
+
+    for key, value in result.items():
+        if isinstance(value, dict):
+            print(f"{indent}{key}:")
+            print_result(value, False, indent + '  ')
+        else:
+            print(f"{indent}{key}: {value}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m src', description="数学建模学习应用命令行工具（无界面）")
+    parser.add_argument('-p', '--progress', action='append', metavar='PATH',
+                        help="进度文件（.json/.db/日志目录），可重复指定以批量处理")
+    parser.add_argument('--profiles-dir', help="学习者档案目录（多学习者模式）")
+    parser.add_argument('--profile', action='append', help="要处理的档案名称，可重复指定，默认处理全部档案")
+    parser.add_argument('--content-pack', help="学习路线内容包路径，默认使用设置中的内容包")
+    parser.add_argument('--json', action='store_true', help="以JSON输出（每个进度一行）")
+    parser.add_argument('-v', '--verbose', action='store_true', help="输出日志信息")
+
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('status', help="显示当前天数、进度和当前任务")
+    complete = commands.add_parser('complete', help="标记任务完成")
+    complete.add_argument('days', nargs='*', help="天数，如 3、1-10、2,4；默认为当前天")
+    complete.add_argument('--undo', action='store_true', help="标记为未完成")
+    search = commands.add_parser('search', help="搜索任务")
+    search.add_argument('keyword', help="关键词")
+    search.add_argument('--limit', type=int, default=20, help="最多显示的结果数")
+    export = commands.add_parser('export', help="导出学习进度")
+    export.add_argument('file', help=f"导出文件路径，批量处理时需包含 {PROFILE_PLACEHOLDER}")
+    import_ = commands.add_parser('import', help="导入学习进度")
+    import_.add_argument('file', help=f"导入文件路径，批量处理时需包含 {PROFILE_PLACEHOLDER}")
+    commands.add_parser('stats', help="计算学习统计")
+    return parser
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.profile and not args.profiles_dir:
+        parser.error("--profile 需要与 --profiles-dir 一起使用")
+
+    import logging
+    from .utils.logger import set_global_log_level
+    set_global_log_level(logging.INFO if args.verbose else logging.WARNING)
+
+    from .config.settings import AppSettings
+    settings = AppSettings()
+    learning_data = load_learning_data(args, settings)
+
+    if args.command == 'search':
+        tasks = learning_data.search_tasks(args.keyword, args.limit)
+        if args.json:
+            print(json.dumps([task_summary(task) for task in tasks], ensure_ascii=False))
+        else:
+            for task in tasks:
+                print(f"第{task.day}天  {task.title}  [{task.difficulty} / {task.estimated_time}]")
+        return 0
+
+    command = PROFILE_COMMANDS[args.command]
+    if args.profiles_dir:
+        args.batch = not args.profile or len(args.profile) > 1
+    else:
+        args.batch = len(args.progress or []) > 1
+    exit_code = 0
+    for name, manager in iter_managers(args, settings, learning_data):
+        args.profile_name = name
+        try:
+            result = command(manager, args)
+        except ValueError as e:
+            print(f"错误: {e}", file=sys.stderr)
+            return 2
+        if result.get('ok') is False:
+            exit_code = 1
+
+        if args.json:
+            print_result(dict(profile=name, **result), True)
+        else:
+            if args.batch:
+                print(f"[{name}]")
+            print_result(result, False, '  ' if args.batch else '')
+    return exit_code
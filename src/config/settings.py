@@ -62,6 +62,9 @@ class AppSettings:
             # 数据设置
             "data": {
                 "storage_path": "./data",
+                "content_pack": "",
+                "memory_mapped_curriculum": False,
+                "content_cache_dir": "data/cache",
                 "auto_backup": True,
                 "backup_retention_days": 30,
                 "backup_interval": 24,
@@ -6,38 +6,134 @@
 """
 
 import json
-import sqlite3
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from ..data.learning_data import LearningData
+from ..data.task_record import TaskView
 from ..utils.logger import get_logger
+from .completion import CompletionBitmap
+from .profiles import LearnerProfile, ProfileManager
+from .statistics import LearningStatistics, parse_completion_date
+from .storage import ProgressStorage, SqliteProgressStorage, WriteBehindStorage
+
+if TYPE_CHECKING:
+    from ..data.versioning import ContentDiff
 
 class AppManager:
     """应用核心管理器"""
     
-    def __init__(self):
+    # 任务列表的筛选条件：全部、已完成、未完成、本周完成、本月完成
+    TASK_FILTERS = ('all', 'completed', 'incomplete', 'this_week', 'this_month')
+    
+    # 派生视图缓存最多保留的条目数（按搜索词、筛选条件和日期区分的视图按最近使用淘汰）
+    VIEW_CACHE_SIZE = 64
+    
+    def __init__(
+        self,
+        storage: Optional[ProgressStorage] = None,
+        settings=None,
+        profiles_dir: Optional[str] = None,
+        profile: str = 'default',
+        learning_data: Optional[LearningData] = None
+    ):
         self.logger = get_logger(__name__)
-        self.learning_data = LearningData()
-        
-        # 学习进度数据
-        self.progress = {
-            'current_day': 1,
-            'completed_tasks': [],
-            'task_notes': {},
-            'statistics': {
-                'total_study_time': 0,
-                'completion_rate': 0.0,
-                'current_streak': 0
-            }
-        }
+        # 可传入已加载的学习路线数据，批量处理多个进度文件时共享同一份
+        self.learning_data = learning_data if learning_data is not None else self._load_learning_data(settings)
+        
+        # 延迟保存：修改先合并在内存中，按 behavior.save_interval（分钟）定时写入
+        auto_save = settings.get('behavior.auto_save', True) if settings else True
+        save_interval = settings.get('behavior.save_interval', 5) if settings else 5
         
-        # 初始化数据
-        self._initialize_data()
+        # 派生视图缓存：每次修改递增代数并清空缓存，视图在同一代内最多计算一次
+        self._generation = 0
+        self._view_cache: 'OrderedDict[Tuple, Any]' = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        if profiles_dir:
+            # 多学习者模式：各档案共享同一份学习路线数据
+            self.profiles: Optional[ProfileManager] = ProfileManager(
+                self.learning_data, profiles_dir,
+                save_interval=save_interval * 60, auto_save=auto_save
+            )
+            self.profile = self.profiles.get(profile)
+        else:
+            # 进度存储后端，默认使用SQLite并自动迁移旧的progress.json
+            backend = storage or SqliteProgressStorage()
+            self.profiles = None
+            self.profile = LearnerProfile(
+                profile,
+                WriteBehindStorage(backend, interval=save_interval * 60, auto_save=auto_save),
+                self.learning_data
+            )
+            
+            # 初始化数据
+            self._initialize_data()
         
         self.logger.info("应用管理器初始化完成")
     
+    def _load_learning_data(self, settings) -> LearningData:
+        """加载学习路线内容包（data.content_pack，默认使用内置学习路线）"""
+        content_pack = settings.get('data.content_pack', '') if settings else ''
+        memory_mapped = settings.get('data.memory_mapped_curriculum', False) if settings else False
+        cache_dir = settings.get('data.content_cache_dir', 'data/cache') if settings else 'data/cache'
+        try:
+            return LearningData.from_content_pack(content_pack or None, cache_dir, memory_mapped=memory_mapped)
+        except Exception as e:
+            self.logger.error(f"加载内容包失败，使用内置学习路线: {e}")
+            return LearningData()
+    
+    @property
+    def storage(self) -> ProgressStorage:
+        """当前学习者的进度存储"""
+        return self.profile.storage
+    
+    @property
+    def progress(self) -> Dict:
+        """当前学习者的进度数据"""
+        return self.profile.progress
+    
+    @property
+    def completed(self) -> CompletionBitmap:
+        """当前学习者的已完成任务位图"""
+        return self.profile.completed
+    
+    @property
+    def stats_engine(self) -> LearningStatistics:
+        """当前学习者的统计引擎"""
+        return self.profile.stats_engine
+    
+    def list_profiles(self) -> List[str]:
+        """列出所有学习者档案"""
+        if self.profiles is None:
+            return [self.profile.name]
+        return self.profiles.list_profiles()
+    
+    def switch_profile(self, name: str) -> bool:
+        """切换到指定学习者档案（不存在时创建）"""
+        if self.profiles is None:
+            self.logger.error("未启用多学习者模式，无法切换档案")
+            return False
+        
+        try:
+            profile = self.profiles.get(name)
+            if profile is not self.profile:
+                # 保存并释放当前档案的存储
+                self.profile.release()
+                self.profile = profile
+                self._invalidate()
+            
+            self.logger.info(f"已切换到学习者档案: {name}")
+            return True
+        except Exception as e:
+            self.logger.error(f"切换学习者档案失败: {e}")
+            return False
+    
     def _initialize_data(self):
         """初始化数据"""
         try:
@@ -52,46 +148,69 @@ class AppManager:
     def load_progress(self):
         """加载学习进度"""
         try:
-            # 尝试从文件加载进度数据
-            import os
-            import json
-            progress_file = 'data/progress.json'
-            
-            if os.path.exists(progress_file):
-                with open(progress_file, 'r', encoding='utf-8') as f:
-                    saved_progress = json.load(f)
-                    self.progress.update(saved_progress)
-                    self.logger.info("学习进度加载成功")
+            if self.profile.load(include_notes=False):
+                self.logger.info("学习进度加载成功")
             else:
                 self.logger.info("未找到进度文件，使用默认进度")
+            self._invalidate()
                 
         except Exception as e:
             self.logger.error(f"加载学习进度失败: {e}")
             # 使用默认进度继续
     
+    def _apply_progress(self, progress_data: Dict):
+        """用已保存的进度数据（progress.json格式）覆盖当前进度"""
+        self.profile.apply_progress(progress_data)
+        self._invalidate()
+    
+    def _invalidate(self):
+        """进度发生修改，使所有派生视图失效"""
+        self._generation += 1
+        self._view_cache.clear()
+    
+    def _cached(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """获取当前代的派生视图，没有时计算并缓存（超过 VIEW_CACHE_SIZE 时淘汰最久未用的视图）"""
+        if key in self._view_cache:
+            self._view_cache.move_to_end(key)
+            self.cache_hits += 1
+            return self._view_cache[key]
+        
+        self.cache_misses += 1
+        value = compute()
+        self._view_cache[key] = value
+        if len(self._view_cache) > self.VIEW_CACHE_SIZE:
+            self._view_cache.popitem(last=False)
+        return value
+    
+    def get_cache_stats(self) -> Dict:
+        """获取派生视图缓存的命中统计"""
+        return {
+            'generation': self._generation,
+            'hits': self.cache_hits,
+            'misses': self.cache_misses
+        }
+    
+    def get_progress_data(self) -> Dict:
+        """获取进度数据（progress.json格式）"""
+        return self.profile.to_progress_data()
+    
     def save_progress(self):
         """保存学习进度"""
         try:
-            import os
-            import json
-            
-            # 确保数据目录存在
-            os.makedirs('data', exist_ok=True)
-            
-            # 保存进度到文件
-            progress_file = 'data/progress.json'
-            with open(progress_file, 'w', encoding='utf-8') as f:
-                json.dump(self.progress, f, ensure_ascii=False, indent=2)
+            self.storage.save_all(self.get_progress_data())
             
             self.logger.info(f"学习进度已保存: 第{self.progress['current_day']}天")
         except Exception as e:
             self.logger.error(f"保存学习进度失败: {e}")
             raise
     
-    def get_current_task(self) -> Optional[Dict]:
+    def get_current_task(self) -> Optional[TaskView]:
         """获取当前学习任务"""
         try:
-            return self.learning_data.get_task_by_day(self.progress['current_day'])
+            return self._cached(
+                ('current_task',),
+                lambda: self.learning_data.get_task_by_day(self.progress['current_day'])
+            )
         except Exception as e:
             self.logger.error(f"获取当前任务失败: {e}")
             return None
@@ -104,16 +223,7 @@ class AppManager:
                 return False
             
             # 标记任务为完成
-            task_id = f"day_{self.progress['current_day']}"
-            if task_id not in self.progress['completed_tasks']:
-                self.progress['completed_tasks'].append(task_id)
-                
-                # 更新统计信息
-                self._update_statistics()
-                
-                # 保存进度
-                self.save_progress()
-                
+            if self._set_task_completed(self.progress['current_day'], True):
                 self.logger.info(f"任务完成: {current_task.get('title', '未知任务')}")
                 return True
             
@@ -123,60 +233,110 @@ class AppManager:
             self.logger.error(f"完成任务失败: {e}")
             return False
     
-    def _update_statistics(self):
-        """更新统计信息"""
-        total_tasks = self.learning_data.get_total_days()
-        completed_count = len(self.progress['completed_tasks'])
+    def mark_task_completed(self, day: int) -> bool:
+        """标记指定天的任务为已完成"""
+        try:
+            if not self.learning_data.get_task_by_day(day):
+                return False
+            return self._set_task_completed(day, True)
+        except Exception as e:
+            self.logger.error(f"标记任务完成失败: {e}")
+            return False
+    
+    def mark_task_incomplete(self, day: int) -> bool:
+        """标记指定天的任务为未完成"""
+        try:
+            return self._set_task_completed(day, False)
+        except Exception as e:
+            self.logger.error(f"标记任务未完成失败: {e}")
+            return False
+    
+    def _set_task_completed(self, day: int, completed: bool) -> bool:
+        """修改任务完成状态并保存，状态未变化时返回False"""
+        task_id = f"day_{day}"
+        # 先取得统计引擎，避免其按已修改的位图重建后重复计数
+        stats_engine = self.stats_engine
+        completed_at = None
+        if completed:
+            if not self.completed.add(day):
+                return False
+            completed_at = datetime.now().isoformat(timespec='seconds')
+            self.progress['completion_dates'][task_id] = completed_at
+            stats_engine.on_completed(day, completed_at)
+        else:
+            if not self.completed.discard(day):
+                return False
+            stats_engine.on_uncompleted(day, self.progress['completion_dates'].pop(task_id, None))
+        self._invalidate()
         
-        self.progress['statistics']['completion_rate'] = completed_count / total_tasks if total_tasks > 0 else 0.0
+        # 更新统计信息
+        self._update_statistics()
         
-        # 更新连续学习天数（简化实现）
-        self.progress['statistics']['current_streak'] = completed_count
+        # 保存进度
+        with self.storage.batch():
+            self.storage.set_task_completed(day, completed, completed_at)
+            self.storage.set_statistics(self.progress['statistics'])
+        
+        return True
+    
+    def _update_statistics(self):
+        """更新统计信息"""
+        statistics = self.progress['statistics']
+        statistics['completion_rate'] = self.stats_engine.completion_rate()
+        statistics['current_streak'] = self.stats_engine.current_streak()
+        statistics['total_study_time'] = self.stats_engine.total_study_hours
     
     def get_learning_stats(self) -> Dict:
         """获取学习统计信息"""
         try:
-            total_days = self.learning_data.get_total_days()
-            completed_count = len(self.progress['completed_tasks'])
-            completion_rate = self.progress['statistics']['completion_rate'] * 100
-            
-            # 计算当前阶段和周
-            current_day = self.progress['current_day']
-            current_week = ((current_day - 1) // 7) + 1
-            current_stage = ((current_day - 1) // 35) + 1  # 每5周一个阶段
-            
-            return {
-                'total_days': total_days,
-                'completed_days': completed_count,
-                'completion_rate': completion_rate,
-                'current_day': current_day,
-                'current_stage': current_stage,
-                'current_week': current_week,
-                'current_streak': self.progress['statistics']['current_streak'],
-                'total_study_time': self.progress['statistics']['total_study_time']
-            }
+            # 连续学习天数与日期有关，缓存键包含当天日期
+            return self._cached(('stats', date.today()), self._compute_learning_stats)
         except Exception as e:
             self.logger.error(f"获取学习统计失败: {e}")
             return {}
     
-    def get_task_history(self, limit: int = 10) -> List[Dict]:
+    def _compute_learning_stats(self) -> Dict:
+        """计算学习统计信息"""
+        # 当前阶段和周取自学习路线；超出已有内容时沿用最后一天的阶段和周
+        current_day = self.progress['current_day']
+        stage_day = min(current_day, self.learning_data.get_indexed_days())
+        current_stage = self.learning_data.get_stage_id(stage_day) or 1
+        current_week = self.learning_data.get_week_number(stage_day) or 1
+        
+        return {
+            'total_days': self.learning_data.get_total_days(),
+            'completed_days': self.stats_engine.completed_count,
+            'completion_rate': self.stats_engine.completion_rate() * 100,
+            'current_day': current_day,
+            'current_stage': current_stage,
+            'current_week': current_week,
+            'current_stage_completed': self.stats_engine.get_stage_completed(current_stage),
+            'current_week_completed': self.stats_engine.get_week_completed(current_week),
+            'current_streak': self.stats_engine.current_streak(),
+            'total_study_time': self.stats_engine.total_study_hours
+        }
+    
+    def get_task_history(self, limit: int = 10) -> List[TaskView]:
         """获取任务历史记录"""
         try:
-            # 获取已完成的任务
-            completed_tasks = []
-            for task_id in self.progress['completed_tasks'][-limit:]:
-                day = int(task_id.split('_')[1])
-                task = self.learning_data.get_task_by_day(day)
-                if task:
-                    task['completed'] = True
-                    task['day'] = day
-                    completed_tasks.append(task)
-            return completed_tasks
+            return self._cached(('history', limit), lambda: self._compute_task_history(limit))
         except Exception as e:
             self.logger.error(f"获取任务历史失败: {e}")
             return []
     
-    def search_tasks(self, keyword: str) -> List[Dict]:
+    def _compute_task_history(self, limit: int) -> List[TaskView]:
+        """计算最近完成的任务列表"""
+        # 按完成时间排序，没有完成时间的旧记录按天数排在前面
+        completion_dates = self.progress['completion_dates']
+        recent_days = sorted(
+            self.completed,
+            key=lambda day: (completion_dates.get(f"day_{day}", ""), day)
+        )[-limit:]
+        
+        # 任务记录按引用共享，不做修改
+        return [task for task in map(self.learning_data.get_task_by_day, recent_days) if task]
+    
+    def search_tasks(self, keyword: str) -> List[TaskView]:
         """搜索任务"""
         try:
             return self.learning_data.search_tasks(keyword)
@@ -191,9 +351,9 @@ class AppManager:
             from datetime import datetime
             
             data = {
-                'progress': self.progress,
+                'progress': self.get_progress_data(),
                 'stats': self.get_learning_stats(),
-                'history': self.get_task_history(100),
+                'history': [task.to_dict() for task in self.get_task_history(100)],
                 'export_date': datetime.now().isoformat()
             }
             
@@ -218,7 +378,8 @@ class AppManager:
             # 恢复进度数据
             progress_data = data.get('progress', {})
             if progress_data:
-                self.progress.update(progress_data)
+                self._apply_progress(progress_data)
+                self._update_statistics()
                 self.save_progress()
             
             self.logger.info(f"学习进度已从 {file_path} 导入")
@@ -228,10 +389,237 @@ class AppManager:
             self.logger.error(f"导入学习进度失败: {e}")
             return False
     
+    def update_content_pack(self, file_path: str) -> Optional['ContentDiff']:
+        """切换到新版本的内容包，并将所有学习者的进度迁移到新的天数
+        
+        Returns:
+            新旧版本的差异，更新失败时返回None
+        """
+        from ..data.content_pack import read_content_pack
+        
+        try:
+            diff = self.learning_data.apply_content_update(read_content_pack(file_path))
+        except Exception as e:
+            self.logger.error(f"更新内容包失败: {e}")
+            return None
+        
+        if diff.moved or diff.removed:
+            # 所有学习者的进度一次性迁移，每个档案整体保存一次
+            profiles = self.profiles.load_all() if self.profiles is not None else [self.profile]
+            for profile in profiles:
+                dropped = profile.remap_days(diff)
+                if dropped:
+                    self.logger.warning(f"档案 {profile.name} 中 {dropped} 个已完成的任务在新版本中已删除")
+                if profile is not self.profile:
+                    profile.release()
+        else:
+            # 天数未变化，只需按新内容重算已加载档案的统计（如预计学习时间）
+            profiles = self.profiles.loaded_profiles() if self.profiles is not None else [self.profile]
+            for profile in profiles:
+                profile.refresh_statistics()
+        
+        self._invalidate()
+        self.logger.info(f"内容包已更新: {diff}")
+        return diff
+    
+    def count_completed_between(self, start_day: int, end_day: int) -> int:
+        """统计 [start_day, end_day] 区间内已完成的天数"""
+        return self.completed.count_range(start_day, end_day)
+    
+    def get_all_stage_progress(self) -> List[Dict]:
+        """获取所有阶段的完成进度"""
+        return self._cached(
+            ('stage_progress',),
+            lambda: self.learning_data.get_all_stage_progress(self.completed)
+        )
+    
+    def get_all_week_progress(self) -> Dict[int, Tuple[int, int]]:
+        """获取所有周的完成进度：周序号 -> (已完成天数, 总天数)"""
+        return self._cached(
+            ('week_progress',),
+            lambda: self.learning_data.get_all_week_progress(self.completed)
+        )
+    
+    def get_task_analytics(self) -> Dict:
+        """获取已完成任务的难度和预计时间分析
+        
+        基于学习路线的列式视图和完成掩码做向量化汇总。
+        
+        Returns:
+            {'completed': 已完成任务数, 'average_difficulty': 平均难度名称,
+             'difficulty': 已完成任务难度分布, 'all_difficulty': 全部任务难度分布,
+             'time': 已完成任务预计时间分布, 'total_minutes': 已完成任务预计分钟数}
+        """
+        from ..data.columns import difficulty_label
+        
+        def compute():
+            columns = self.learning_data.columns
+            mask = columns.completion_mask(self.completed)
+            return {
+                'completed': columns.count(mask),
+                'average_difficulty': difficulty_label(columns.average_difficulty(mask)),
+                'difficulty': columns.difficulty_counts(mask),
+                'all_difficulty': columns.difficulty_counts(),
+                'time': columns.time_distribution(mask),
+                'total_minutes': columns.total_minutes(mask)
+            }
+        
+        return self._cached(('task_analytics',), compute)
+    
+    def get_completion_trend(self) -> Tuple[List[date], List[int]]:
+        """获取累计完成数趋势：(有完成记录的日期列表, 截至各日期的累计完成数)"""
+        def compute():
+            dates, cumulative = [], []
+            total = 0
+            for completion_date, count in self.stats_engine.daily_counts():
+                total += count
+                dates.append(completion_date)
+                cumulative.append(total)
+            return dates, cumulative
+        
+        return self._cached(('completion_trend',), compute)
+    
+    def get_weekly_load(self) -> Dict[int, Tuple[int, int]]:
+        """获取各周未完成任务的预计学习分钟数：周序号 -> (下限, 上限)，已全部完成的周不包含在内"""
+        def compute():
+            columns = self.learning_data.columns
+            return columns.week_load(columns.pending_mask(self.completed))
+        
+        return self._cached(('weekly_load',), compute)
+    
+    def get_time_projection(self) -> Dict:
+        """估算剩余学习时间（只计算已有内容的任务）
+        
+        Returns:
+            {'remaining_tasks': 未完成任务数, 'min_minutes' / 'max_minutes': 预计剩余分钟数区间,
+             'peak_week': 剩余负荷最重的周序号, 'peak_week_minutes': 该周预计分钟数上限,
+             'average_week_minutes': 有剩余任务的周的平均预计分钟数上限}
+        """
+        def compute():
+            columns = self.learning_data.columns
+            pending = columns.pending_mask(self.completed)
+            min_minutes, max_minutes = columns.minutes_range(pending)
+            
+            weekly_load = self.get_weekly_load()
+            peak_week = max(weekly_load, key=lambda week: weekly_load[week][1], default=None)
+            return {
+                'remaining_tasks': columns.count(pending),
+                'min_minutes': min_minutes,
+                'max_minutes': max_minutes,
+                'peak_week': peak_week,
+                'peak_week_minutes': weekly_load[peak_week][1] if peak_week is not None else 0,
+                'average_week_minutes': max_minutes // len(weekly_load) if weekly_load else 0
+            }
+        
+        return self._cached(('time_projection',), compute)
+    
+    def query_tasks(
+        self,
+        status: str = 'all',
+        search: str = '',
+        limit: int = 50,
+        offset: int = 0,
+        after_day: Optional[int] = None
+    ) -> Dict:
+        """分页查询任务列表
+        
+        筛选和标题搜索在数据层完成，只取出当前页的任务，每页的开销与课程总天数无关。
+        
+        Args:
+            status: 筛选条件，取值见 TASK_FILTERS
+            search: 标题搜索文本
+            limit: 每页数量
+            offset: 跳过的匹配任务数（使用 after_day 时忽略）
+            after_day: 键集游标，只返回天数大于该值的任务（上一页的 next_cursor）
+        
+        Returns:
+            {'tasks': 当前页任务, 'total': 匹配总数, 'next_cursor': 下一页游标，没有下一页时为None}
+        """
+        start = offset if after_day is None else 0
+        page_days = list(islice(self._iter_matching_days(status, search, after_day or 0), start, start + limit + 1))
+        has_more = len(page_days) > limit
+        page_days = page_days[:limit]
+        
+        return {
+            'tasks': [self.learning_data.get_task_by_day(day) for day in page_days],
+            'total': self.count_tasks(status, search),
+            'next_cursor': page_days[-1] if has_more else None
+        }
+    
+    def count_tasks(self, status: str = 'all', search: str = '') -> int:
+        """统计符合筛选条件和标题搜索的任务数"""
+        return self._cached(
+            ('task_count', status, search, date.today()),
+            lambda: self._compute_task_count(status, search)
+        )
+    
+    def _compute_task_count(self, status: str, search: str) -> int:
+        if search:
+            return sum(1 for _ in self._iter_matching_days(status, search, 0))
+        
+        indexed_days = self.learning_data.get_indexed_days()
+        if status == 'all':
+            return indexed_days
+        if status in ('completed', 'incomplete'):
+            completed_days = self.completed.count_range(1, indexed_days)
+            return completed_days if status == 'completed' else indexed_days - completed_days
+        return len(self._completed_in_period(status))
+    
+    def _iter_matching_days(self, status: str, search: str, after_day: int) -> Iterator[int]:
+        """按天数升序产出符合条件且大于 after_day 的天数"""
+        if status not in self.TASK_FILTERS:
+            raise ValueError(f"未知的筛选条件: {status}")
+        
+        indexed_days = self.learning_data.get_indexed_days()
+        matched = self.learning_data.search_titles(search) if search else None
+        
+        if status in ('this_week', 'this_month'):
+            period_days = self._completed_in_period(status)
+            candidates = period_days[bisect_right(period_days, after_day):]
+        elif status == 'completed':
+            candidates = self.completed.iter_from(after_day + 1)
+        elif matched is not None:
+            # 搜索结果通常远少于全部任务，直接遍历搜索结果
+            matched_days = sorted(matched)
+            candidates = matched_days[bisect_right(matched_days, after_day):]
+        else:
+            candidates = range(after_day + 1, indexed_days + 1)
+        
+        for day in candidates:
+            if day > indexed_days:
+                return
+            if status == 'incomplete' and day in self.completed:
+                continue
+            if matched is not None and day not in matched:
+                continue
+            yield day
+    
+    def _completed_in_period(self, status: str) -> List[int]:
+        """本周（自周一起）或本月完成的天数，按天数升序"""
+        def compute():
+            today = date.today()
+            if status == 'this_week':
+                period_start = today - timedelta(days=today.weekday())
+            else:
+                period_start = today.replace(day=1)
+            
+            completion_dates = self.progress['completion_dates']
+            indexed_days = self.learning_data.get_indexed_days()
+            days = []
+            for day in self.completed:
+                if day > indexed_days:
+                    break
+                completed_on = parse_completion_date(completion_dates.get(f"day_{day}"))
+                if completed_on is not None and completed_on >= period_start:
+                    days.append(day)
+            return days
+        
+        return self._cached(('period_days', status, date.today()), compute)
+    
     def save_all_data(self):
         """保存所有数据"""
         try:
-            self.save_progress()
+            self.storage.flush()
             self.logger.info("所有数据已保存")
         except Exception as e:
             self.logger.error(f"保存数据失败: {e}")
@@ -239,20 +627,21 @@ class AppManager:
     def set_task_note(self, day: int, note: str):
         """设置任务笔记"""
         task_id = f"day_{day}"
-        self.progress['task_notes'][task_id] = note
-        self.save_progress()
+        self.profile.notes[task_id] = note
+        self._invalidate()
+        self.storage.set_task_note(day, note)
     
     def get_task_note(self, day: int) -> str:
         """获取任务笔记"""
         task_id = f"day_{day}"
-        return self.progress['task_notes'].get(task_id, "")
+        return self.profile.notes.get(task_id, "")
     
     def is_task_completed(self, day: int) -> bool:
         """检查任务是否已完成"""
-        task_id = f"day_{day}"
-        return task_id in self.progress['completed_tasks']
+        return day in self.completed
     
     def next_day(self):
         """进入下一天"""
         self.progress['current_day'] += 1
-        self.save_progress()
\ No newline at end of file
+        self._invalidate()
+        self.storage.set_current_day(self.progress['current_day'])
\ No newline at end of file
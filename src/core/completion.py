@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+任务完成位图
+以天数为下标的紧凑完成状态集合
+"""
+
+from typing import Dict, Iterable, Iterator, List
+
+if hasattr(int, 'bit_count'):
+    def _popcount(value: int) -> int:
+        return value.bit_count()
+else:  # Python 3.9
+    def _popcount(value: int) -> int:
+        return bin(value).count('1')
+
+
+class CompletionBitmap:
+    """任务完成位图
+    
+    第N天对应第N位，成员判断和增删为O(1)，区间计数按字节切片后做popcount。
+    序列化格式与progress.json中的 completed_tasks 列表（"day_N"）兼容。
+    """
+    
+    __slots__ = ('_bits', '_count')
+    
+    def __init__(self, days: Iterable[int] = ()):
+        self._bits = bytearray()
+        self._count = 0
+        for day in days:
+            self.add(day)
+    
+    def __contains__(self, day: int) -> bool:
+        byte_index = day >> 3
+        if day < 0 or byte_index >= len(self._bits):
+            return False
+        return bool(self._bits[byte_index] & (1 << (day & 7)))
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __iter__(self) -> Iterator[int]:
+        """按天数升序遍历已完成的天"""
+        for byte_index, byte in enumerate(self._bits):
+            if not byte:
+                continue
+            base = byte_index << 3
+            for bit in range(8):
+                if byte & (1 << bit):
+                    yield base + bit
+    
+    def iter_from(self, start_day: int) -> Iterator[int]:
+        """从 start_day（含）开始按天数升序遍历已完成的天，跳过全零字节"""
+        start_day = max(start_day, 0)
+        bits = self._bits
+        for byte_index in range(start_day >> 3, len(bits)):
+            byte = bits[byte_index]
+            if not byte:
+                continue
+            base = byte_index << 3
+            for bit in range(8):
+                if byte & (1 << bit) and base + bit >= start_day:
+                    yield base + bit
+    
+    def add(self, day: int) -> bool:
+        """标记为完成，原本未完成时返回True"""
+        if day < 0:
+            raise ValueError(f"无效的天数: {day}")
+        
+        byte_index = day >> 3
+        if byte_index >= len(self._bits):
+            self._bits.extend(bytes(byte_index + 1 - len(self._bits)))
+        
+        mask = 1 << (day & 7)
+        if self._bits[byte_index] & mask:
+            return False
+        self._bits[byte_index] |= mask
+        self._count += 1
+        return True
+    
+    def discard(self, day: int) -> bool:
+        """取消完成标记，原本已完成时返回True"""
+        if day not in self:
+            return False
+        self._bits[day >> 3] &= ~(1 << (day & 7)) & 0xFF
+        self._count -= 1
+        return True
+    
+    def clear(self):
+        """清空"""
+        self._bits = bytearray()
+        self._count = 0
+    
+    def count_range(self, start_day: int, end_day: int) -> int:
+        """统计 [start_day, end_day] 区间内已完成的天数"""
+        start_day = max(start_day, 0)
+        end_day = min(end_day, len(self._bits) * 8 - 1)
+        if start_day > end_day:
+            return 0
+        
+        first_byte = start_day >> 3
+        last_byte = end_day >> 3
+        value = int.from_bytes(self._bits[first_byte:last_byte + 1], 'little')
+        value >>= start_day & 7
+        value &= (1 << (end_day - start_day + 1)) - 1
+        return _popcount(value)
+    
+    def to_bytes(self) -> bytes:
+        """原始位图数据"""
+        return bytes(self._bits)
+    
+    def remap(self, day_map: Dict[int, int]) -> 'CompletionBitmap':
+        """按天数对应关系（旧天数 -> 新天数）生成新位图，没有对应关系的天被丢弃"""
+        return CompletionBitmap(day_map[day] for day in self if day in day_map)
+    
+    def to_task_ids(self) -> List[str]:
+        """序列化为 completed_tasks 列表格式"""
+        return [f"day_{day}" for day in self]
+    
+    @classmethod
+    def from_task_ids(cls, task_ids: Iterable[str]) -> 'CompletionBitmap':
+        """从 completed_tasks 列表格式构建"""
+        return cls(int(task_id.split('_')[1]) for task_id in task_ids)
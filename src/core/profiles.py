@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+学习者档案管理
+支持在一个进程中管理多个学习者的进度，学习路线数据在所有学习者之间共享
+"""
+
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
+
+from ..data.learning_data import LearningData
+from ..utils.logger import get_logger
+from .completion import CompletionBitmap
+from .statistics import LearningStatistics
+from .storage import (JournalProgressStorage, JsonProgressStorage, ProgressStorage, SqliteProgressStorage,
+                      WriteBehindStorage, day_from_task_id, task_id_for_day)
+
+if TYPE_CHECKING:
+    from ..data.versioning import ContentDiff
+
+_PROFILE_NAME_RE = re.compile(r'^[\w\-]+$')
+
+
+def default_progress() -> Dict:
+    """新学习者的默认进度（不含 completed_tasks，完成状态保存在位图中）"""
+    return {
+        'current_day': 1,
+        'completion_dates': {},
+        'statistics': {
+            'total_study_time': 0,
+            'completion_rate': 0.0,
+            'current_streak': 0
+        }
+    }
+
+
+class LearnerProfile:
+    """单个学习者的进度
+    
+    常驻内存的只有当前天数、完成位图、完成时间和统计摘要；
+    学习笔记在首次访问时才从存储加载，统计引擎在首次使用时构建。
+    """
+    
+    __slots__ = ('name', 'storage', 'learning_data', 'progress', 'completed', '_stats_engine')
+    
+    def __init__(self, name: str, storage: ProgressStorage, learning_data: LearningData):
+        self.name = name
+        self.storage = storage
+        self.learning_data = learning_data
+        self.progress = default_progress()
+        self.completed = CompletionBitmap()
+        self._stats_engine: Optional[LearningStatistics] = None
+    
+    def load(self, include_notes: bool = True) -> bool:
+        """从存储加载进度，没有已保存的进度时返回False"""
+        saved_progress = self.storage.load(include_notes=include_notes)
+        if not saved_progress:
+            self.progress.setdefault('task_notes', {})
+            return False
+        
+        self.apply_progress(saved_progress)
+        return True
+    
+    def apply_progress(self, progress_data: Dict):
+        """用progress.json格式的进度数据覆盖当前进度"""
+        progress_data = dict(progress_data)
+        completed_tasks = progress_data.pop('completed_tasks', None)
+        self.progress.update(progress_data)
+        
+        if completed_tasks is not None:
+            self.completed = CompletionBitmap.from_task_ids(completed_tasks)
+        
+        if self._stats_engine is not None:
+            self._stats_engine.rebuild(self.completed, self.progress['completion_dates'])
+    
+    @property
+    def stats_engine(self) -> LearningStatistics:
+        """统计引擎（首次访问时根据完成状态构建）"""
+        if self._stats_engine is None:
+            self._stats_engine = LearningStatistics(self.learning_data)
+            self._stats_engine.rebuild(self.completed, self.progress['completion_dates'])
+        return self._stats_engine
+    
+    @property
+    def notes(self) -> Dict[str, str]:
+        """学习笔记（首次访问时加载）"""
+        if 'task_notes' not in self.progress:
+            self.progress['task_notes'] = self.storage.load_notes()
+        return self.progress['task_notes']
+    
+    def to_progress_data(self) -> Dict:
+        """序列化为progress.json格式"""
+        progress_data = {
+            'current_day': self.progress['current_day'],
+            'completed_tasks': self.completed.to_task_ids()
+        }
+        progress_data.update(self.progress)
+        progress_data['task_notes'] = self.notes
+        return progress_data
+    
+    def refresh_statistics(self):
+        """学习路线内容变化后重算已构建的统计"""
+        if self._stats_engine is not None:
+            self._stats_engine.rebuild(self.completed, self.progress['completion_dates'])
+    
+    def remap_days(self, diff: 'ContentDiff') -> int:
+        """将进度迁移到新版本学习路线的天数并整体保存一次
+        
+        完成状态、完成时间和笔记按天数对应关系迁移，已删除的天的记录被丢弃；
+        当前天数迁移到对应的天（已删除时为其后第一个保留下来的天）。
+        
+        Returns:
+            丢弃的已完成天数
+        """
+        def remap_keys(values: Dict[str, str]) -> Dict[str, str]:
+            remapped = {}
+            for task_id, value in values.items():
+                new_day = diff.map_day(day_from_task_id(task_id))
+                if new_day is not None:
+                    remapped[task_id_for_day(new_day)] = value
+            return remapped
+        
+        completed = self.completed.remap(diff.day_map)
+        dropped = len(self.completed) - len(completed)
+        self.apply_progress({
+            'current_day': diff.nearest_day(self.progress['current_day']) or 1,
+            'completed_tasks': completed.to_task_ids(),
+            'completion_dates': remap_keys(self.progress.get('completion_dates', {})),
+            'task_notes': remap_keys(self.notes)
+        })
+        self.storage.save_all(self.to_progress_data())
+        return dropped
+    
+    def release(self):
+        """写入未保存的修改并释放存储占用的文件句柄"""
+        self.storage.close()
+
+
+class ProfileBackend:
+    """档案的存储后端：在档案目录中按档案名称创建存储，并识别目录中属于它的档案
+    
+    Args:
+        create: 根据存储路径创建存储
+        suffix: 档案文件的后缀（如 ".db"）；为空时每个档案是一个目录（日志存储）
+        is_profile: 进一步检查路径是否为该后端保存的档案，为None时只按后缀或目录判断
+    """
+    
+    def __init__(self, create: Callable[[Path], ProgressStorage], suffix: str = '',
+                 is_profile: Optional[Callable[[Path], bool]] = None):
+        self.create = create
+        self.suffix = suffix
+        self.is_profile = is_profile
+    
+    def __call__(self, path: Path) -> ProgressStorage:
+        """创建档案的存储，path 为档案目录下以档案名称命名的路径（不含后缀）"""
+        return self.create(path.with_name(path.name + self.suffix))
+    
+    def profile_name(self, path: Path) -> Optional[str]:
+        """档案目录中的路径属于该后端时返回档案名称，否则返回None"""
+        if self.suffix:
+            matched = path.suffix == self.suffix and path.is_file()
+        else:
+            matched = path.is_dir()
+        if not matched or (self.is_profile is not None and not self.is_profile(path)):
+            return None
+        return path.name[:len(path.name) - len(self.suffix)]
+
+
+SQLITE_BACKEND = ProfileBackend(lambda path: SqliteProgressStorage(str(path), legacy_json_path=None), '.db')
+JSON_BACKEND = ProfileBackend(lambda path: JsonProgressStorage(str(path)), '.json')
+JOURNAL_BACKEND = ProfileBackend(lambda path: JournalProgressStorage(str(path)),
+                                 is_profile=JournalProgressStorage.is_journal_directory)
+
+
+class ProfileManager:
+    """学习者档案管理器
+    
+    每个学习者的进度保存在档案目录下的独立存储中，按需加载；
+    所有学习者共享同一个 LearningData 实例。
+    """
+    
+    def __init__(
+        self,
+        learning_data: LearningData,
+        profiles_dir: str = 'data/profiles',
+        backend_factory: Union[ProfileBackend, Callable[[Path], ProgressStorage], None] = None,
+        save_interval: float = 300.0,
+        auto_save: bool = True
+    ):
+        self.logger = get_logger(__name__)
+        self.learning_data = learning_data
+        self.profiles_dir = Path(profiles_dir)
+        self.backend_factory = backend_factory or SQLITE_BACKEND
+        self.save_interval = save_interval
+        self.auto_save = auto_save
+        
+        self._profiles: Dict[str, LearnerProfile] = {}
+    
+    @staticmethod
+    def validate_name(name: str) -> str:
+        """检查档案名称是否可以用作文件名"""
+        if not name or not _PROFILE_NAME_RE.match(name):
+            raise ValueError(f"无效的档案名称: {name!r}")
+        return name
+    
+    def list_profiles(self) -> List[str]:
+        """列出已保存和已加载的档案名称
+        
+        已保存的档案由存储后端识别（见 ProfileBackend.profile_name），
+        其他后端的文件和无关的文件不会列出；后端为普通函数时只列出已加载的档案。
+        """
+        names = set(self._profiles)
+        profile_name = getattr(self.backend_factory, 'profile_name', None)
+        if profile_name is not None and self.profiles_dir.exists():
+            for path in self.profiles_dir.iterdir():
+                name = profile_name(path)
+                if name and _PROFILE_NAME_RE.match(name):
+                    names.add(name)
+        return sorted(names)
+    
+    def get(self, name: str) -> LearnerProfile:
+        """获取档案，首次访问时加载（不加载笔记）"""
+        profile = self._profiles.get(name)
+        if profile is not None:
+            return profile
+        
+        self.validate_name(name)
+        self.profiles_dir.mkdir(parents=True, exist_ok=True)
+        backend = self.backend_factory(self.profiles_dir / name)
+        storage = WriteBehindStorage(backend, interval=self.save_interval, auto_save=self.auto_save)
+        
+        profile = LearnerProfile(name, storage, self.learning_data)
+        if not profile.load(include_notes=False):
+            # 新档案：写入默认进度，使其在存储中可被识别
+            storage.save_all(profile.to_progress_data())
+            self.logger.info(f"已创建学习者档案: {name}")
+        profile.release()
+        
+        self._profiles[name] = profile
+        return profile
+    
+    def load_all(self) -> List[LearnerProfile]:
+        """加载所有已保存的档案"""
+        return [self.get(name) for name in self.list_profiles()]
+    
+    def loaded_profiles(self) -> List[LearnerProfile]:
+        """已加载到内存的档案"""
+        return list(self._profiles.values())
+    
+    def unload(self, name: str) -> bool:
+        """保存并从内存中移除档案"""
+        profile = self._profiles.pop(name, None)
+        if profile is None:
+            return False
+        profile.release()
+        return True
+    
+    def close(self):
+        """保存并释放所有档案"""
+        for profile in self._profiles.values():
+            profile.release()
+    
+    def __len__(self) -> int:
+        return len(self._profiles)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+学习统计引擎
+在每次完成状态变化时增量维护统计计数
+"""
+
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..data.learning_data import LearningData
+
+
+def parse_completion_date(completed_at: Optional[str]) -> Optional[date]:
+    """解析完成时间（ISO格式或"%Y-%m-%d"）为日期"""
+    if not completed_at:
+        return None
+    try:
+        return date.fromisoformat(completed_at[:10])
+    except (TypeError, ValueError):
+        return None
+
+
+class LearningStatistics:
+    """学习统计引擎
+
+    维护已完成总数、各阶段/各周完成数、累计学习时间以及每个日历日的
+    完成数，所有读取均为O(1)。阶段和周的归属来自 LearningData 的天数索引。
+    连续学习天数根据完成时间所在的日历日计算。
+    """
+
+    def __init__(self, learning_data: LearningData):
+        self.learning_data = learning_data
+        self.reset()
+
+    def reset(self):
+        """清空所有计数"""
+        self.completed_count = 0
+        self.total_minutes = 0
+        self.stage_completed: Dict[int, int] = {}
+        self.week_completed: Dict[int, int] = {}
+
+        self._date_counts: Dict[date, int] = {}
+        self._latest_date: Optional[date] = None
+        self._run_length = 0
+        self._run_dirty = False
+
+    def rebuild(self, completed_days: Iterable[int], completion_dates: Dict[str, str]):
+        """根据已完成天数和完成时间重建所有计数"""
+        self.reset()
+        for day in completed_days:
+            self.on_completed(day, completion_dates.get(f"day_{day}"))
+
+    def on_completed(self, day: int, completed_at: Optional[str] = None):
+        """任务完成时更新计数"""
+        self._adjust(day, 1)
+
+        completion_date = parse_completion_date(completed_at)
+        if completion_date is None:
+            return
+
+        count = self._date_counts.get(completion_date, 0)
+        self._date_counts[completion_date] = count + 1
+        if count:
+            return
+
+        # 新的学习日：按时间顺序追加时直接延长或重置连续天数
+        if self._run_dirty:
+            return
+        if self._latest_date is None:
+            self._latest_date = completion_date
+            self._run_length = 1
+        elif completion_date == self._latest_date + timedelta(days=1):
+            self._latest_date = completion_date
+            self._run_length += 1
+        elif completion_date > self._latest_date:
+            self._latest_date = completion_date
+            self._run_length = 1
+        else:
+            self._run_dirty = True
+
+    def on_uncompleted(self, day: int, completed_at: Optional[str] = None):
+        """任务取消完成时更新计数"""
+        self._adjust(day, -1)
+
+        completion_date = parse_completion_date(completed_at)
+        if completion_date is None or completion_date not in self._date_counts:
+            return
+
+        self._date_counts[completion_date] -= 1
+        if not self._date_counts[completion_date]:
+            del self._date_counts[completion_date]
+            self._run_dirty = True
+
+    def _adjust(self, day: int, delta: int):
+        """调整总数、阶段/周计数和学习时间"""
+        self.completed_count += delta
+        self.total_minutes += delta * self.learning_data.get_estimated_minutes(day)
+
+        stage_id = self.learning_data.get_stage_id(day)
+        if stage_id is not None:
+            self.stage_completed[stage_id] = self.stage_completed.get(stage_id, 0) + delta
+
+        week = self.learning_data.get_week_number(day)
+        if week is not None:
+            self.week_completed[week] = self.week_completed.get(week, 0) + delta
+
+    def _recompute_run(self):
+        """重新计算最近一次连续学习的结束日期和长度"""
+        self._run_dirty = False
+        if not self._date_counts:
+            self._latest_date = None
+            self._run_length = 0
+            return
+
+        self._latest_date = max(self._date_counts)
+        self._run_length = 1
+        current = self._latest_date - timedelta(days=1)
+        while current in self._date_counts:
+            self._run_length += 1
+            current -= timedelta(days=1)
+
+    def current_streak(self, today: Optional[date] = None) -> int:
+        """连续学习天数：截至今天（今天尚未学习时截至昨天）的连续学习日数"""
+        if self._run_dirty:
+            self._recompute_run()
+        if self._latest_date is None:
+            return 0
+
+        today = today or date.today()
+        if self._latest_date >= today - timedelta(days=1):
+            return self._run_length
+        return 0
+
+    def daily_counts(self) -> List[Tuple[date, int]]:
+        """每个日历日的完成数，按日期升序（没有完成时间的记录不计入）"""
+        return sorted(self._date_counts.items())
+
+    def get_stage_completed(self, stage_id: int) -> int:
+        """阶段内已完成天数"""
+        return self.stage_completed.get(stage_id, 0)
+
+    def get_week_completed(self, week: int) -> int:
+        """周内已完成天数"""
+        return self.week_completed.get(week, 0)
+
+    @property
+    def total_study_hours(self) -> float:
+        """累计学习时间（小时）"""
+        return round(self.total_minutes / 60, 1)
+
+    def completion_rate(self) -> float:
+        """完成率（0~1）"""
+        total_days = self.learning_data.get_total_days()
+        return self.completed_count / total_days if total_days > 0 else 0.0
@@ -0,0 +1,735 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+学习进度存储后端
+提供可替换的进度持久化实现：整文件JSON存储、基于SQLite的行级存储
+和追加式日志存储，以及合并写入的延迟保存层
+"""
+
+import copy
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ..utils.logger import get_logger
+
+
+def task_id_for_day(day: int) -> str:
+    """天数对应的任务ID（与progress.json中的键格式一致）"""
+    return f"day_{day}"
+
+
+def day_from_task_id(task_id: str) -> int:
+    """从任务ID解析天数"""
+    return int(task_id.split('_')[1])
+
+
+def empty_progress() -> Dict:
+    """空白进度"""
+    return {
+        'current_day': 1,
+        'completed_tasks': [],
+        'completion_dates': {},
+        'task_notes': {},
+        'statistics': {}
+    }
+
+
+def _copy_progress(progress: Dict, include_notes: bool) -> Dict:
+    """复制进度字典，可选择不包含学习笔记"""
+    if include_notes:
+        return copy.deepcopy(progress)
+    return copy.deepcopy({key: value for key, value in progress.items() if key != 'task_notes'})
+
+
+def apply_event(progress: Dict, event: Dict):
+    """将一条进度修改事件应用到进度字典
+
+    事件类型：complete、uncomplete、note、day、stats、reset
+    """
+    op = event['op']
+
+    if op == 'complete':
+        task_id = task_id_for_day(event['day'])
+        completed_tasks = progress.setdefault('completed_tasks', [])
+        if task_id not in completed_tasks:
+            completed_tasks.append(task_id)
+        if event.get('at'):
+            progress.setdefault('completion_dates', {})[task_id] = event['at']
+    elif op == 'uncomplete':
+        task_id = task_id_for_day(event['day'])
+        completed_tasks = progress.setdefault('completed_tasks', [])
+        if task_id in completed_tasks:
+            completed_tasks.remove(task_id)
+        progress.setdefault('completion_dates', {}).pop(task_id, None)
+    elif op == 'note':
+        progress.setdefault('task_notes', {})[task_id_for_day(event['day'])] = event['note']
+    elif op == 'day':
+        progress['current_day'] = event['day']
+    elif op == 'stats':
+        progress['statistics'] = dict(event['stats'])
+    elif op == 'reset':
+        progress.clear()
+        progress.update(copy.deepcopy(event['progress']))
+    else:
+        raise ValueError(f"未知的进度事件类型: {op}")
+
+
+class ProgressStorage:
+    """学习进度存储后端基类
+
+    进度以与progress.json相同结构的字典交换：
+    current_day、completed_tasks、completion_dates、task_notes、statistics。
+    每个修改方法对应一次最小粒度的持久化操作；在 batch() 中的多次修改
+    合并为一次提交。
+    """
+
+    def __init__(self):
+        self.logger = get_logger(__name__)
+        self._batch_depth = 0
+        self._dirty = False
+
+    def load(self, include_notes: bool = True) -> Optional[Dict]:
+        """加载进度，没有已保存的进度时返回None
+
+        Args:
+            include_notes: 是否同时加载学习笔记（不加载时结果中没有 task_notes）
+        """
+        raise NotImplementedError
+
+    def load_notes(self) -> Dict[str, str]:
+        """单独加载学习笔记"""
+        raise NotImplementedError
+
+    def save_all(self, progress: Dict):
+        """整体保存进度"""
+        raise NotImplementedError
+
+    def set_task_completed(self, day: int, completed: bool, completed_at: Optional[str] = None):
+        """设置任务完成状态"""
+        raise NotImplementedError
+
+    def set_task_note(self, day: int, note: str):
+        """设置任务笔记"""
+        raise NotImplementedError
+
+    def set_current_day(self, day: int):
+        """设置当前天数"""
+        raise NotImplementedError
+
+    def set_statistics(self, statistics: Dict):
+        """设置统计信息"""
+        raise NotImplementedError
+
+    @contextmanager
+    def batch(self) -> Iterator['ProgressStorage']:
+        """批量修改，退出时统一提交"""
+        self._batch_depth += 1
+        try:
+            yield self
+        except Exception:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._dirty = False
+                self._rollback()
+            raise
+        else:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._dirty = False
+                self._commit()
+
+    def flush(self):
+        """确保所有修改已持久化"""
+        if self._dirty:
+            self._dirty = False
+            self._commit()
+
+    def close(self):
+        """关闭存储"""
+        self.flush()
+
+    def _mark_dirty(self):
+        """记录修改，不在批量修改中时立即提交"""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._dirty = False
+            self._commit()
+
+    def _commit(self):
+        """提交修改"""
+        pass
+
+    def _rollback(self):
+        """放弃未提交的修改"""
+        pass
+
+
+class JsonProgressStorage(ProgressStorage):
+    """JSON文件存储
+
+    每次提交都重写整个进度文件。
+    """
+
+    def __init__(self, file_path: str = 'data/progress.json'):
+        super().__init__()
+        self.file_path = Path(file_path)
+        self._data: Dict = empty_progress()
+
+    def load(self, include_notes: bool = True) -> Optional[Dict]:
+        if not self.file_path.exists():
+            return None
+
+        with open(self.file_path, 'r', encoding='utf-8') as f:
+            self._data = json.load(f)
+        return _copy_progress(self._data, include_notes)
+
+    def load_notes(self) -> Dict[str, str]:
+        return dict(self._data.get('task_notes', {}))
+
+    def _apply(self, event: Dict):
+        apply_event(self._data, event)
+        self._mark_dirty()
+
+    def save_all(self, progress: Dict):
+        self._apply({'op': 'reset', 'progress': progress})
+
+    def set_task_completed(self, day: int, completed: bool, completed_at: Optional[str] = None):
+        if completed:
+            self._apply({'op': 'complete', 'day': day, 'at': completed_at})
+        else:
+            self._apply({'op': 'uncomplete', 'day': day})
+
+    def set_task_note(self, day: int, note: str):
+        self._apply({'op': 'note', 'day': day, 'note': note})
+
+    def set_current_day(self, day: int):
+        self._apply({'op': 'day', 'day': day})
+
+    def set_statistics(self, statistics: Dict):
+        self._apply({'op': 'stats', 'stats': statistics})
+
+    def _commit(self):
+        # 确保数据目录存在
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(self.file_path, 'w', encoding='utf-8') as f:
+            json.dump(self._data, f, ensure_ascii=False, indent=2)
+
+
+class SqliteProgressStorage(ProgressStorage):
+    """SQLite行级存储（WAL模式）
+
+    完成记录、笔记和统计信息各自按行存储，每次修改只写入一行。
+    首次打开时若数据库为空，会从旧的progress.json一次性迁移数据。
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS completions (
+            day INTEGER PRIMARY KEY,
+            completed_at TEXT
+        );
+        CREATE TABLE IF NOT EXISTS notes (
+            day INTEGER PRIMARY KEY,
+            note TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS statistics (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, db_path: str = 'data/progress.db',
+                 legacy_json_path: Optional[str] = 'data/progress.json'):
+        super().__init__()
+        self.db_path = Path(db_path)
+        self.legacy_json_path = Path(legacy_json_path) if legacy_json_path else None
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """数据库连接（首次访问时打开）"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # 延迟保存层会在定时线程中提交，访问由其锁串行化
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(self.SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _migrate_legacy_json(self):
+        """从progress.json一次性迁移"""
+        if self._get_meta('legacy_migrated') is not None:
+            return
+
+        if self.legacy_json_path and self.legacy_json_path.exists() and self._get_meta('current_day') is None:
+            with open(self.legacy_json_path, 'r', encoding='utf-8') as f:
+                legacy_progress = json.load(f)
+            self._write_all(legacy_progress)
+            self.logger.info(f"已从 {self.legacy_json_path} 迁移学习进度")
+
+        self._set_meta('legacy_migrated', '1')
+        self.conn.commit()
+
+    def load(self, include_notes: bool = True) -> Optional[Dict]:
+        self._migrate_legacy_json()
+
+        current_day = self._get_meta('current_day')
+        if current_day is None:
+            # 从未整体保存过的进度也可能已有完成记录或笔记（当前天数仍为默认的第1天）
+            if not any(self.conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone()
+                       for table in ('completions', 'notes', 'statistics')):
+                return None
+            current_day = 1
+
+        completed_tasks = []
+        completion_dates = {}
+        for day, completed_at in self.conn.execute(
+                "SELECT day, completed_at FROM completions ORDER BY completed_at, day"):
+            task_id = task_id_for_day(day)
+            completed_tasks.append(task_id)
+            if completed_at:
+                completion_dates[task_id] = completed_at
+
+        statistics = {
+            key: json.loads(value)
+            for key, value in self.conn.execute("SELECT key, value FROM statistics")
+        }
+
+        progress = {
+            'current_day': int(current_day),
+            'completed_tasks': completed_tasks,
+            'completion_dates': completion_dates,
+            'statistics': statistics
+        }
+        if include_notes:
+            progress['task_notes'] = self.load_notes()
+        return progress
+
+    def load_notes(self) -> Dict[str, str]:
+        return {
+            task_id_for_day(day): note
+            for day, note in self.conn.execute("SELECT day, note FROM notes")
+        }
+
+    def _write_all(self, progress: Dict):
+        """在当前事务中写入全部进度"""
+        conn = self.conn
+        conn.execute("DELETE FROM completions")
+        conn.execute("DELETE FROM notes")
+        conn.execute("DELETE FROM statistics")
+
+        completion_dates = progress.get('completion_dates', {})
+        conn.executemany(
+            "INSERT OR REPLACE INTO completions (day, completed_at) VALUES (?, ?)",
+            [(day_from_task_id(task_id), completion_dates.get(task_id))
+             for task_id in progress.get('completed_tasks', [])]
+        )
+        conn.executemany(
+            "INSERT INTO notes (day, note) VALUES (?, ?)",
+            [(day_from_task_id(task_id), note)
+             for task_id, note in progress.get('task_notes', {}).items() if note]
+        )
+        conn.executemany(
+            "INSERT INTO statistics (key, value) VALUES (?, ?)",
+            [(key, json.dumps(value)) for key, value in progress.get('statistics', {}).items()]
+        )
+        self._set_meta('current_day', str(progress.get('current_day', 1)))
+
+    def save_all(self, progress: Dict):
+        self._write_all(progress)
+        self._mark_dirty()
+
+    def set_task_completed(self, day: int, completed: bool, completed_at: Optional[str] = None):
+        if completed:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO completions (day, completed_at) VALUES (?, ?)",
+                (day, completed_at)
+            )
+        else:
+            self.conn.execute("DELETE FROM completions WHERE day = ?", (day,))
+        self._mark_dirty()
+
+    def set_task_note(self, day: int, note: str):
+        if note:
+            self.conn.execute("INSERT OR REPLACE INTO notes (day, note) VALUES (?, ?)", (day, note))
+        else:
+            self.conn.execute("DELETE FROM notes WHERE day = ?", (day,))
+        self._mark_dirty()
+
+    def set_current_day(self, day: int):
+        self._set_meta('current_day', str(day))
+        self._mark_dirty()
+
+    def set_statistics(self, statistics: Dict):
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO statistics (key, value) VALUES (?, ?)",
+            [(key, json.dumps(value)) for key, value in statistics.items()]
+        )
+        self._mark_dirty()
+
+    def _commit(self):
+        self.conn.commit()
+
+    def _rollback(self):
+        if self._conn is not None:
+            self._conn.rollback()
+
+    def close(self):
+        super().close()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class JournalProgressStorage(ProgressStorage):
+    """追加式日志存储
+
+    每次修改以一行JSON事件追加到当前日志段，提交时只需一次fsync。
+    事件数达到阈值后封存当前日志段，并在后台线程中把内存中的进度写成
+    快照，快照写入完成后再删除已被覆盖的日志段。启动时读取快照并按顺序
+    重放其后的日志段。快照通过临时文件替换写入，任何时刻崩溃都不会丢失
+    已提交的修改。
+    """
+
+    SNAPSHOT_FILE = 'snapshot.json'
+    SEGMENT_PATTERN = 'journal.{:06d}.log'
+
+    def __init__(self, directory: str = 'data/journal', compact_threshold: int = 500,
+                 fsync: bool = True):
+        super().__init__()
+        self.directory = Path(directory)
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+
+        self._state: Dict = empty_progress()
+        self._segment = 0
+        self._file = None
+        self._events_since_compaction = 0
+        self._compaction_thread: Optional[threading.Thread] = None
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.directory / self.SEGMENT_PATTERN.format(segment)
+
+    @classmethod
+    def is_journal_directory(cls, directory: Path) -> bool:
+        """目录中是否有日志存储的快照或日志段"""
+        return (Path(directory) / cls.SNAPSHOT_FILE).exists() or any(Path(directory).glob('journal.*.log'))
+
+    def _list_segments(self) -> List[int]:
+        """已存在的日志段编号（升序）"""
+        if not self.directory.exists():
+            return []
+
+        segments = []
+        for path in self.directory.glob('journal.*.log'):
+            try:
+                segments.append(int(path.name.split('.')[1]))
+            except ValueError:
+                continue
+        return sorted(segments)
+
+    def _replay_segment(self, segment: int) -> int:
+        """重放一个日志段，返回重放的事件数"""
+        count = 0
+        with open(self._segment_path(segment), 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    # 崩溃时未写完的最后一行
+                    self.logger.warning(f"忽略日志段 {segment} 中不完整的事件")
+                    break
+                apply_event(self._state, event)
+                count += 1
+        return count
+
+    def load(self, include_notes: bool = True) -> Optional[Dict]:
+        # 重新加载时先等待压缩完成并关闭当前日志段，从磁盘重建全部状态
+        if self._compaction_thread is not None:
+            self._compaction_thread.join()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._state = empty_progress()
+        self._events_since_compaction = 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        snapshot_path = self.directory / self.SNAPSHOT_FILE
+        first_segment = 0
+        has_data = False
+
+        if snapshot_path.exists():
+            with open(snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            self._state = snapshot['progress']
+            first_segment = snapshot['segment']
+            has_data = True
+
+        segments = self._list_segments()
+        for segment in segments:
+            if segment < first_segment:
+                # 已被快照覆盖但未来得及删除的日志段
+                self._segment_path(segment).unlink()
+                continue
+            replayed = self._replay_segment(segment)
+            self._events_since_compaction += replayed
+            has_data = has_data or replayed > 0
+
+        # 新的修改写入新的日志段，避免追加到可能不完整的旧日志段末尾
+        self._open_segment(max(segments[-1] + 1 if segments else 0, first_segment))
+
+        return _copy_progress(self._state, include_notes) if has_data else None
+
+    def load_notes(self) -> Dict[str, str]:
+        return dict(self._state.get('task_notes', {}))
+
+    def _open_segment(self, segment: int):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._segment = segment
+        self._file = open(self._segment_path(segment), 'a', encoding='utf-8')
+
+    def _append(self, event: Dict):
+        if self._file is None:
+            self._open_segment(max(self._list_segments() + [-1]) + 1)
+
+        apply_event(self._state, event)
+        self._file.write(json.dumps(event, ensure_ascii=False) + '\n')
+        self._events_since_compaction += 1
+        self._mark_dirty()
+
+    def save_all(self, progress: Dict):
+        self._append({'op': 'reset', 'progress': progress})
+
+    def set_task_completed(self, day: int, completed: bool, completed_at: Optional[str] = None):
+        if completed:
+            self._append({'op': 'complete', 'day': day, 'at': completed_at})
+        else:
+            self._append({'op': 'uncomplete', 'day': day})
+
+    def set_task_note(self, day: int, note: str):
+        self._append({'op': 'note', 'day': day, 'note': note})
+
+    def set_current_day(self, day: int):
+        self._append({'op': 'day', 'day': day})
+
+    def set_statistics(self, statistics: Dict):
+        self._append({'op': 'stats', 'stats': statistics})
+
+    def _commit(self):
+        if self._file is None:
+            return
+
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+        if self._events_since_compaction >= self.compact_threshold:
+            self.compact()
+
+    def compact(self, wait: bool = False):
+        """压缩日志：封存当前日志段并在后台写入快照
+
+        Args:
+            wait: 是否等待快照写入完成
+        """
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            if wait:
+                self._compaction_thread.join()
+            return
+
+        # 封存当前日志段，之后的修改写入新的日志段
+        if self._file is not None:
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self._file.close()
+        self._open_segment(self._segment + 1)
+
+        snapshot = {'segment': self._segment, 'progress': copy.deepcopy(self._state)}
+        self._events_since_compaction = 0
+
+        self._compaction_thread = threading.Thread(
+            target=self._write_snapshot, args=(snapshot,), daemon=True
+        )
+        self._compaction_thread.start()
+        if wait:
+            self._compaction_thread.join()
+
+    def _write_snapshot(self, snapshot: Dict):
+        """写入快照并删除已被覆盖的日志段（在后台线程中运行）"""
+        try:
+            snapshot_path = self.directory / self.SNAPSHOT_FILE
+            temp_path = snapshot_path.with_suffix('.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            os.replace(temp_path, snapshot_path)
+
+            for segment in self._list_segments():
+                if segment < snapshot['segment']:
+                    self._segment_path(segment).unlink()
+
+            self.logger.debug(f"进度日志已压缩到日志段 {snapshot['segment']}")
+        except Exception as e:
+            self.logger.error(f"压缩进度日志失败: {e}")
+
+    def close(self):
+        super().close()
+        if self._compaction_thread is not None:
+            self._compaction_thread.join()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class WriteBehindStorage(ProgressStorage):
+    """延迟保存层
+
+    包装一个存储后端：修改只记录在内存中并按键合并（同一天的多次笔记修改
+    只保留最后一次），由定时器在每个保存间隔内最多写入一次，
+    或在 flush()/close() 时立即写入。保存间隔不大于0时每次提交立即写入。
+    """
+
+    def __init__(self, backend: ProgressStorage, interval: float = 300.0, auto_save: bool = True):
+        super().__init__()
+        self.backend = backend
+        self.interval = interval
+        self.auto_save = auto_save
+
+        self._pending: Dict[Tuple, Dict] = {}
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+
+    def load(self, include_notes: bool = True) -> Optional[Dict]:
+        with self._lock:
+            return self.backend.load(include_notes=include_notes)
+
+    def load_notes(self) -> Dict[str, str]:
+        self.flush()
+        with self._lock:
+            return self.backend.load_notes()
+
+    def _queue(self, key: Tuple, event: Dict):
+        with self._lock:
+            self._pending[key] = event
+        self._mark_dirty()
+
+    def save_all(self, progress: Dict):
+        with self._lock:
+            # 整体保存覆盖之前所有未写入的修改
+            self._pending.clear()
+        self._queue(('reset',), {'op': 'reset', 'progress': copy.deepcopy(progress)})
+
+    def set_task_completed(self, day: int, completed: bool, completed_at: Optional[str] = None):
+        if completed:
+            self._queue(('completion', day), {'op': 'complete', 'day': day, 'at': completed_at})
+        else:
+            self._queue(('completion', day), {'op': 'uncomplete', 'day': day})
+
+    def set_task_note(self, day: int, note: str):
+        self._queue(('note', day), {'op': 'note', 'day': day, 'note': note})
+
+    def set_current_day(self, day: int):
+        self._queue(('day',), {'op': 'day', 'day': day})
+
+    def set_statistics(self, statistics: Dict):
+        self._queue(('stats',), {'op': 'stats', 'stats': dict(statistics)})
+
+    @property
+    def pending_count(self) -> int:
+        """尚未写入的修改数量"""
+        return len(self._pending)
+
+    def _commit(self):
+        """安排写入：间隔为0时立即写入，否则启动定时器（已在等待时不重复安排）"""
+        if self.interval <= 0:
+            self.flush()
+            return
+
+        if not self.auto_save:
+            return
+
+        with self._lock:
+            if self._timer is None:
+                self._timer = threading.Timer(self.interval, self._on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _on_timer(self):
+        with self._lock:
+            self._timer = None
+        try:
+            self.flush()
+        except Exception as e:
+            # 未写入的修改仍在队列中，下一个保存间隔重试
+            self.logger.error(f"自动保存失败: {e}")
+            self._commit()
+
+    def flush(self):
+        """立即写入所有未保存的修改"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            self._dirty = False
+            if not self._pending:
+                self.backend.flush()
+                return
+
+            pending = list(self._pending.items())
+            self._pending.clear()
+
+            try:
+                self._write_events([event for _, event in pending])
+            except Exception:
+                # 后端已回滚：把修改放回队列，保留在此期间新加入的修改，等待下次写入
+                restored = dict(pending)
+                restored.update(self._pending)
+                self._pending = restored
+                self._dirty = True
+                raise
+            self.backend.flush()
+
+    def _write_events(self, events: List[Dict]):
+        """在后端的一次批量修改中写入事件"""
+        with self.backend.batch():
+            for event in events:
+                op = event['op']
+                if op == 'reset':
+                    self.backend.save_all(event['progress'])
+                elif op == 'complete':
+                    self.backend.set_task_completed(event['day'], True, event['at'])
+                elif op == 'uncomplete':
+                    self.backend.set_task_completed(event['day'], False)
+                elif op == 'note':
+                    self.backend.set_task_note(event['day'], event['note'])
+                elif op == 'day':
+                    self.backend.set_current_day(event['day'])
+                elif op == 'stats':
+                    self.backend.set_statistics(event['stats'])
+
+    def close(self):
+        self.flush()
+        self.backend.close()
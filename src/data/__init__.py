@@ -6,5 +6,6 @@
 """
 
 from .learning_data import LearningData
+from .task_record import EstimatedTime, StageRecord, Task, TaskView, WeekRecord
 
-__all__ = ['LearningData']
\ No newline at end of file
+__all__ = ['LearningData', 'Task', 'TaskView', 'StageRecord', 'WeekRecord', 'EstimatedTime']
\ No newline at end of file
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+任务列式视图
+将每天任务的天数、阶段、周、难度和预计时间转换为等长的数值列，
+统计分析时配合完成掩码做向量化汇总，不再逐条读取任务记录。
+安装了 NumPy 时各列为 ndarray，否则退回纯Python实现，结果一致。
+NumPy 在首次构建列式视图时才导入，不计入应用启动时间。
+"""
+
+from array import array
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from .task_record import TaskView
+
+np = None  # NumPy模块，由 _load_numpy() 首次调用时导入
+_numpy_loaded = False
+
+# 难度等级，按由易到难排序；编码为下标+1，0表示未知难度
+DIFFICULTY_LEVELS = ('入门', '基础', '中级', '进阶', '高级')
+_DIFFICULTY_CODES = {name: code for code, name in enumerate(DIFFICULTY_LEVELS, 1)}
+
+# 预计学习时间分组：(上限分钟数（含）, 名称)，超过最后一个上限的归入"4小时以上"
+TIME_BUCKETS = ((60, '1小时以内'), (120, '1-2小时'), (180, '2-3小时'), (240, '3-4小时'))
+_TIME_BUCKET_LABELS = tuple(label for _, label in TIME_BUCKETS) + ('4小时以上', '未知')
+
+
+def _load_numpy():
+    """导入NumPy（只尝试一次），未安装时保持为None"""
+    global np, _numpy_loaded
+    if not _numpy_loaded:
+        _numpy_loaded = True
+        try:
+            import numpy
+            np = numpy
+        except ImportError:  # 移动端打包不包含NumPy
+            pass
+    return np
+
+
+def difficulty_code(difficulty: str) -> int:
+    """难度名称对应的编码，未知难度为0"""
+    return _DIFFICULTY_CODES.get(difficulty, 0)
+
+
+class TaskColumns:
+    """按天数顺序排列的任务数值列
+
+    Attributes:
+        day: 天数
+        stage_id: 阶段ID
+        week: 周序号
+        difficulty: 难度编码，见 DIFFICULTY_LEVELS
+        min_minutes / max_minutes: 预计学习分钟数的下限和上限，无法解析时为0
+        minutes: 预计学习分钟数的区间中值
+    """
+
+    __slots__ = ('day', 'stage_id', 'week', 'difficulty', 'min_minutes', 'max_minutes', 'minutes')
+
+    def __init__(self, tasks: Iterable[TaskView]):
+        _load_numpy()
+        columns = {name: array('I') for name in self.__slots__}
+        for task in tasks:
+            estimate = task.estimate
+            columns['day'].append(task.day)
+            columns['stage_id'].append(task.stage_id)
+            columns['week'].append(task.week)
+            columns['difficulty'].append(difficulty_code(task.difficulty))
+            columns['min_minutes'].append(estimate.min_minutes)
+            columns['max_minutes'].append(estimate.max_minutes)
+            columns['minutes'].append(estimate.minutes)
+
+        for name, column in columns.items():
+            setattr(self, name, np.asarray(column, dtype=np.int64) if np is not None else column)
+
+    def __len__(self) -> int:
+        return len(self.day)
+
+    def completion_mask(self, completed) -> Sequence[bool]:
+        """各行对应的天是否已完成
+
+        Args:
+            completed: 完成位图（CompletionBitmap）
+        """
+        if np is None:
+            return [day in completed for day in self.day]
+
+        bits = np.unpackbits(np.frombuffer(completed.to_bytes(), dtype=np.uint8), bitorder='little')
+        mask = np.zeros(len(self.day), dtype=bool)
+        in_range = self.day < len(bits)
+        mask[in_range] = bits[self.day[in_range]].astype(bool)
+        return mask
+
+    def pending_mask(self, completed) -> Sequence[bool]:
+        """各行对应的天是否尚未完成"""
+        mask = self.completion_mask(completed)
+        if np is not None:
+            return ~mask
+        return [not selected for selected in mask]
+
+    def _select(self, column, mask: Optional[Sequence[bool]]):
+        """取出掩码选中的行，mask为None时取全部行"""
+        if mask is None:
+            return column
+        if np is not None:
+            return column[mask]
+        return [value for value, selected in zip(column, mask) if selected]
+
+    def difficulty_counts(self, mask: Optional[Sequence[bool]] = None) -> Dict[str, int]:
+        """各难度等级的任务数（不含未知难度）"""
+        codes = self._select(self.difficulty, mask)
+        if np is not None:
+            counts = np.bincount(codes, minlength=len(DIFFICULTY_LEVELS) + 1).tolist()
+        else:
+            counts = [0] * (len(DIFFICULTY_LEVELS) + 1)
+            for code in codes:
+                counts[code] += 1
+        return dict(zip(DIFFICULTY_LEVELS, counts[1:]))
+
+    def average_difficulty(self, mask: Optional[Sequence[bool]] = None) -> Optional[float]:
+        """平均难度编码（1为最易），没有已知难度的任务时返回None"""
+        codes = self._select(self.difficulty, mask)
+        if np is not None:
+            known = codes[codes > 0]
+            return float(known.mean()) if len(known) else None
+
+        known = [code for code in codes if code > 0]
+        return sum(known) / len(known) if known else None
+
+    def time_distribution(self, mask: Optional[Sequence[bool]] = None) -> Dict[str, int]:
+        """按预计学习时间分组的任务数，分组见 TIME_BUCKETS"""
+        minutes = self._select(self.minutes, mask)
+        bounds = [limit for limit, _ in TIME_BUCKETS]
+        if np is not None:
+            buckets = np.searchsorted(bounds, minutes, side='left')
+            buckets[minutes <= 0] = len(bounds) + 1
+            counts = np.bincount(buckets, minlength=len(_TIME_BUCKET_LABELS)).tolist()
+        else:
+            counts = [0] * len(_TIME_BUCKET_LABELS)
+            for value in minutes:
+                if value <= 0:
+                    counts[-1] += 1
+                    continue
+                index = 0
+                while index < len(bounds) and value > bounds[index]:
+                    index += 1
+                counts[index] += 1
+        return dict(zip(_TIME_BUCKET_LABELS, counts))
+
+    def total_minutes(self, mask: Optional[Sequence[bool]] = None) -> int:
+        """预计学习分钟数之和"""
+        minutes = self._select(self.minutes, mask)
+        return int(minutes.sum()) if np is not None else sum(minutes)
+
+    def minutes_range(self, mask: Optional[Sequence[bool]] = None) -> Tuple[int, int]:
+        """预计学习分钟数下限之和与上限之和"""
+        low = self._select(self.min_minutes, mask)
+        high = self._select(self.max_minutes, mask)
+        if np is not None:
+            return int(low.sum()), int(high.sum())
+        return sum(low), sum(high)
+
+    def week_load(self, mask: Optional[Sequence[bool]] = None) -> Dict[int, Tuple[int, int]]:
+        """按周汇总预计学习分钟数：周序号 -> (下限之和, 上限之和)，只包含有选中任务的周"""
+        weeks = self._select(self.week, mask)
+        low = self._select(self.min_minutes, mask)
+        high = self._select(self.max_minutes, mask)
+        if np is not None:
+            present = np.bincount(weeks)
+            low_sums = np.bincount(weeks, weights=low).astype(np.int64)
+            high_sums = np.bincount(weeks, weights=high).astype(np.int64)
+            return {
+                int(week): (int(low_sums[week]), int(high_sums[week]))
+                for week in np.flatnonzero(present)
+            }
+
+        load: Dict[int, Tuple[int, int]] = {}
+        for week, low_value, high_value in zip(weeks, low, high):
+            week_low, week_high = load.get(week, (0, 0))
+            load[week] = (week_low + low_value, week_high + high_value)
+        return load
+
+    def count(self, mask: Optional[Sequence[bool]] = None) -> int:
+        """掩码选中的行数"""
+        if mask is None:
+            return len(self.day)
+        return int(np.count_nonzero(mask)) if np is not None else sum(mask)
+
+
+def difficulty_label(average: Optional[float]) -> str:
+    """将平均难度编码换算为最接近的难度名称"""
+    if average is None:
+        return "--"
+    index = min(max(int(average + 0.5), 1), len(DIFFICULTY_LEVELS))
+    return DIFFICULTY_LEVELS[index - 1]
+
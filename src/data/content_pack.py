@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+学习内容包
+从外部JSON/YAML文件加载学习路线，并将解析结果和预建索引编译为二进制缓存
+"""
+
+import gc
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 内置的数学建模学习路线
+DEFAULT_CONTENT_PACK = Path(__file__).resolve().parents[2] / "data" / "curricula" / "math_modeling.json"
+
+# 缓存格式版本，索引结构变化时递增以使旧缓存失效
+CACHE_FORMAT_VERSION = 5
+
+
+def parse_content_pack(raw: bytes, suffix: str) -> Dict:
+    """解析内容包文件内容
+
+    Args:
+        raw: 文件内容
+        suffix: 文件扩展名（.json / .yaml / .yml）
+
+    Returns:
+        学习路线数据
+    """
+    if suffix in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("加载YAML内容包需要安装 pyyaml")
+        learning_path = yaml.safe_load(raw.decode('utf-8'))
+    else:
+        learning_path = json.loads(raw.decode('utf-8'))
+
+    if not isinstance(learning_path, dict) or not isinstance(learning_path.get("stages"), list):
+        raise ValueError("内容包缺少 stages 列表")
+    return learning_path
+
+
+def read_content_pack(path: Union[str, Path]) -> Dict:
+    """读取并解析内容包（不使用缓存）"""
+    path = Path(path)
+    return parse_content_pack(path.read_bytes(), path.suffix.lower())
+
+
+def content_hash(raw: bytes) -> str:
+    """内容包的内容哈希"""
+    return hashlib.sha256(raw).hexdigest()
+
+
+class ContentPackCache:
+    """内容包编译缓存
+
+    缓存文件以内容包文件名和内容哈希命名，内容包修改后自动失效。
+    主缓存为 pickle 格式的已编译数据（学习路线、天数索引和任务记录），启动时载入；
+    载入较慢的附加索引（如搜索索引）以 part 区分、单独保存，在首次使用时才读取。
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = 'data/cache'):
+        self.cache_dir = Path(cache_dir)
+
+    def path_for(self, pack_path: Path, digest: str, part: Optional[str] = None) -> Path:
+        """内容包对应的缓存文件路径（part 为附加索引名，None 表示主缓存）"""
+        suffix = f".{part}" if part else ""
+        return self.cache_dir / f"{pack_path.stem}-{digest[:16]}{suffix}.pickle"
+
+    def load(self, pack_path: Path, digest: str, part: Optional[str] = None) -> Optional[Dict]:
+        """读取缓存，缓存不存在或已失效时返回None"""
+        cache_path = self.path_for(pack_path, digest, part)
+        if not cache_path.exists():
+            return None
+
+        # 缓存中有大量小对象，载入期间暂停循环垃圾回收，避免反复扫描新建对象
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(cache_path, 'rb') as f:
+                compiled = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"读取内容包缓存失败，将重新编译: {e}")
+            return None
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        if compiled.get('version') != CACHE_FORMAT_VERSION or compiled.get('hash') != digest:
+            return None
+        return compiled
+
+    def store(self, pack_path: Path, digest: str, compiled: Dict, part: Optional[str] = None):
+        """写入缓存并删除同一内容包旧版本的缓存"""
+        cache_path = self.path_for(pack_path, digest, part)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"写入内容包缓存失败: {e}")
+            return
+
+        current_prefix = f"{pack_path.stem}-{digest[:16]}"
+        for stale_path in self.cache_dir.glob(f"{pack_path.stem}-*.pickle"):
+            if not stale_path.name.startswith(current_prefix):
+                try:
+                    stale_path.unlink()
+                except OSError:
+                    pass
+
+
+def load_compiled_pack(path: Union[str, Path], compile_pack, cache_dir: Union[str, Path, None] = None) -> Dict:
+    """加载已编译的内容包
+
+    Args:
+        path: 内容包文件路径
+        compile_pack: 编译函数，接收学习路线数据，返回可被pickle的已编译数据
+        cache_dir: 缓存目录，为None时不使用缓存
+
+    Returns:
+        已编译数据，包含 learning_path 等键
+    """
+    path = Path(path)
+    raw = path.read_bytes()
+    digest = content_hash(raw)
+
+    cache = ContentPackCache(cache_dir) if cache_dir is not None else None
+    if cache is not None:
+        compiled = cache.load(path, digest)
+        if compiled is not None:
+            logger.debug(f"使用内容包缓存: {path.name}")
+            return compiled
+
+    compiled = compile_pack(parse_content_pack(raw, path.suffix.lower()))
+    compiled['version'] = CACHE_FORMAT_VERSION
+    compiled['hash'] = digest
+
+    if cache is not None:
+        cache.store(path, digest, compiled)
+        logger.info(f"内容包已编译: {path.name}")
+    return compiled
@@ -2,419 +2,566 @@
 # -*- coding: utf-8 -*-
 """
 学习数据模型
-包含完整的数学建模学习路线数据
+加载学习路线内容包并提供按天数、周和关键词的查询
 """
 
-from typing import Dict, List, Optional
-from datetime import datetime
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from .task_record import StageRecord, Task, TaskView, WeekRecord, parse_estimated_time
+
+# 内容包、内存映射存储、搜索、相关任务、列式视图和版本比较在用到时才导入，
+# 不计入命令行工具和应用的启动时间
+if TYPE_CHECKING:
+    from .columns import TaskColumns
+    from .content_pack import ContentPackCache
+    from .mmap_store import CurriculumStore
+    from .related import RelatedTasks
+    from .search_index import IncrementalSearch, SearchIndex
+    from .versioning import ContentDiff, DaySignature
+
+def parse_estimated_minutes(estimated_time: str) -> int:
+    """将预计时间文本（如"2-3小时"、"30分钟"）解析为分钟数，区间取中值"""
+    return parse_estimated_time(estimated_time).minutes
 
 class LearningData:
     """学习数据管理类"""
     
-    def __init__(self):
-        self.learning_path = self._initialize_learning_path()
-        self.total_days = 140  # 20周 * 7天
-        self.total_weeks = 20
-        self.total_stages = 6
+    # 编译缓存中保存的预建索引（搜索索引和内容哈希载入较慢，不放入主缓存）
+    _INDEX_ATTRIBUTES = ('_day_stage', '_day_week', '_day_offset', '_week_days',
+                         '_tasks', '_indexed_days',
+                         '_stage_offsets', '_stage_positions', '_week_offsets', '_week_numbers')
     
-    def _initialize_learning_path(self) -> Dict:
-        """初始化学习路线数据"""
-        return {
-            "title": "数学建模完整学习路线",
-            "description": "20周系统性数学建模学习计划",
-            "total_weeks": 20,
-            "total_days": 140,
-            "stages": [
-                {
-                    "id": 1,
-                    "name": "Python基础与数据科学环境",
-                    "weeks": "第1-3周",
-                    "description": "掌握Python编程基础和数据科学工具",
-                    "color": "#4CAF50",
-                    "weeks_detail": [
-                        {
-                            "week": 1,
-                            "title": "Python编程基础",
-                            "days": [
-                                {
-                                    "day": 1,
-                                    "title": "Python环境搭建与基础语法",
-                                    "content": "安装Python、IDE配置、变量类型、基本运算",
-                                    "tasks": [
-                                        "安装Python 3.8+和Anaconda",
-                                        "配置Jupyter Notebook",
-                                        "学习变量、数据类型、运算符",
-                                        "练习基本输入输出"
-                                    ],
-                                    "estimated_time": "2-3小时",
-                                    "difficulty": "入门",
-                                    "code_examples": [
-                                        {
-                                            "title": "基础语法示例",
-                                            "code": "# Python基础语法\nname = 'Python学习者'\nage = 25\nprint(f'你好，{name}！你今年{age}岁。')\n\n# 基本运算\na, b = 10, 3\nprint(f'加法: {a + b}')\nprint(f'除法: {a / b}')\nprint(f'整除: {a // b}')\nprint(f'取余: {a % b}')"
-                                        }
-                                    ]
-                                },
-                                {
-                                    "day": 2,
-                                    "title": "控制结构与函数",
-                                    "content": "条件语句、循环结构、函数定义与调用",
-                                    "tasks": [
-                                        "掌握if-elif-else语句",
-                                        "学习for和while循环",
-                                        "函数定义、参数传递、返回值",
-                                        "练习递归函数"
-                                    ],
-                                    "estimated_time": "2-3小时",
-                                    "difficulty": "入门",
-                                    "code_examples": [
-                                        {
-                                            "title": "函数和循环示例",
-                                            "code": "# 函数定义\ndef fibonacci(n):\n    if n <= 1:\n        return n\n    return fibonacci(n-1) + fibonacci(n-2)\n\n# 循环应用\nfor i in range(10):\n    print(f'斐波那契数列第{i}项: {fibonacci(i)}')"
-                                        }
-                                    ]
-                                },
-                                {
-                                    "day": 3,
-                                    "title": "数据结构基础",
-                                    "content": "列表、元组、字典、集合的使用",
-                                    "tasks": [
-                                        "列表操作和方法",
-                                        "字典的创建和遍历",
-                                        "集合运算",
-                                        "数据结构选择原则"
-                                    ],
-                                    "estimated_time": "2-3小时",
-                                    "difficulty": "入门"
-                                },
-                                {
-                                    "day": 4,
-                                    "title": "文件操作与异常处理",
-                                    "content": "文件读写、异常捕获、模块导入",
-                                    "tasks": [
-                                        "文件的打开、读取、写入",
-                                        "try-except异常处理",
-                                        "模块导入和使用",
-                                        "包的概念和创建"
-                                    ],
-                                    "estimated_time": "2-3小时",
-                                    "difficulty": "入门"
-                                },
-                                {
-                                    "day": 5,
-                                    "title": "面向对象编程基础",
-                                    "content": "类与对象、继承、封装",
-                                    "tasks": [
-                                        "类的定义和实例化",
-                                        "属性和方法",
-                                        "继承和多态",
-                                        "特殊方法(__init__, __str__等)"
-                                    ],
-                                    "estimated_time": "3-4小时",
-                                    "difficulty": "基础"
-                                },
-                                {
-                                    "day": 6,
-                                    "title": "Python标准库",
-                                    "content": "常用标准库的使用",
-                                    "tasks": [
-                                        "math、random模块",
-                                        "datetime时间处理",
-                                        "os、sys系统操作",
-                                        "json数据处理"
-                                    ],
-                                    "estimated_time": "2-3小时",
-                                    "difficulty": "基础"
-                                },
-                                {
-                                    "day": 7,
-                                    "title": "Python基础综合练习",
-                                    "content": "综合运用所学知识完成小项目",
-                                    "tasks": [
-                                        "设计一个简单的学生管理系统",
-                                        "实现文件数据的读写",
-                                        "添加异常处理机制",
-                                        "代码重构和优化"
-                                    ],
-                                    "estimated_time": "3-4小时",
-                                    "difficulty": "基础"
-                                }
-                            ]
-                        },
-                        {
-                            "week": 2,
-                            "title": "NumPy数值计算",
-                            "days": [
-                                {
-                                    "day": 8,
-                                    "title": "NumPy基础与数组操作",
-                                    "content": "NumPy安装、数组创建、基本操作",
-                                    "tasks": [
-                                        "安装NumPy库",
-                                        "创建不同类型的数组",
-                                        "数组索引和切片",
-                                        "数组形状操作"
-                                    ],
-                                    "estimated_time": "2-3小时",
-                                    "difficulty": "基础"
-                                },
-                                {
-                                    "day": 9,
-                                    "title": "数组运算与函数",
-                                    "content": "数学运算、统计函数、线性代数",
-                                    "tasks": [
-                                        "元素级运算",
-                                        "统计函数应用",
-                                        "矩阵运算",
-                                        "广播机制理解"
-                                    ],
-                                    "estimated_time": "2-3小时",
-                                    "difficulty": "基础"
-                                },
-                                {
-                                    "day": 10,
-                                    "title": "高级数组操作",
-                                    "content": "条件筛选、排序、去重",
-                                    "tasks": [
-                                        "布尔索引",
-                                        "数组排序方法",
-                                        "唯一值处理",
-                                        "数组合并和分割"
-                                    ],
-                                    "estimated_time": "2-3小时",
-                                    "difficulty": "基础"
-                                },
-                                {
-                                    "day": 11,
-                                    "title": "随机数与概率分布",
-                                    "content": "随机数生成、概率分布采样",
-                                    "tasks": [
-                                        "随机数生成器",
-                                        "常见概率分布",
-                                        "蒙特卡洛方法入门",
-                                        "随机采样技术"
-                                    ],
-                                    "estimated_time": "2-3小时",
-                                    "difficulty": "基础"
-                                },
-                                {
-                                    "day": 12,
-                                    "title": "文件I/O与数据格式",
-                                    "content": "数据文件读写、格式转换",
-                                    "tasks": [
-                                        "CSV文件处理",
-                                        "二进制文件操作",
-                                        "数据格式转换",
-                                        "大文件处理技巧"
-                                    ],
-                                    "estimated_time": "2-3小时",
-                                    "difficulty": "基础"
-                                },
-                                {
-                                    "day": 13,
-                                    "title": "性能优化与内存管理",
-                                    "content": "代码优化、内存使用",
-                                    "tasks": [
-                                        "向量化操作",
-                                        "内存视图使用",
-                                        "性能测试方法",
-                                        "内存优化技巧"
-                                    ],
-                                    "estimated_time": "3-4小时",
-                                    "difficulty": "中级"
-                                },
-                                {
-                                    "day": 14,
-                                    "title": "NumPy综合应用",
-                                    "content": "实际问题解决、项目实践",
-                                    "tasks": [
-                                        "图像处理基础",
-                                        "信号处理入门",
-                                        "数值积分方法",
-                                        "线性方程组求解"
-                                    ],
-                                    "estimated_time": "3-4小时",
-                                    "difficulty": "中级"
-                                }
-                            ]
-                        }
-                    ]
-                },
-                {
-                    "id": 2,
-                    "name": "数据处理与分析",
-                    "weeks": "第4-8周",
-                    "description": "掌握Pandas数据处理和Matplotlib可视化",
-                    "color": "#2196F3",
-                    "weeks_detail": [
-                        {
-                            "week": 4,
-                            "title": "Pandas数据处理基础",
-                            "days": [
-                                {
-                                    "day": 22,
-                                    "title": "Pandas入门与数据结构",
-                                    "content": "Series和DataFrame基础操作",
-                                    "tasks": [
-                                        "安装Pandas库",
-                                        "Series创建和操作",
-                                        "DataFrame基础",
-                                        "数据索引和选择"
-                                    ],
-                                    "estimated_time": "2-3小时",
-                                    "difficulty": "基础"
-                                }
-                            ]
-                        }
-                    ]
-                },
-                {
-                    "id": 3,
-                    "name": "数学基础与优化",
-                    "weeks": "第9-12周",
-                    "description": "线性代数、微积分、优化理论",
-                    "color": "#FF9800",
-                    "weeks_detail": []
-                },
-                {
-                    "id": 4,
-                    "name": "机器学习基础",
-                    "weeks": "第13-16周",
-                    "description": "监督学习、无监督学习、模型评估",
-                    "color": "#9C27B0",
-                    "weeks_detail": []
-                },
-                {
-                    "id": 5,
-                    "name": "数学建模实战",
-                    "weeks": "第17-19周",
-                    "description": "经典建模问题、算法实现",
-                    "color": "#F44336",
-                    "weeks_detail": []
-                },
-                {
-                    "id": 6,
-                    "name": "项目实践与总结",
-                    "weeks": "第20周",
-                    "description": "综合项目、知识总结",
-                    "color": "#607D8B",
-                    "weeks_detail": []
-                }
-            ]
-        }
+    # 搜索索引在编译缓存中的附加部分名
+    _SEARCH_INDEX_PART = 'search'
     
-    def get_task_by_day(self, day: int) -> Optional[Dict]:
-        """根据天数获取任务"""
-        if day < 1 or day > self.total_days:
-            return None
+    # 内存映射存储（只读模式），普通模式下为None
+    _store: Optional['CurriculumStore'] = None
+    
+    # 标题增量搜索索引，在首次按标题搜索时构建
+    _title_search: Optional['IncrementalSearch'] = None
+    
+    # 统计分析用的列式视图，在首次使用时构建
+    _columns: Optional['TaskColumns'] = None
+    
+    # 相关任务索引，在首次查询相关任务时加载；磁盘缓存为 (缓存文件, 内容版本)
+    _related: Optional['RelatedTasks'] = None
+    _related_cache: Optional[Tuple[Path, str]] = None
+    
+    # 搜索索引的磁盘缓存 (编译缓存, 内容包路径, 内容哈希)，内容修改后置为None
+    _search_cache: Optional[Tuple['ContentPackCache', Path, str]] = None
+    
+    # 每天的内容哈希（第N天为下标N-1），在首次比较版本时计算
+    _day_hashes: Optional[List[str]] = None
+    
+    def __init__(self, learning_path: Optional[Dict] = None):
+        self.learning_path = learning_path or self._initialize_learning_path()
+        
+        # 构建扁平天数索引
+        self._build_day_index()
+        
+        # 搜索索引在首次搜索时构建
+        self._search_index: Optional['SearchIndex'] = None
+        
+        self._init_totals()
+    
+    def _init_totals(self):
+        """读取学习路线的总天数、周数和阶段数"""
+        self.total_days = self.learning_path.get("total_days", self._indexed_days)
+        self.total_weeks = self.learning_path.get("total_weeks", 20)
+        self.total_stages = len(self.learning_path["stages"])
+    
+    def _build_day_index(self):
+        """构建扁平天数索引
+        
+        按顺序为每一天记录其所在的阶段、周和天在原始数据中的偏移，
+        第N天对应数组中的第N-1项，使按天数查询成为O(1)操作。
+        同时为每一天构建一次不可变的任务记录，查询时按引用返回。
+        """
+        self._day_stage = array('I')   # 阶段在stages中的下标
+        self._day_week = array('I')    # 周在weeks_detail中的下标
+        self._day_offset = array('I')  # 天在days中的下标
+        self._week_days: Dict[int, List[int]] = {}  # 周序号 -> 该周包含的天数
+        self._tasks: List[Task] = []   # 第N天的任务记录
         
-        # 遍历所有阶段和周，找到对应的任务
         current_day = 1
-        for stage in self.learning_path["stages"]:
-            for week_detail in stage["weeks_detail"]:
-                for day_data in week_detail["days"]:
-                    if current_day == day:
-                        return {
-                            **day_data,
-                            "stage_id": stage["id"],
-                            "stage_name": stage["name"],
-                            "week": week_detail["week"],
-                            "week_title": week_detail["title"]
-                        }
+        for stage_index, stage in enumerate(self.learning_path["stages"]):
+            stage_record = StageRecord(stage["id"], stage["name"], stage_index)
+            for week_index, week_detail in enumerate(stage["weeks_detail"]):
+                week_record = WeekRecord(week_detail["week"], week_detail["title"], stage_record)
+                week_days = self._week_days.setdefault(week_detail["week"], [])
+                for day_offset, day_data in enumerate(week_detail["days"]):
+                    self._day_stage.append(stage_index)
+                    self._day_week.append(week_index)
+                    self._day_offset.append(day_offset)
+                    self._tasks.append(Task(current_day, day_data, week_record))
+                    week_days.append(current_day)
                     current_day += 1
         
-        return None
+        self._indexed_days = current_day - 1
+        
+        self._build_offset_tables(
+            (stage["id"], [(week_detail["week"], len(week_detail["days"])) for week_detail in stage["weeks_detail"]])
+            for stage in self.learning_path["stages"]
+        )
+    
+    def _build_offset_tables(self, stages):
+        """构建阶段和周的累计天数表
+        
+        _stage_offsets[i] 为第i个阶段之前的总天数，第i个阶段包含第
+        _stage_offsets[i]+1 到 _stage_offsets[i+1] 天；周表同理（按周在路线中出现的顺序）。
+        
+        Args:
+            stages: (阶段ID, [(周序号, 天数), ...]) 序列
+        """
+        self._stage_offsets = array('I', [0])
+        self._stage_positions: Dict[int, int] = {}  # 阶段ID -> 阶段下标
+        self._week_offsets = array('I', [0])
+        self._week_numbers = array('I')
+        
+        total = 0
+        for stage_index, (stage_id, weeks) in enumerate(stages):
+            self._stage_positions.setdefault(stage_id, stage_index)
+            for week_number, day_count in weeks:
+                total += day_count
+                self._week_numbers.append(week_number)
+                self._week_offsets.append(total)
+            self._stage_offsets.append(total)
+    
+    def _lookup_day(self, day: int) -> Optional[tuple]:
+        """根据天数查找阶段、周和天的原始数据"""
+        if day < 1 or day > self._indexed_days:
+            return None
+        
+        index = day - 1
+        stage = self.learning_path["stages"][self._day_stage[index]]
+        week_detail = stage["weeks_detail"][self._day_week[index]]
+        day_data = week_detail["days"][self._day_offset[index]]
+        return stage, week_detail, day_data
+    
+    def _initialize_learning_path(self) -> Dict:
+        """初始化学习路线数据（内置内容包）"""
+        from .content_pack import DEFAULT_CONTENT_PACK, read_content_pack
+        return read_content_pack(DEFAULT_CONTENT_PACK)
+    
+    @classmethod
+    def from_content_pack(
+        cls,
+        path: Union[str, Path, None] = None,
+        cache_dir: Union[str, Path, None] = 'data/cache',
+        memory_mapped: bool = False
+    ) -> 'LearningData':
+        """从内容包文件加载学习数据
+        
+        首次加载时解析内容包并构建天数索引，编译结果按内容哈希缓存；
+        之后内容包未变化时直接从缓存载入现成的天数索引和任务记录。
+        搜索索引在首次搜索时构建并单独缓存，之后的启动在首次搜索时才从缓存读取。
+        
+        Args:
+            path: 内容包路径（.json / .yaml），默认使用内置学习路线
+            cache_dir: 编译缓存目录，为None时不使用缓存
+            memory_mapped: 是否编译为内存映射存储并按需读取（适合很大的内容包）
+        """
+        from .content_pack import DEFAULT_CONTENT_PACK, ContentPackCache, load_compiled_pack
+        
+        path = Path(path or DEFAULT_CONTENT_PACK)
+        if memory_mapped:
+            from .mmap_store import open_content_pack_store
+            store = open_content_pack_store(path, cache_dir or 'data/cache')
+            data = cls.from_store(store)
+            data._related_cache = (Path(cache_dir or 'data/cache') / f"{path.stem}.related.pickle", store.path.stem)
+            return data
+        
+        compiled = load_compiled_pack(path, cls._compile, cache_dir)
+        
+        data = cls.__new__(cls)
+        data.learning_path = compiled['learning_path']
+        for name in cls._INDEX_ATTRIBUTES:
+            setattr(data, name, compiled[name])
+        data._search_index = None
+        data._init_totals()
+        if cache_dir is not None:
+            data._search_cache = (ContentPackCache(cache_dir), path, compiled['hash'])
+            data._related_cache = (Path(cache_dir) / f"{path.stem}.related.pickle", compiled['hash'])
+        return data
+    
+    @classmethod
+    def from_store(cls, store: Union['CurriculumStore', str, Path]) -> 'LearningData':
+        """从内存映射存储加载学习数据（只读）
+        
+        常驻内存的只有阶段/周信息和天数索引，任务内容在查询时才从映射中解码；
+        learning_path 中各阶段的 weeks_detail 在首次访问时加载，并由存储的LRU限制常驻数量。
+        """
+        from .mmap_store import CurriculumStore, MappedTaskList
+        
+        if not isinstance(store, CurriculumStore):
+            store = CurriculumStore(store)
+        
+        data = cls.__new__(cls)
+        data._store = store
+        data.learning_path = store.learning_path()
+        
+        data._day_stage = array('I')
+        data._day_week = array('I')
+        data._day_offset = array('I')
+        data._week_days = {}
+        day = 1
+        for stage_index, stage in enumerate(store.metadata["stages"]):
+            for week_index, week_detail in enumerate(stage["weeks_detail"]):
+                day_count = week_detail["day_count"]
+                data._day_stage.extend([stage_index] * day_count)
+                data._day_week.extend([week_index] * day_count)
+                data._day_offset.extend(range(day_count))
+                data._week_days.setdefault(week_detail["week"], []).extend(range(day, day + day_count))
+                day += day_count
+        
+        data._tasks = MappedTaskList(store)
+        data._indexed_days = len(store)
+        data._build_offset_tables(
+            (stage["id"], [(week_detail["week"], week_detail["day_count"]) for week_detail in stage["weeks_detail"]])
+            for stage in store.metadata["stages"]
+        )
+        data._search_index = None
+        data._init_totals()
+        return data
+    
+    def close(self):
+        """释放内存映射存储"""
+        if self._store is not None:
+            self._store.close()
+    
+    @classmethod
+    def _compile(cls, learning_path: Dict) -> Dict:
+        """构建学习路线的天数索引和任务记录，返回可缓存的编译结果"""
+        data = cls(learning_path)
+        compiled = {name: getattr(data, name) for name in cls._INDEX_ATTRIBUTES}
+        compiled['learning_path'] = learning_path
+        return compiled
+    
+    def get_task_by_day(self, day: int) -> Optional[TaskView]:
+        """根据天数获取任务（只读记录，按引用返回）"""
+        if day < 1 or day > self._indexed_days:
+            return None
+        return self._tasks[day - 1]
     
     def get_stage_by_day(self, day: int) -> Optional[Dict]:
         """根据天数获取阶段信息"""
-        task = self.get_task_by_day(day)
-        if task:
-            return {
-                "stage_id": task["stage_id"],
-                "stage_name": task["stage_name"],
-                "week": task["week"]
-            }
-        return None
+        if day < 1 or day > min(self.total_days, self._indexed_days):
+            return None
+        
+        task = self._tasks[day - 1]
+        return {
+            "stage_id": task.stage_id,
+            "stage_name": task.stage_name,
+            "week": task.week
+        }
+    
+    def get_stage_id(self, day: int) -> Optional[int]:
+        """获取天数所在阶段的ID"""
+        if day < 1 or day > self._indexed_days:
+            return None
+        return self._tasks[day - 1].stage_id
+    
+    def get_week_number(self, day: int) -> Optional[int]:
+        """获取天数所在的周序号"""
+        if day < 1 or day > self._indexed_days:
+            return None
+        return self._tasks[day - 1].week
+    
+    def get_estimated_minutes(self, day: int) -> int:
+        """获取天数对应任务的预计学习分钟数"""
+        if day < 1 or day > self._indexed_days:
+            return 0
+        return self._tasks[day - 1].estimate.minutes
+    
+    def get_indexed_days(self) -> int:
+        """获取已有任务内容的天数"""
+        return self._indexed_days
     
     def get_total_days(self) -> int:
         """获取总天数"""
         return self.total_days
     
+    def get_stage_day_range(self, stage_id: int) -> Optional[Tuple[int, int]]:
+        """获取阶段包含的天数范围 (第一天, 最后一天)，阶段没有任务时最后一天小于第一天"""
+        stage_index = self._stage_positions.get(stage_id)
+        if stage_index is None:
+            return None
+        return self._stage_offsets[stage_index] + 1, self._stage_offsets[stage_index + 1]
+    
     def get_stage_progress(self, stage_id: int, completed_days: int) -> Dict:
-        """获取阶段进度"""
-        stage = next((s for s in self.learning_path["stages"] if s["id"] == stage_id), None)
-        if not stage:
+        """获取阶段进度（按顺序完成到第 completed_days 天计算）"""
+        stage_index = self._stage_positions.get(stage_id)
+        if stage_index is None:
             return {}
         
-        # 计算该阶段的总天数和已完成天数
-        stage_total_days = sum(len(week["days"]) for week in stage["weeks_detail"])
-        
-        # 计算该阶段开始的天数
-        stage_start_day = 1
-        for s in self.learning_path["stages"]:
-            if s["id"] == stage_id:
-                break
-            stage_start_day += sum(len(week["days"]) for week in s["weeks_detail"])
-        
+        stage_start_day = self._stage_offsets[stage_index] + 1
+        stage_total_days = self._stage_offsets[stage_index + 1] - self._stage_offsets[stage_index]
         stage_completed = max(0, min(completed_days - stage_start_day + 1, stage_total_days))
         
         return {
             "stage_id": stage_id,
-            "stage_name": stage["name"],
+            "stage_name": self.learning_path["stages"][stage_index]["name"],
             "total_days": stage_total_days,
             "completed_days": stage_completed,
             "progress_rate": (stage_completed / stage_total_days) * 100 if stage_total_days > 0 else 0
         }
     
-    def search_tasks(self, keyword: str) -> List[Dict]:
-        """搜索任务"""
-        results = []
-        keyword_lower = keyword.lower()
+    def get_all_stage_progress(self, completed) -> List[Dict]:
+        """根据完成位图一次计算所有阶段的进度
         
-        current_day = 1
-        for stage in self.learning_path["stages"]:
-            for week_detail in stage["weeks_detail"]:
-                for day_data in week_detail["days"]:
-                    # 在标题、内容、任务中搜索
-                    if (keyword_lower in day_data["title"].lower() or
-                        keyword_lower in day_data["content"].lower() or
-                        any(keyword_lower in task.lower() for task in day_data["tasks"])):
-                        
-                        results.append({
-                            **day_data,
-                            "day": current_day,
-                            "stage_id": stage["id"],
-                            "stage_name": stage["name"],
-                            "week": week_detail["week"],
-                            "week_title": week_detail["title"]
-                        })
-                    current_day += 1
+        Args:
+            completed: 已完成天数的位图（需支持 count_range）
+        
+        Returns:
+            按阶段顺序排列的进度列表，字段同 get_stage_progress
+        """
+        progress = []
+        offsets = self._stage_offsets
+        for stage_index, stage in enumerate(self.learning_path["stages"]):
+            stage_total_days = offsets[stage_index + 1] - offsets[stage_index]
+            stage_completed = completed.count_range(offsets[stage_index] + 1, offsets[stage_index + 1])
+            progress.append({
+                "stage_id": stage["id"],
+                "stage_name": stage["name"],
+                "total_days": stage_total_days,
+                "completed_days": stage_completed,
+                "progress_rate": (stage_completed / stage_total_days) * 100 if stage_total_days > 0 else 0
+            })
+        return progress
+    
+    def get_all_week_progress(self, completed) -> Dict[int, Tuple[int, int]]:
+        """根据完成位图一次计算所有周的进度
+        
+        Args:
+            completed: 已完成天数的位图（需支持 count_range）
+        
+        Returns:
+            周序号 -> (已完成天数, 总天数)
+        """
+        progress: Dict[int, Tuple[int, int]] = {}
+        offsets = self._week_offsets
+        for week_index, week_number in enumerate(self._week_numbers):
+            done, total = progress.get(week_number, (0, 0))
+            progress[week_number] = (
+                done + completed.count_range(offsets[week_index] + 1, offsets[week_index + 1]),
+                total + offsets[week_index + 1] - offsets[week_index]
+            )
+        return progress
+    
+    @property
+    def search_index(self) -> 'SearchIndex':
+        """搜索索引（首次访问时从磁盘缓存读取，没有缓存时构建并写入缓存）"""
+        if self._search_index is None:
+            from .content_pack import CACHE_FORMAT_VERSION
+            from .search_index import SearchIndex, extract_fields
+            
+            cache, pack_path, digest = self._search_cache or (None, None, None)
+            cached = cache.load(pack_path, digest, self._SEARCH_INDEX_PART) if cache is not None else None
+            if cached is not None:
+                self._search_index = cached['search_index']
+            else:
+                self._search_index = SearchIndex.build(
+                    (task.day, extract_fields(task)) for task in self._tasks
+                )
+                if cache is not None:
+                    cache.store(pack_path, digest, {
+                        'search_index': self._search_index,
+                        'version': CACHE_FORMAT_VERSION,
+                        'hash': digest
+                    }, self._SEARCH_INDEX_PART)
+        return self._search_index
+    
+    def search_tasks(self, keyword: str, limit: Optional[int] = None) -> List[TaskView]:
+        """搜索任务
+        
+        在标题、内容、任务和代码示例中搜索，结果按相关度排序。
+        空关键词返回全部任务。
+        """
+        if not keyword.strip():
+            return self._tasks[:limit] if limit is not None else list(self._tasks)
+        
+        return [self._tasks[day - 1] for day, _ in self.search_index.search(keyword, limit)]
+    
+    def search_titles(self, text: str) -> Set[int]:
+        """按标题子串搜索（不区分大小写），返回匹配的天数集合
+        
+        适合边输入边搜索：查询文本在上一次查询后追加字符时只在上一次的结果中筛选。
+        """
+        if self._title_search is None:
+            from .search_index import IncrementalSearch
+            self._title_search = IncrementalSearch((task.day, task.title) for task in self._tasks)
+        return self._title_search.search(text)
+    
+    def get_related_tasks(self, day: int, limit: int = 5) -> List[TaskView]:
+        """获取与指定天内容最相似的任务（预先计算，查询为O(1)）
+        
+        每天只预先计算 related.DEFAULT_TOP_K 个相似任务，limit 超过该数量时抛出 ValueError。
+        """
+        from .related import DEFAULT_TOP_K, load_related_tasks
+        
+        if limit > DEFAULT_TOP_K:
+            raise ValueError(f"最多可获取 {DEFAULT_TOP_K} 个相关任务: limit={limit}")
+        
+        if day < 1 or day > self._indexed_days:
+            return []
         
-        return results
+        if self._related is None:
+            from .search_index import extract_fields
+            cache_path, content_version = self._related_cache or (None, None)
+            self._related = load_related_tasks(
+                ((task.day, extract_fields(task)) for task in self._tasks),
+                cache_path, content_version
+            )
+        return [self._tasks[other - 1] for other, _ in self._related.related(day)[:limit]
+                if other <= self._indexed_days]
+    
+    @property
+    def columns(self) -> 'TaskColumns':
+        """任务列式视图（天数、阶段、难度编码、预计分钟数），首次访问时构建"""
+        if self._columns is None:
+            from .columns import TaskColumns
+            self._columns = TaskColumns(self._tasks)
+        return self._columns
+    
+    def update_task(self, day: int, fields: Dict) -> bool:
+        """更新指定天的任务内容，并增量更新搜索索引"""
+        if self._store is not None:
+            return False  # 内存映射存储为只读
+        
+        found = self._lookup_day(day)
+        if not found:
+            return False
+        
+        from .search_index import extract_fields
+        from .versioning import task_content_hash
+        
+        day_data = found[2]
+        day_data.update(fields)
+        
+        # 任务记录不可变，替换为新记录
+        task = self._tasks[day - 1] = self._tasks[day - 1].replace(fields)
+        
+        if self._search_index is not None:
+            self._search_index.update_document(day, extract_fields(task))
+        if self._title_search is not None:
+            self._title_search.add(day, task.title)
+        if self._related is not None:
+            self._related.update_document(day, extract_fields(task))
+        if self._day_hashes is not None:
+            self._day_hashes[day - 1] = task_content_hash(task)
+        self._search_cache = None  # 磁盘缓存对应修改前的内容
+        self._columns = None
+        return True
+    
+    def get_day_hashes(self) -> List[str]:
+        """每天任务内容的哈希（第N天为下标N-1）"""
+        if self._day_hashes is None:
+            from .versioning import task_content_hash
+            self._day_hashes = [task_content_hash(task) for task in self._tasks]
+        return self._day_hashes
+    
+    def get_day_signatures(self) -> List['DaySignature']:
+        """每天的版本签名（稳定ID、标题、内容哈希），用于比较学习路线版本"""
+        from .versioning import task_signature
+        return [task_signature(task, content_hash)
+                for task, content_hash in zip(self._tasks, self.get_day_hashes())]
+    
+    def apply_content_update(self, learning_path: Dict) -> 'ContentDiff':
+        """切换到新版本的学习路线，只刷新受影响的索引项
+        
+        天数表和任务记录按新路线重建（只涉及定长数组和记录引用）；
+        已构建的搜索索引和相关任务索引只对删除、移动、新增和修改的天做增量修改，
+        不重新分词未修改的任务；标题搜索和列式视图在下次使用时重建。
+        
+        Args:
+            learning_path: 新版本的学习路线数据
+        
+        Returns:
+            新旧版本的差异，其中的天数对应关系可用于迁移学习进度
+        """
+        if self._store is not None:
+            raise ValueError("内存映射存储为只读，无法更新学习路线")
+        
+        from .search_index import extract_fields
+        from .versioning import diff_days
+        
+        old_signatures = self.get_day_signatures()
+        
+        self.learning_path = learning_path
+        self._build_day_index()
+        self._init_totals()
+        self._day_hashes = None
+        diff = diff_days(old_signatures, self.get_day_signatures())
+        
+        updated_days = sorted(set(diff.added) | set(diff.changed))
+        if self._search_index is not None:
+            for day in diff.removed:
+                self._search_index.remove_document(day)
+            self._search_index.renumber(diff.moved)
+            for day in updated_days:
+                self._search_index.update_document(day, extract_fields(self._tasks[day - 1]))
+        if self._related is not None:
+            self._related.apply_diff(
+                diff.moved, diff.removed,
+                {day: extract_fields(self._tasks[day - 1]) for day in updated_days}
+            )
+        self._related_cache = None  # 磁盘缓存对应旧版本，不再读写
+        self._search_cache = None
+        self._title_search = None
+        self._columns = None
+        return diff
     
     def get_all_stages(self) -> List[Dict]:
         """获取所有阶段信息"""
         return self.learning_path["stages"]
     
-    def get_week_tasks(self, week: int) -> List[Dict]:
+    def get_week_tasks(self, week: int) -> List[TaskView]:
         """获取指定周的所有任务"""
-        tasks = []
-        current_day = 1
+        return [self._tasks[day - 1] for day in self._week_days.get(week, [])]
+    
+    def iter_tasks(
+        self,
+        stage: Optional[int] = None,
+        week: Optional[int] = None,
+        start_day: Optional[int] = None
+    ) -> Iterator[TaskView]:
+        """按天数顺序逐个产出任务记录
+        
+        只在迭代到时才取出记录，提前结束迭代不会访问后面的任务；
+        分页可配合 itertools.islice，例如 islice(iter_tasks(stage=2), 20, 40)。
+        
+        Args:
+            stage: 只产出该阶段ID的任务
+            week: 只产出该周序号的任务
+            start_day: 从该天开始（含）
+        """
+        first_day, last_day = 1, self._indexed_days
+        if stage is not None:
+            day_range = self.get_stage_day_range(stage)
+            if day_range is None:
+                return
+            first_day, last_day = day_range
+        if start_day is not None:
+            first_day = max(first_day, start_day)
         
-        for stage in self.learning_path["stages"]:
-            for week_detail in stage["weeks_detail"]:
-                if week_detail["week"] == week:
-                    for day_data in week_detail["days"]:
-                        tasks.append({
-                            **day_data,
-                            "day": current_day,
-                            "stage_id": stage["id"],
-                            "stage_name": stage["name"],
-                            "week": week_detail["week"],
-                            "week_title": week_detail["title"]
-                        })
-                        current_day += 1
-                else:
-                    current_day += len(week_detail["days"])
-        
-        return tasks
\ No newline at end of file
+        if week is None:
+            days = range(first_day, last_day + 1)
+        else:
+            week_days = self._week_days.get(week, [])
+            days = week_days[bisect_left(week_days, first_day):]
+        
+        for day in days:
+            if day > last_day:
+                return
+            yield self._tasks[day - 1]
+    
+    def get_all_tasks(self) -> List[TaskView]:
+        """获取所有任务"""
+        return list(self.iter_tasks())
+    
+    def get_tasks_by_stage(self, stage_id: int) -> List[TaskView]:
+        """获取指定阶段的所有任务"""
+        return list(self.iter_tasks(stage=stage_id))
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+内存映射学习路线存储
+将学习路线编译为只读的二进制文件：定长的天数表加字符串堆，按需解码单条记录。
+只有 CurriculumStore.field_view 是零拷贝的（返回映射中的内存视图）；
+MappedTask 的字段（包括 title）每次读取都会从映射中解码出新的 str，不做缓存，
+需要反复读取同一字段时应由调用方保存解码结果。
+"""
+
+import json
+import mmap
+import os
+import struct
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from ..utils.logger import get_logger
+from .content_pack import content_hash, parse_content_pack
+from .task_record import StageRecord, TaskView, WeekRecord, _Immutable
+
+logger = get_logger(__name__)
+
+MAGIC = b'LCUR'
+FORMAT_VERSION = 2
+
+# 文件头：魔数、版本、保留、天数、元数据偏移/长度、天数表偏移、字符串堆偏移/长度
+_HEADER = struct.Struct('<4sHHIQQQQQ')
+
+# 天数表中每条记录保存的字段，每个字段为字符串堆中的 (偏移, 长度)
+_FIELDS = ('title', 'content', 'tasks', 'estimated_time', 'difficulty', 'code_examples', 'extra')
+_FIELD_INDEX = {name: index for index, name in enumerate(_FIELDS)}
+_JSON_FIELDS = frozenset(('tasks', 'code_examples', 'extra'))
+_DAY_RECORD = struct.Struct('<' + 'II' * len(_FIELDS))
+
+
+class MappedTask(_Immutable, TaskView):
+    """内存映射存储中的任务记录
+
+    只保存天数和所属周，字段在每次访问时从映射中解码（每次返回新的对象）。
+    """
+
+    __slots__ = ('_store', 'day', 'week_record')
+
+    def __init__(self, store: 'CurriculumStore', day: int, week_record: WeekRecord):
+        object.__setattr__(self, '_store', store)
+        object.__setattr__(self, 'day', day)
+        object.__setattr__(self, 'week_record', week_record)
+
+    @property
+    def title(self) -> str:
+        return self._store.read_field(self.day, 'title')
+
+    @property
+    def content(self) -> str:
+        return self._store.read_field(self.day, 'content')
+
+    @property
+    def tasks(self) -> Tuple[str, ...]:
+        return tuple(self._store.read_field(self.day, 'tasks') or ())
+
+    @property
+    def estimated_time(self) -> str:
+        return self._store.read_field(self.day, 'estimated_time')
+
+    @property
+    def difficulty(self) -> str:
+        return self._store.read_field(self.day, 'difficulty')
+
+    @property
+    def code_examples(self) -> Tuple[Dict, ...]:
+        return tuple(self._store.read_field(self.day, 'code_examples') or ())
+
+    @property
+    def extra(self) -> Optional[Dict]:
+        extra = self._store.read_field(self.day, 'extra')
+        if extra:
+            extra.pop('day', None)
+        return extra or None
+
+
+class MappedTaskList(Sequence):
+    """按天数顺序排列的任务记录序列（第N天为下标N-1），访问时才构建记录"""
+
+    def __init__(self, store: 'CurriculumStore'):
+        self._store = store
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._store.task(index + 1)
+
+
+class LazyStage(Mapping):
+    """按需加载的阶段
+
+    阶段元数据（id、name、color等）常驻内存；访问 weeks_detail 时才从存储中
+    解码该阶段的周和天数据，解码结果由存储的LRU缓存管理。
+    """
+
+    __slots__ = ('_store', '_index', '_metadata')
+
+    def __init__(self, store: 'CurriculumStore', index: int, metadata: Dict):
+        self._store = store
+        self._index = index
+        self._metadata = metadata
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "weeks_detail":
+            return self._store.stage_body(self._index)
+        return self._metadata[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._metadata
+        yield "weeks_detail"
+
+    def __len__(self) -> int:
+        return len(self._metadata) + 1
+
+    def __contains__(self, key: object) -> bool:
+        # 不经过 __getitem__，避免只为判断键是否存在而解码 weeks_detail
+        return key == "weeks_detail" or key in self._metadata
+
+    def __repr__(self) -> str:
+        return f"LazyStage(id={self._metadata.get('id')}, name={self._metadata.get('name')!r})"
+
+
+class CurriculumStore:
+    """只读的内存映射学习路线存储
+
+    文件布局：文件头、元数据（学习路线、阶段和周的信息，JSON）、
+    定长天数表（每天每个字段一个 (偏移, 长度)）、UTF-8字符串堆。
+    打开时只解析文件头和元数据；按天数查询时只解码该天的记录，
+    field_view 直接返回映射中的内存视图，不复制数据。
+    各阶段的周和天数据在首次访问时整体解码，最多保留 stage_cache_size 个阶段。
+    """
+
+    def __init__(self, path: Union[str, Path], stage_cache_size: int = 4):
+        self.path = Path(path)
+        self.stage_cache_size = max(1, stage_cache_size)
+        self._stage_bodies: 'OrderedDict[int, List[Dict]]' = OrderedDict()
+        self._file = open(self.path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        self._view = memoryview(self._mmap)
+
+        (magic, version, _, self._day_count, meta_offset, meta_length,
+         self._table_offset, self._heap_offset, _) = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"不支持的学习路线存储格式: {self.path}")
+
+        self.metadata: Dict = json.loads(bytes(self._view[meta_offset:meta_offset + meta_length]).decode('utf-8'))
+        self._build_records()
+
+    def _build_records(self):
+        """根据元数据构建阶段和周记录，以及第N天所属周的下标"""
+        self.stage_records: List[StageRecord] = []
+        self.week_records: List[WeekRecord] = []
+        self.week_first_days: List[int] = []
+        self._stage_weeks: List[range] = []  # 阶段下标 -> 周下标范围
+        self._day_week = array('I')
+
+        day = 1
+        for stage_index, stage in enumerate(self.metadata["stages"]):
+            stage_record = StageRecord(stage["id"], stage["name"], stage_index)
+            self.stage_records.append(stage_record)
+            first_week = len(self.week_records)
+            self._stage_weeks.append(range(first_week, first_week + len(stage["weeks_detail"])))
+            for week_detail in stage["weeks_detail"]:
+                week_index = len(self.week_records)
+                self.week_records.append(WeekRecord(week_detail["week"], week_detail["title"], stage_record))
+                self.week_first_days.append(day)
+                self._day_week.extend(array('I', [week_index]) * week_detail["day_count"])
+                day += week_detail["day_count"]
+
+        if day - 1 != self._day_count:
+            self.close()
+            raise ValueError(f"学习路线存储已损坏: {self.path}")
+
+    def __len__(self) -> int:
+        return self._day_count
+
+    def field_view(self, day: int, name: str) -> memoryview:
+        """指定天某个字段的原始UTF-8数据（映射中的内存视图，不复制）"""
+        if day < 1 or day > self._day_count:
+            raise IndexError(day)
+        position = self._table_offset + (day - 1) * _DAY_RECORD.size + _FIELD_INDEX[name] * 8
+        offset, length = struct.unpack_from('<II', self._mmap, position)
+        start = self._heap_offset + offset
+        return self._view[start:start + length]
+
+    def read_field(self, day: int, name: str) -> Any:
+        """解码指定天的某个字段"""
+        view = self.field_view(day, name)
+        if name in _JSON_FIELDS:
+            return json.loads(str(view, 'utf-8')) if len(view) else None
+        return str(view, 'utf-8')
+
+    def read_day(self, day: int) -> Dict:
+        """解码指定天的全部字段为原始数据字典"""
+        day_data = {}
+        for name in _FIELDS:
+            value = self.read_field(day, name)
+            if name == 'extra':
+                day_data.update(value or {})
+            elif value is not None:
+                day_data[name] = value
+        return day_data
+
+    def task(self, day: int) -> MappedTask:
+        """指定天的任务记录"""
+        if day < 1 or day > self._day_count:
+            raise IndexError(day)
+        return MappedTask(self, day, self.week_records[self._day_week[day - 1]])
+
+    def stage_body(self, stage_index: int) -> List[Dict]:
+        """解码阶段的 weeks_detail（最近使用的若干阶段保留在内存中）"""
+        body = self._stage_bodies.get(stage_index)
+        if body is not None:
+            self._stage_bodies.move_to_end(stage_index)
+            return body
+
+        body = []
+        stage_meta = self.metadata["stages"][stage_index]
+        for week_meta, week_index in zip(stage_meta["weeks_detail"], self._stage_weeks[stage_index]):
+            week = {key: value for key, value in week_meta.items() if key != "day_count"}
+            first_day = self.week_first_days[week_index]
+            week["days"] = [self.read_day(day) for day in range(first_day, first_day + week_meta["day_count"])]
+            body.append(week)
+
+        self._stage_bodies[stage_index] = body
+        while len(self._stage_bodies) > self.stage_cache_size:
+            self._stage_bodies.popitem(last=False)
+        return body
+
+    def resident_stages(self) -> List[int]:
+        """当前已解码并保留在内存中的阶段下标"""
+        return list(self._stage_bodies)
+
+    def learning_path(self) -> Dict:
+        """学习路线结构（阶段元数据常驻，weeks_detail 按需加载）"""
+        learning_path = {key: value for key, value in self.metadata.items() if key != "stages"}
+        learning_path["stages"] = [
+            LazyStage(self, stage_index, {key: value for key, value in stage.items() if key != "weeks_detail"})
+            for stage_index, stage in enumerate(self.metadata["stages"])
+        ]
+        return learning_path
+
+    def close(self):
+        """关闭映射（之前返回的内存视图需先释放）"""
+        if self._mmap is None:
+            return
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+        self._mmap = None
+        self._stage_bodies.clear()
+
+    @staticmethod
+    def build(learning_path: Dict, path: Union[str, Path]):
+        """将学习路线编译为存储文件"""
+        path = Path(path)
+        heap = bytearray()
+        interned: Dict[bytes, int] = {}
+
+        def put(data: bytes) -> Tuple[int, int]:
+            # 重复出现的字符串（难度、预计时间等）只保存一份
+            if not data:
+                return 0, 0
+            offset = interned.get(data)
+            if offset is None:
+                offset = interned[data] = len(heap)
+                heap.extend(data)
+            return offset, len(data)
+
+        metadata = {key: value for key, value in learning_path.items() if key != "stages"}
+        metadata["stages"] = []
+        table = bytearray()
+        day_count = 0
+        for stage in learning_path["stages"]:
+            stage_meta = {key: value for key, value in stage.items() if key != "weeks_detail"}
+            stage_meta["weeks_detail"] = []
+            for week_detail in stage["weeks_detail"]:
+                week_meta = {key: value for key, value in week_detail.items() if key != "days"}
+                week_meta["day_count"] = len(week_detail["days"])
+                stage_meta["weeks_detail"].append(week_meta)
+
+                for day_data in week_detail["days"]:
+                    extra = {key: value for key, value in day_data.items() if key not in _FIELDS}
+                    record = []
+                    for name in _FIELDS:
+                        value = extra if name == 'extra' else day_data.get(name)
+                        if name in _JSON_FIELDS:
+                            data = json.dumps(value, ensure_ascii=False).encode('utf-8') if value else b''
+                        else:
+                            data = (value or '').encode('utf-8')
+                        record.extend(put(data))
+                    table += _DAY_RECORD.pack(*record)
+                    day_count += 1
+            metadata["stages"].append(stage_meta)
+
+        meta_bytes = json.dumps(metadata, ensure_ascii=False).encode('utf-8')
+        meta_offset = _HEADER.size
+        table_offset = meta_offset + len(meta_bytes)
+        heap_offset = table_offset + len(table)
+        header = _HEADER.pack(MAGIC, FORMAT_VERSION, 0, day_count, meta_offset, len(meta_bytes),
+                              table_offset, heap_offset, len(heap))
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            f.write(meta_bytes)
+            f.write(table)
+            f.write(heap)
+        os.replace(tmp_path, path)
+
+
+def open_content_pack_store(
+    pack_path: Union[str, Path],
+    cache_dir: Union[str, Path] = 'data/cache',
+    stage_cache_size: int = 4
+) -> CurriculumStore:
+    """打开内容包对应的内存映射存储，内容包变化（按内容哈希判断）时重新编译"""
+    pack_path = Path(pack_path)
+    raw = pack_path.read_bytes()
+    digest = content_hash(raw)
+
+    cache_dir = Path(cache_dir)
+    store_path = cache_dir / f"{pack_path.stem}-{digest[:16]}.v{FORMAT_VERSION}.lcur"
+    if not store_path.exists():
+        CurriculumStore.build(parse_content_pack(raw, pack_path.suffix.lower()), store_path)
+        logger.info(f"内容包已编译为内存映射存储: {store_path.name}")
+
+        for stale_path in cache_dir.glob(f"{pack_path.stem}-*.lcur"):
+            if stale_path != store_path:
+                try:
+                    stale_path.unlink()
+                except OSError:
+                    pass
+
+    return CurriculumStore(store_path, stage_cache_size)
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+相关任务推荐
+基于标题、内容和任务列表的稀疏TF-IDF向量计算任务间的余弦相似度，
+为每个任务预先计算最相似的前K个任务并缓存到磁盘，内容包变化时增量更新。
+
+增量更新只重算变化任务的行向量和倒排项，IDF权重沿用上次全量构建时的值；
+累计变化的任务超过 FULL_REBUILD_RATIO 后全量重建，刷新所有任务的IDF权重。
+"""
+
+import hashlib
+import heapq
+import math
+import os
+import pickle
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from ..utils.logger import get_logger
+from .search_index import FIELD_WEIGHTS, tokenize
+
+logger = get_logger(__name__)
+
+# 缓存格式版本，向量或相似度的计算方式变化时递增
+FORMAT_VERSION = 1
+
+# 参与相似度计算的字段
+RELATED_FIELDS = ('title', 'content', 'tasks')
+
+# 出现在超过该比例任务中的词项区分度太低，不参与相似度计算
+MAX_DOCUMENT_FREQUENCY = 0.5
+
+# 自上次全量构建以来变化的任务超过该比例时全量重建（同时刷新全部任务的IDF权重）
+FULL_REBUILD_RATIO = 0.2
+
+# 每个任务预先计算的相似任务数，查询时最多返回这么多
+DEFAULT_TOP_K = 5
+
+Neighbors = Tuple[Tuple[int, float], ...]
+
+
+def _document_hash(fields: Dict[str, str]) -> str:
+    """任务文本的内容哈希"""
+    digest = hashlib.blake2b(digest_size=8)
+    for field in RELATED_FIELDS:
+        digest.update(fields.get(field, '').encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _term_frequencies(fields: Dict[str, str]) -> Dict[str, float]:
+    """按字段权重累加的词频（中文只使用二元组）"""
+    term_freqs: Dict[str, float] = {}
+    for field in RELATED_FIELDS:
+        weight = FIELD_WEIGHTS.get(field, 1.0)
+        for token in tokenize(fields.get(field, ''), for_query=True):
+            term_freqs[token] = term_freqs.get(token, 0.0) + weight
+    return term_freqs
+
+
+class RelatedTasks:
+    """相关任务索引
+
+    稀疏矩阵按行保存：每个任务一行 {词项: TF-IDF权重}（L2归一化），
+    另按列保存倒排表，一行与全部任务的相似度只需遍历该行词项的倒排表。
+    查询时直接读取预先计算好的前K个相似任务。
+    矩阵不写入缓存，从缓存载入后在首次更新时构建。
+    """
+
+    def __init__(self, top_k: int = DEFAULT_TOP_K):
+        self.top_k = top_k
+        self.content_version: Optional[str] = None
+
+        self._hashes: Dict[int, str] = {}                 # 天数 -> 文本哈希
+        self._term_freqs: Dict[int, Dict[str, float]] = {}  # 天数 -> 词频
+        self._document_freqs: Dict[str, int] = {}          # 词项 -> 包含该词项的任务数
+        self._neighbors: Dict[int, Neighbors] = {}
+        self._stale_rows = 0  # 自上次全量构建以来变化的任务数
+
+        # 上次全量构建的IDF（不参与计算的高频词项为0）、文档数，以及当前的行向量和倒排表
+        self._idf: Dict[str, float] = {}
+        self._idf_document_count = 0
+        self._rows: Optional[Dict[int, Dict[str, float]]] = None
+        self._columns: Dict[str, Dict[int, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def related(self, day: int) -> Neighbors:
+        """获取与指定天最相似的任务：((天数, 相似度), ...)，按相似度降序"""
+        return self._neighbors.get(day, ())
+
+    def renumber(self, mapping: Dict[int, int]):
+        """修改天数（旧天数 -> 新天数），相似度不变，不重新分词和计算"""
+        attributes = [self._hashes, self._term_freqs, self._neighbors]
+        if self._rows is not None:
+            attributes.append(self._rows)
+            moved_postings = [
+                (term, mapping[day], self._columns[term].pop(day))
+                for day in mapping if day in self._rows
+                for term in self._rows[day]
+            ]
+            for term, day, weight in moved_postings:
+                self._columns[term][day] = weight
+
+        for attribute in attributes:
+            moved = [(mapping[day], attribute.pop(day)) for day in list(attribute) if day in mapping]
+            attribute.update(moved)
+
+        for day, neighbors in self._neighbors.items():
+            if any(other in mapping for other, _ in neighbors):
+                self._neighbors[day] = tuple((mapping.get(other, other), score) for other, score in neighbors)
+
+    def apply_diff(self, moved: Dict[int, int], removed: Iterable[int],
+                   documents: Dict[int, Dict[str, str]]) -> int:
+        """按学习路线的版本差异更新
+
+        删除的天先移到负数天数以免与移动后的天冲突，然后修改天数，
+        最后对新增和修改的任务统一重算受影响的行。
+
+        Args:
+            moved: 旧天数 -> 新天数
+            removed: 删除的天（旧天数）
+            documents: 新增和修改的任务（新天数 -> 文本字段）
+        """
+        parked = {day: -day for day in removed if day in self._hashes}
+        self.renumber({**moved, **parked})
+        return self._apply(documents, list(parked.values()))
+
+    def _add_terms(self, day: int, term_freqs: Dict[str, float]):
+        self._term_freqs[day] = term_freqs
+        for term in term_freqs:
+            self._document_freqs[term] = self._document_freqs.get(term, 0) + 1
+
+    def _remove_terms(self, day: int):
+        for term in self._term_freqs.pop(day, {}):
+            count = self._document_freqs[term] - 1
+            if count:
+                self._document_freqs[term] = count
+            else:
+                del self._document_freqs[term]
+
+    def _term_idf(self, term: str) -> float:
+        """词项的IDF权重，上次全量构建之后才出现的词项按当时的文档数计算"""
+        idf = self._idf.get(term)
+        if idf is not None:
+            return idf
+
+        document_count = self._idf_document_count
+        frequency = self._document_freqs.get(term, 0)
+        if frequency > max(1, int(document_count * MAX_DOCUMENT_FREQUENCY)) and document_count >= 4:
+            return 0.0
+        return math.log((1 + document_count) / (1 + frequency)) + 1
+
+    def _set_row(self, day: int):
+        """按当前IDF计算一行的TF-IDF向量并写入行和倒排表"""
+        self._remove_row(day)
+        row = {}
+        for term, freq in self._term_freqs[day].items():
+            idf = self._term_idf(term)
+            if idf and freq > 0:
+                row[term] = (1 + math.log(freq)) * idf
+        norm = math.sqrt(sum(weight * weight for weight in row.values()))
+        if not norm:
+            row = {}
+        for term in row:
+            row[term] /= norm
+            self._columns.setdefault(term, {})[day] = row[term]
+        self._rows[day] = row
+
+    def _remove_row(self, day: int):
+        for term in self._rows.pop(day, {}):
+            postings = self._columns[term]
+            del postings[day]
+            if not postings:
+                del self._columns[term]
+
+    def _build_matrix(self):
+        """按当前词频全量计算IDF、TF-IDF行向量和倒排表"""
+        document_count = len(self._term_freqs)
+        max_frequency = max(1, int(document_count * MAX_DOCUMENT_FREQUENCY))
+        self._idf = {
+            term: math.log((1 + document_count) / (1 + frequency)) + 1
+            if frequency <= max_frequency or document_count < 4 else 0.0
+            for term, frequency in self._document_freqs.items()
+        }
+        self._idf_document_count = document_count
+        self._stale_rows = 0
+
+        self._rows = {}
+        self._columns = {}
+        for day in self._term_freqs:
+            self._set_row(day)
+
+    def _scores(self, day: int) -> Dict[int, float]:
+        """一行与其它所有任务的余弦相似度（只包含相似度大于0的任务）"""
+        scores: Dict[int, float] = {}
+        for term, weight in self._rows.get(day, {}).items():
+            for other, other_weight in self._columns[term].items():
+                if other != day:
+                    scores[other] = scores.get(other, 0.0) + weight * other_weight
+        return scores
+
+    def _top(self, scores: Dict[int, float]) -> Neighbors:
+        best = heapq.nlargest(self.top_k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return tuple((day, round(score, 6)) for day, score in best)
+
+    def sync(self, documents: Iterable[Tuple[int, Dict[str, str]]]) -> int:
+        """与当前学习路线同步
+
+        只对文本发生变化、新增或删除的任务重新分词，相似任务列表的更新见 _apply。
+
+        Args:
+            documents: (天数, 文本字段) 序列，字段见 extract_fields
+
+        Returns:
+            重新计算了相似任务列表的任务数
+        """
+        changed: Dict[int, Dict[str, str]] = {}
+        seen: Set[int] = set()
+        for day, fields in documents:
+            seen.add(day)
+            if self._hashes.get(day) != _document_hash(fields):
+                changed[day] = fields
+
+        removed = [day for day in self._hashes if day not in seen]
+        return self._apply(changed, removed)
+
+    def update_document(self, day: int, fields: Dict[str, str]) -> int:
+        """更新单个任务的文本"""
+        if self._hashes.get(day) == _document_hash(fields):
+            return 0
+        return self._apply({day: fields}, [])
+
+    def _apply(self, changed: Dict[int, Dict[str, str]], removed: List[int]) -> int:
+        """应用文本变化并更新相似任务列表
+
+        只重算变化任务的行向量和倒排项（未变化的行沿用上次全量构建时的IDF），
+        以及受影响任务的相似任务列表：变化的任务本身、原列表中引用了变化或删除任务的任务，
+        以及变化任务可以挤进其前K名的任务。首次构建或累计变化比例较大时全量重建。
+        """
+        if not changed and not removed:
+            return 0
+
+        for day in removed:
+            self._remove_terms(day)
+            del self._hashes[day]
+        for day, fields in changed.items():
+            self._remove_terms(day)
+            self._add_terms(day, _term_frequencies(fields))
+            self._hashes[day] = _document_hash(fields)
+
+        stale_rows = self._stale_rows + len(changed) + len(removed)
+        if not self._neighbors or stale_rows > len(self._hashes) * FULL_REBUILD_RATIO:
+            self._build_matrix()
+            self._neighbors = {day: self._top(self._scores(day)) for day in self._rows}
+            return len(self._rows)
+
+        if self._rows is None:
+            self._build_matrix()  # 从缓存载入后首次更新，矩阵按当前内容构建
+        else:
+            for day in removed:
+                self._remove_row(day)
+            for day in changed:
+                self._set_row(day)
+            self._stale_rows = stale_rows
+
+        for day in removed:
+            self._neighbors.pop(day, None)
+
+        affected = set(changed) | set(removed)
+        dirty: Set[int] = set(changed)
+        for day, neighbors in self._neighbors.items():
+            if any(other in affected for other, _ in neighbors):
+                dirty.add(day)
+        for day in changed:
+            for other, score in self._scores(day).items():
+                neighbors = self._neighbors.get(other, ())
+                if len(neighbors) < self.top_k or score > neighbors[-1][1]:
+                    dirty.add(other)
+
+        for day in dirty:
+            self._neighbors[day] = self._top(self._scores(day))
+        return len(dirty)
+
+    def save(self, path: Union[str, Path]):
+        """写入缓存文件"""
+        path = Path(path)
+        state = {
+            'version': FORMAT_VERSION,
+            'top_k': self.top_k,
+            'content_version': self.content_version,
+            'hashes': self._hashes,
+            'term_freqs': self._term_freqs,
+            'neighbors': self._neighbors,
+            'stale_rows': self._stale_rows
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"写入相关任务缓存失败: {e}")
+
+    @classmethod
+    def load(cls, path: Union[str, Path], top_k: int = DEFAULT_TOP_K) -> Optional['RelatedTasks']:
+        """读取缓存文件，缓存不存在或格式不匹配时返回None"""
+        path = Path(path)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                state = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"读取相关任务缓存失败，将重新构建: {e}")
+            return None
+
+        if state.get('version') != FORMAT_VERSION or state.get('top_k') != top_k:
+            return None
+
+        related = cls(top_k)
+        related.content_version = state['content_version']
+        related._hashes = state['hashes']
+        for day, term_freqs in state['term_freqs'].items():
+            related._add_terms(day, term_freqs)
+        related._neighbors = state['neighbors']
+        related._stale_rows = state.get('stale_rows', 0)
+        return related
+
+
+def load_related_tasks(
+    documents: Iterable[Tuple[int, Dict[str, str]]],
+    cache_path: Union[str, Path, None] = None,
+    content_version: Optional[str] = None,
+    top_k: int = DEFAULT_TOP_K
+) -> RelatedTasks:
+    """加载相关任务索引
+
+    缓存的内容版本与当前一致时直接使用缓存，否则在缓存的基础上增量同步后写回。
+
+    Args:
+        documents: (天数, 文本字段) 序列，只在需要同步时才遍历
+        cache_path: 缓存文件路径，为None时只在内存中构建
+        content_version: 学习路线的内容版本（如内容包哈希）
+        top_k: 每个任务保留的相似任务数
+    """
+    related = RelatedTasks.load(cache_path, top_k) if cache_path is not None else None
+    if related is not None and content_version is not None and related.content_version == content_version:
+        return related
+
+    related = related or RelatedTasks(top_k)
+    updated = related.sync(documents)
+    related.content_version = content_version
+    logger.info(f"相关任务索引已更新: {updated}/{len(related)} 个任务")
+
+    if cache_path is not None:
+        related.save(cache_path)
+    return related
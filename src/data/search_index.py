@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+学习任务搜索索引
+基于字符二元组分词的倒排索引，支持BM25排序和增量更新
+"""
+
+import math
+import re
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# 中日韩统一表意文字及常用扩展区
+_CJK_PATTERN = r'㐀-䶿一-鿿豈-﫿'
+_TOKEN_RE = re.compile(rf'[{_CJK_PATTERN}]+|[a-z0-9_]+')
+_CJK_RE = re.compile(rf'[{_CJK_PATTERN}]')
+
+# 各字段的词频权重
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "content": 1.5,
+    "tasks": 1.0,
+    "code_examples": 0.5
+}
+
+
+def tokenize(text: str, for_query: bool = False) -> List[str]:
+    """分词
+
+    中文连续片段切分为重叠的字符二元组，索引时额外保留单字以支持单字查询；
+    英文和数字按单词切分。
+
+    Args:
+        text: 待分词文本
+        for_query: 是否为查询分词（查询时中文只使用二元组，单字片段除外）
+
+    Returns:
+        词项列表
+    """
+    tokens = []
+    for run in _TOKEN_RE.findall(text.lower()):
+        if not _CJK_RE.match(run):
+            tokens.append(run)
+            continue
+
+        if len(run) == 1:
+            tokens.append(run)
+            continue
+
+        if not for_query:
+            tokens.extend(run)
+        tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+
+    return tokens
+
+
+def extract_fields(day_data: Dict) -> Dict[str, str]:
+    """提取任务中参与索引的文本字段"""
+    code_examples = day_data.get("code_examples", [])
+    return {
+        "title": day_data.get("title", ""),
+        "content": day_data.get("content", ""),
+        "tasks": "\n".join(day_data.get("tasks", [])),
+        "code_examples": "\n".join(
+            f"{example.get('title', '')}\n{example.get('code', '')}" for example in code_examples
+        )
+    }
+
+
+class SearchIndex:
+    """倒排索引搜索引擎
+
+    文档以天数为ID，词项频率按字段权重累加，查询时对所有查询词项取交集
+    并按BM25得分排序。增删文档只修改该文档涉及的倒排表。
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+        self._postings: Dict[str, Dict[int, float]] = {}  # 词项 -> {文档ID: 加权词频}
+        self._doc_terms: Dict[int, Dict[str, float]] = {}  # 文档ID -> {词项: 加权词频}
+        self._doc_lengths: Dict[int, float] = {}
+        self._total_length = 0.0
+
+        # 英文词项前缀匹配使用的有序词表，在词表变化后懒重建
+        self._sorted_terms: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, doc_id: int) -> bool:
+        return doc_id in self._doc_terms
+
+    def add_document(self, doc_id: int, fields: Dict[str, str]):
+        """添加文档，若文档已存在则替换"""
+        if doc_id in self._doc_terms:
+            self.remove_document(doc_id)
+
+        term_freqs: Dict[str, float] = {}
+        for field, text in fields.items():
+            weight = FIELD_WEIGHTS.get(field, 1.0)
+            for token in tokenize(text):
+                term_freqs[token] = term_freqs.get(token, 0.0) + weight
+
+        for term, freq in term_freqs.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._sorted_terms = None
+            postings[doc_id] = freq
+
+        doc_length = sum(term_freqs.values())
+        self._doc_terms[doc_id] = term_freqs
+        self._doc_lengths[doc_id] = doc_length
+        self._total_length += doc_length
+
+    def remove_document(self, doc_id: int) -> bool:
+        """删除文档"""
+        term_freqs = self._doc_terms.pop(doc_id, None)
+        if term_freqs is None:
+            return False
+
+        for term in term_freqs:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                self._sorted_terms = None
+
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        return True
+
+    def update_document(self, doc_id: int, fields: Dict[str, str]):
+        """更新文档（增量重建该文档的倒排项）"""
+        self.add_document(doc_id, fields)
+
+    def renumber(self, mapping: Dict[int, int]):
+        """修改文档ID（旧ID -> 新ID），只改动这些文档涉及的倒排项，不重新分词"""
+        moved = []
+        for old_id, new_id in mapping.items():
+            term_freqs = self._doc_terms.pop(old_id, None)
+            if term_freqs is None:
+                continue
+            for term in term_freqs:
+                del self._postings[term][old_id]
+            moved.append((new_id, term_freqs, self._doc_lengths.pop(old_id)))
+
+        for new_id, term_freqs, doc_length in moved:
+            for term, freq in term_freqs.items():
+                self._postings[term][new_id] = freq
+            self._doc_terms[new_id] = term_freqs
+            self._doc_lengths[new_id] = doc_length
+
+    def _expand_term(self, term: str) -> List[str]:
+        """展开查询词项：中文精确匹配，英文词项按前缀匹配"""
+        if _CJK_RE.match(term):
+            return [term] if term in self._postings else []
+
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+
+        expanded = []
+        index = bisect_left(self._sorted_terms, term)
+        while index < len(self._sorted_terms) and self._sorted_terms[index].startswith(term):
+            expanded.append(self._sorted_terms[index])
+            index += 1
+        return expanded
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """搜索文档
+
+        Args:
+            query: 查询文本
+            limit: 最多返回的结果数量
+
+        Returns:
+            按BM25得分降序排列的 (文档ID, 得分) 列表
+        """
+        query_terms = list(dict.fromkeys(tokenize(query, for_query=True)))
+        if not query_terms or not self._doc_terms:
+            return []
+
+        doc_count = len(self._doc_terms)
+        avg_length = self._total_length / doc_count if doc_count else 0.0
+
+        scores: Optional[Dict[int, float]] = None
+        for query_term in query_terms:
+            term_scores: Dict[int, float] = {}
+            for term in self._expand_term(query_term):
+                postings = self._postings[term]
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, freq in postings.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[doc_id] / avg_length)
+                    score = idf * freq * (self.k1 + 1) / (freq + norm)
+                    term_scores[doc_id] = term_scores.get(doc_id, 0.0) + score
+
+            # 所有查询词项都必须命中
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {doc_id: score + term_scores[doc_id]
+                          for doc_id, score in scores.items() if doc_id in term_scores}
+
+            if not scores:
+                return []
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit] if limit is not None else ranked
+
+    @classmethod
+    def build(cls, documents: Iterable[Tuple[int, Dict[str, str]]]) -> 'SearchIndex':
+        """从 (文档ID, 字段) 序列批量构建索引"""
+        index = cls()
+        for doc_id, fields in documents:
+            index.add_document(doc_id, fields)
+        return index
+
+
+class IncrementalSearch:
+    """边输入边搜索的标题索引
+
+    以标题中的单字和二元组建立倒排表。新查询以上一次查询为前缀时，
+    只在上一次的结果中继续筛选，不再重新扫描全部标题。
+    """
+
+    def __init__(self, titles: Iterable[Tuple[int, str]] = ()):
+        self._titles: Dict[int, str] = {}
+        self._grams: Dict[str, Set[int]] = {}
+
+        self._last_query: Optional[str] = None
+        self._last_results: Set[int] = set()
+
+        for key, title in titles:
+            self.add(key, title)
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def add(self, key: int, title: str):
+        """添加或替换标题"""
+        if key in self._titles:
+            self.remove(key)
+
+        title = title.lower()
+        self._titles[key] = title
+        for gram in self._iter_grams(title):
+            self._grams.setdefault(gram, set()).add(key)
+
+        self._last_query = None
+
+    def remove(self, key: int) -> bool:
+        """删除标题"""
+        title = self._titles.pop(key, None)
+        if title is None:
+            return False
+
+        for gram in self._iter_grams(title):
+            keys = self._grams.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._grams[gram]
+
+        self._last_query = None
+        return True
+
+    @staticmethod
+    def _iter_grams(text: str) -> Set[str]:
+        """文本中的所有单字和二元组"""
+        grams = set(text)
+        grams.update(text[i:i + 2] for i in range(len(text) - 1))
+        return grams
+
+    def search(self, query: str) -> Set[int]:
+        """搜索标题中包含查询文本的键
+
+        Args:
+            query: 查询文本（不区分大小写）
+
+        Returns:
+            匹配的键集合，空查询返回全部键
+        """
+        query = query.lower()
+        if not query:
+            return set(self._titles)
+
+        if self._last_query is not None and query.startswith(self._last_query):
+            # 追加字符只会缩小结果集
+            candidates = self._last_results
+        elif len(query) == 1:
+            candidates = self._grams.get(query, set())
+        else:
+            postings = sorted(
+                (self._grams.get(query[i:i + 2], set()) for i in range(len(query) - 1)),
+                key=len
+            )
+            candidates = set(postings[0]).intersection(*postings[1:])
+
+        if len(query) <= 2 and candidates is not self._last_results:
+            results = set(candidates)
+        else:
+            results = {key for key in candidates if query in self._titles[key]}
+
+        self._last_query = query
+        self._last_results = results
+        return set(results)
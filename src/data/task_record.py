@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+学习任务记录
+紧凑、不可变的任务记录类型，带有所属阶段和周的引用
+"""
+
+import re
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Tuple
+
+# 任务原始数据中单独保存为属性的字段，其余字段保存在 extra 中
+_DAY_FIELDS = ('title', 'content', 'tasks', 'estimated_time', 'difficulty', 'code_examples')
+
+# 预计时间文本，如"2-3小时"、"30分钟"、"1.5~2小时"
+_ESTIMATED_TIME_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:[-~～到至]\s*(\d+(?:\.\d+)?))?\s*(小时|分钟)')
+
+
+# 各记录类型槽位描述符的 __set__，按 __slots__ 顺序；绕过只读的 __setattr__
+_SLOT_SETTERS: Dict[type, Tuple] = {}
+
+
+def _restore(cls, values: Tuple) -> Any:
+    """按槽位值重建只读记录（供pickle使用，载入编译缓存时每条记录调用一次）"""
+    setters = _SLOT_SETTERS.get(cls)
+    if setters is None:
+        setters = _SLOT_SETTERS[cls] = tuple(getattr(cls, name).__set__ for name in cls.__slots__)
+    record = object.__new__(cls)
+    for setter, value in zip(setters, values):
+        setter(record, value)
+    return record
+
+
+class _Immutable:
+    """禁止在构造完成后修改属性"""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} 是只读的")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} 是只读的")
+
+    def __reduce__(self):
+        return _restore, (type(self), tuple(getattr(self, name) for name in self.__slots__))
+
+
+class StageRecord(_Immutable):
+    """阶段记录"""
+
+    __slots__ = ('id', 'name', 'index')
+
+    def __init__(self, stage_id: int, name: str, index: int):
+        object.__setattr__(self, 'id', stage_id)
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'index', index)
+
+    def __repr__(self) -> str:
+        return f"StageRecord(id={self.id}, name={self.name!r})"
+
+
+class WeekRecord(_Immutable):
+    """周记录，引用所属阶段"""
+
+    __slots__ = ('number', 'title', 'stage')
+
+    def __init__(self, number: int, title: str, stage: StageRecord):
+        object.__setattr__(self, 'number', number)
+        object.__setattr__(self, 'title', title)
+        object.__setattr__(self, 'stage', stage)
+
+    def __repr__(self) -> str:
+        return f"WeekRecord(number={self.number}, title={self.title!r})"
+
+
+class EstimatedTime(_Immutable):
+    """解析后的预计学习时间（分钟），无法解析时上下限均为0"""
+
+    __slots__ = ('min_minutes', 'max_minutes')
+
+    def __init__(self, min_minutes: int, max_minutes: int):
+        object.__setattr__(self, 'min_minutes', min_minutes)
+        object.__setattr__(self, 'max_minutes', max_minutes)
+
+    @property
+    def minutes(self) -> int:
+        """区间中值"""
+        return int(round((self.min_minutes + self.max_minutes) / 2))
+
+    def __bool__(self) -> bool:
+        return self.max_minutes > 0
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, EstimatedTime):
+            return NotImplemented
+        return (self.min_minutes, self.max_minutes) == (other.min_minutes, other.max_minutes)
+
+    def __hash__(self) -> int:
+        return hash((self.min_minutes, self.max_minutes))
+
+    def __repr__(self) -> str:
+        return f"EstimatedTime({self.min_minutes}, {self.max_minutes})"
+
+
+@lru_cache(maxsize=256)
+def parse_estimated_time(estimated_time: str) -> EstimatedTime:
+    """将预计时间文本解析为分钟数区间，相同文本返回同一个对象"""
+    match = _ESTIMATED_TIME_RE.search(estimated_time or "")
+    if not match:
+        return EstimatedTime(0, 0)
+
+    unit = 60 if match.group(3) == "小时" else 1
+    low = float(match.group(1))
+    high = float(match.group(2)) if match.group(2) else low
+    return EstimatedTime(int(round(low * unit)), int(round(high * unit)))
+
+
+class TaskView(Mapping):
+    """任务记录的公共接口
+
+    子类提供 day、title、content、tasks、estimated_time、difficulty、code_examples、
+    week_record 和 extra 属性；这里据此实现所属阶段/周的派生属性和只读映射接口，
+    兼容 task['title']、task.get('difficulty') 等按键访问的调用方。
+    映射中的 stage/stage_id、stage_name、week、week_title 由所属阶段和周的引用得出。
+    """
+
+    __slots__ = ()
+
+    @property
+    def estimate(self) -> EstimatedTime:
+        """解析后的预计学习时间"""
+        return parse_estimated_time(self.estimated_time)
+
+    @property
+    def stage(self) -> StageRecord:
+        """所属阶段"""
+        return self.week_record.stage
+
+    @property
+    def stage_id(self) -> int:
+        return self.week_record.stage.id
+
+    @property
+    def stage_name(self) -> str:
+        return self.week_record.stage.name
+
+    @property
+    def week(self) -> int:
+        """所属周序号"""
+        return self.week_record.number
+
+    @property
+    def week_title(self) -> str:
+        return self.week_record.title
+
+    def _keys(self) -> Tuple[str, ...]:
+        keys = _MAPPING_KEYS
+        if self.extra:
+            keys += tuple(self.extra)
+        return keys
+
+    def __getitem__(self, key: str) -> Any:
+        getter = _MAPPING_GETTERS.get(key)
+        if getter is not None:
+            return getter(self)
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(day={self.day}, title={self.title!r})"
+
+    def to_dict(self) -> Dict:
+        """转换为普通字典（用于JSON序列化）"""
+        data = dict(self)
+        data['tasks'] = list(self.tasks)
+        data['code_examples'] = list(self.code_examples)
+        return data
+
+
+class Task(_Immutable, TaskView):
+    """学习任务记录
+
+    每天的任务只构建一次并按引用返回；预计时间在构建时解析并随记录保存。
+    """
+
+    __slots__ = ('day', 'title', 'content', 'tasks', 'estimated_time', 'estimate', 'difficulty',
+                 'code_examples', 'week_record', 'extra')
+
+    def __init__(self, day: int, day_data: Dict, week_record: WeekRecord):
+        object.__setattr__(self, 'day', day)
+        object.__setattr__(self, 'title', day_data.get('title', ''))
+        object.__setattr__(self, 'content', day_data.get('content', ''))
+        object.__setattr__(self, 'tasks', tuple(day_data.get('tasks', ())))
+        object.__setattr__(self, 'estimated_time', day_data.get('estimated_time', ''))
+        object.__setattr__(self, 'estimate', parse_estimated_time(self.estimated_time))
+        object.__setattr__(self, 'difficulty', day_data.get('difficulty', ''))
+        object.__setattr__(self, 'code_examples', tuple(day_data.get('code_examples', ())))
+        object.__setattr__(self, 'week_record', week_record)
+
+        extra = {key: value for key, value in day_data.items()
+                 if key not in _DAY_FIELDS and key != 'day'}
+        object.__setattr__(self, 'extra', extra or None)
+
+    def replace(self, fields: Dict) -> 'Task':
+        """返回替换了部分字段的新记录"""
+        day_data = {key: self[key] for key in _DAY_FIELDS}
+        if self.extra:
+            day_data.update(self.extra)
+        day_data.update(fields)
+        return Task(self.day, day_data, self.week_record)
+
+
+_MAPPING_GETTERS = {
+    'day': lambda task: task.day,
+    'title': lambda task: task.title,
+    'content': lambda task: task.content,
+    'tasks': lambda task: task.tasks,
+    'estimated_time': lambda task: task.estimated_time,
+    'difficulty': lambda task: task.difficulty,
+    'code_examples': lambda task: task.code_examples,
+    'stage': lambda task: task.week_record.stage.id,
+    'stage_id': lambda task: task.week_record.stage.id,
+    'stage_name': lambda task: task.week_record.stage.name,
+    'week': lambda task: task.week_record.number,
+    'week_title': lambda task: task.week_record.title,
+}
+_MAPPING_KEYS = tuple(_MAPPING_GETTERS)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+学习路线版本比较
+为每天的任务内容计算哈希，比较两个版本的学习路线，找出新增、修改和删除的天，
+以及旧天数到新天数的对应关系，供增量更新索引和迁移学习进度使用。
+"""
+
+import hashlib
+import json
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .task_record import TaskView
+
+# 每天的版本签名：(稳定ID, 标题, 内容哈希)；稳定ID来自任务数据中的可选 id 字段
+DaySignature = Tuple[Optional[str], str, str]
+
+
+def task_content_hash(task: TaskView) -> str:
+    """任务内容的哈希（不含天数、阶段和周等位置信息）"""
+    payload = json.dumps(
+        [task.title, task.content, list(task.tasks), task.estimated_time, task.difficulty,
+         list(task.code_examples), task.extra or {}],
+        ensure_ascii=False, sort_keys=True, separators=(',', ':')
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def task_signature(task: TaskView, content_hash: Optional[str] = None) -> DaySignature:
+    """任务的版本签名"""
+    stable_id = task.extra.get('id') if task.extra else None
+    return (
+        str(stable_id) if stable_id is not None else None,
+        task.title,
+        content_hash or task_content_hash(task)
+    )
+
+
+class ContentDiff:
+    """两个版本学习路线之间的差异
+
+    Attributes:
+        day_map: 保留下来的天（内容可能已修改）旧天数 -> 新天数
+        added: 新增的天（新天数）
+        changed: 内容修改过的天（新天数）
+        removed: 删除的天（旧天数）
+        old_count / new_count: 旧版本和新版本中有内容的天数
+    """
+
+    def __init__(self, day_map: Dict[int, int], added: List[int], changed: List[int], removed: List[int],
+                 old_count: int, new_count: int):
+        self.day_map = day_map
+        self.added = added
+        self.changed = changed
+        self.removed = removed
+        self.old_count = old_count
+        self.new_count = new_count
+
+    @property
+    def moved(self) -> Dict[int, int]:
+        """天数发生变化的天：旧天数 -> 新天数"""
+        return {old: new for old, new in self.day_map.items() if old != new}
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed or self.moved)
+
+    def __repr__(self) -> str:
+        return (f"ContentDiff(added={len(self.added)}, changed={len(self.changed)}, "
+                f"removed={len(self.removed)}, moved={len(self.moved)})")
+
+    def map_day(self, day: int) -> Optional[int]:
+        """旧天数对应的新天数，该天已删除时返回None"""
+        return self.day_map.get(day)
+
+    def nearest_day(self, day: int) -> Optional[int]:
+        """旧天数对应的新天数
+
+        该天已删除时返回其后第一个保留下来的天，没有时返回其前最后一个；
+        超出旧版本内容范围的天按两个版本的天数差平移。
+        """
+        if day in self.day_map:
+            return self.day_map[day]
+        if day > self.old_count:
+            return max(1, day + self.new_count - self.old_count)
+
+        following = [new for old, new in self.day_map.items() if old > day]
+        if following:
+            return min(following)
+        preceding = [new for old, new in self.day_map.items() if old < day]
+        return max(preceding) if preceding else None
+
+
+def diff_days(old: Sequence[DaySignature], new: Sequence[DaySignature]) -> ContentDiff:
+    """比较两个版本的每日签名（第N天为下标N-1）
+
+    按以下顺序匹配旧版本和新版本中的天：
+    1. 稳定ID相同（内容哈希不同则视为修改）；
+    2. 内容哈希相同（未修改，可能移动了位置），重复内容按出现顺序依次匹配；
+    3. 标题相同（视为修改）。
+    剩余未匹配的旧天视为删除，新天视为新增。
+    """
+    day_map: Dict[int, int] = {}
+    changed: List[int] = []
+    unmatched_new = set(range(1, len(new) + 1))
+
+    def match(old_day: int, new_day: int):
+        day_map[old_day] = new_day
+        unmatched_new.discard(new_day)
+        if old[old_day - 1][2] != new[new_day - 1][2]:
+            changed.append(new_day)
+
+    def index_by(position: int, days: Iterable[int]) -> Dict[str, Deque[int]]:
+        index: Dict[str, Deque[int]] = {}
+        for day in days:
+            key = new[day - 1][position]
+            if key is not None:
+                index.setdefault(key, deque()).append(day)
+        return index
+
+    new_ids = {signature[0] for signature in new if signature[0] is not None}
+    for position in (0, 2, 1):  # 稳定ID、内容哈希、标题
+        candidates = index_by(position, sorted(unmatched_new))
+        for old_day, signature in enumerate(old, 1):
+            if old_day in day_map or signature[position] is None:
+                continue
+            if position != 0 and signature[0] in new_ids:
+                continue  # 有稳定ID的天只按ID匹配
+            queue = candidates.get(signature[position])
+            while queue and queue[0] not in unmatched_new:
+                queue.popleft()
+            if queue:
+                match(old_day, queue.popleft())
+
+    removed = [day for day in range(1, len(old) + 1) if day not in day_map]
+    changed.sort()
+    return ContentDiff(day_map, sorted(unmatched_new), changed, removed, len(old), len(new))
+
@@ -12,17 +12,35 @@ from typing import Dict, List, Optional
 from datetime import datetime
 
 from ...core.app_manager import AppManager
+from ...core.storage import task_id_for_day
 from ...utils.logger import get_logger
 
 class HistoryPanel(ctk.CTkFrame):
     """学习历史面板组件"""
     
+    # 筛选选项对应的查询条件
+    FILTER_STATUS = {
+        "全部": 'all',
+        "已完成": 'completed',
+        "未完成": 'incomplete',
+        "本周": 'this_week',
+        "本月": 'this_month'
+    }
+    
+    # 每页显示的任务数
+    PAGE_SIZE = 50
+    
     def __init__(self, parent, app_manager: AppManager):
         super().__init__(parent)
         
         self.app_manager = app_manager
         self.logger = get_logger(__name__)
         
+        # 分页游标：每一页开始前的最后一天，末尾为当前页
+        self._page_cursors: List[int] = [0]
+        self._next_cursor: Optional[int] = None
+        self._last_search_text = ""
+        
         # 配置网格
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
@@ -63,7 +81,7 @@ class HistoryPanel(ctk.CTkFrame):
         self.filter_var = ctk.StringVar(value="全部")
         self.filter_combo = ctk.CTkComboBox(
             self.control_frame,
-            values=["全部", "已完成", "未完成", "本周", "本月"],
+            values=list(self.FILTER_STATUS),
             variable=self.filter_var,
             command=self._on_filter_changed,
             width=120
@@ -168,6 +186,32 @@ class HistoryPanel(ctk.CTkFrame):
         v_scrollbar.grid(row=0, column=1, sticky="ns")
         h_scrollbar.grid(row=1, column=0, sticky="ew")
         
+        # 分页控制
+        self.pager_frame = ctk.CTkFrame(self.list_frame)
+        self.pager_frame.grid(row=2, column=0, padx=15, pady=(0, 15), sticky="ew")
+        self.pager_frame.grid_columnconfigure(1, weight=1)
+        
+        self.prev_page_btn = ctk.CTkButton(
+            self.pager_frame,
+            text="上一页",
+            command=self._prev_page,
+            width=80,
+            height=28
+        )
+        self.prev_page_btn.grid(row=0, column=0, padx=5, pady=5)
+        
+        self.page_label = ctk.CTkLabel(self.pager_frame, text="")
+        self.page_label.grid(row=0, column=1, padx=5, pady=5)
+        
+        self.next_page_btn = ctk.CTkButton(
+            self.pager_frame,
+            text="下一页",
+            command=self._next_page,
+            width=80,
+            height=28
+        )
+        self.next_page_btn.grid(row=0, column=2, padx=5, pady=5)
+        
         # 绑定选择事件
         self.tree.bind("<<TreeviewSelect>>", self._on_task_selected)
         self.tree.bind("<Double-1>", self._on_task_double_click)
@@ -216,6 +260,9 @@ class HistoryPanel(ctk.CTkFrame):
         self.detail_completed_label = ctk.CTkLabel(self.info_frame, text="完成日期: --")
         self.detail_completed_label.grid(row=4, column=0, columnspan=2, padx=10, pady=5, sticky="w")
         
+        self.detail_related_label = ctk.CTkLabel(self.info_frame, text="相关任务: --", wraplength=300, justify="left")
+        self.detail_related_label.grid(row=5, column=0, columnspan=2, padx=10, pady=5, sticky="w")
+        
         # 任务内容区域
         content_label = ctk.CTkLabel(
             self.detail_frame,
@@ -303,33 +350,42 @@ class HistoryPanel(ctk.CTkFrame):
             self.logger.error(f"刷新历史面板失败: {e}")
     
     def _load_task_list(self):
-        """加载任务列表"""
+        """加载任务列表（从第一页开始）"""
+        self._page_cursors = [0]
+        self._render_task_list()
+    
+    def _render_task_list(self):
+        """按当前筛选和搜索条件显示当前页的任务"""
         # 清空现有数据
         for item in self.tree.get_children():
             self.tree.delete(item)
         
-        # 获取所有任务和进度数据
-        all_tasks = self.app_manager.learning_data.get_all_tasks()
-        progress_data = self.app_manager.get_progress_data()
-        completed_tasks = progress_data.get('completed_tasks', {})
-        completion_dates = progress_data.get('completion_dates', {})
+        search_text = self.search_var.get()
+        self._last_search_text = search_text
         
-        # 应用筛选和搜索
-        filtered_tasks = self._filter_tasks(all_tasks, completed_tasks, completion_dates)
+        # 筛选和搜索由数据层完成，只取出当前页
+        page = self.app_manager.query_tasks(
+            status=self.FILTER_STATUS.get(self.filter_var.get(), 'all'),
+            search=search_text,
+            limit=self.PAGE_SIZE,
+            after_day=self._page_cursors[-1]
+        )
+        self._next_cursor = page['next_cursor']
+        completion_dates = self.app_manager.progress['completion_dates']
         
         # 添加任务到树形视图
-        for task in filtered_tasks:
+        for task in page['tasks']:
             day = task['day']
-            is_completed = completed_tasks.get(str(day), False)
+            is_completed = self.app_manager.is_task_completed(day)
             
             # 状态
             status = "✅ 已完成" if is_completed else "⏳ 待完成"
             
             # 完成日期
-            completed_date = completion_dates.get(str(day), "") if is_completed else ""
+            completed_date = completion_dates.get(task_id_for_day(day), "") if is_completed else ""
             
             # 插入数据
-            item = self.tree.insert("", "end", values=(
+            self.tree.insert("", "end", values=(
                 day,
                 task['title'],
                 status,
@@ -337,59 +393,25 @@ class HistoryPanel(ctk.CTkFrame):
                 f"第{task['stage']}阶段",
                 completed_date
             ))
-            
-            # 设置行颜色
-            if is_completed:
-                self.tree.set(item, "status", "✅ 已完成")
-            else:
-                self.tree.set(item, "status", "⏳ 待完成")
-    
-    def _filter_tasks(self, all_tasks: List[Dict], completed_tasks: Dict, completion_dates: Dict) -> List[Dict]:
-        """筛选任务"""
-        filtered_tasks = []
-        filter_value = self.filter_var.get()
-        search_text = self.search_var.get().lower()
         
-        for task in all_tasks:
-            day = task['day']
-            is_completed = completed_tasks.get(str(day), False)
-            
-            # 应用筛选
-            if filter_value == "已完成" and not is_completed:
-                continue
-            elif filter_value == "未完成" and is_completed:
-                continue
-            elif filter_value in ["本周", "本月"]:
-                if not is_completed:
-                    continue
-                
-                completed_date_str = completion_dates.get(str(day), "")
-                if not completed_date_str:
-                    continue
-                
-                try:
-                    completed_date = datetime.strptime(completed_date_str, "%Y-%m-%d").date()
-                    now = datetime.now().date()
-                    
-                    if filter_value == "本周":
-                        # 计算本周的开始日期（周一）
-                        days_since_monday = now.weekday()
-                        week_start = now - timedelta(days=days_since_monday)
-                        if completed_date < week_start:
-                            continue
-                    elif filter_value == "本月":
-                        if completed_date.year != now.year or completed_date.month != now.month:
-                            continue
-                except:
-                    continue
-            
-            # 应用搜索
-            if search_text and search_text not in task['title'].lower():
-                continue
-            
-            filtered_tasks.append(task)
-        
-        return filtered_tasks
+        # 更新分页信息
+        total = page['total']
+        page_count = max(1, -(-total // self.PAGE_SIZE))
+        self.page_label.configure(text=f"第{len(self._page_cursors)}/{page_count}页  共{total}项")
+        self.prev_page_btn.configure(state="normal" if len(self._page_cursors) > 1 else "disabled")
+        self.next_page_btn.configure(state="normal" if self._next_cursor is not None else "disabled")
+    
+    def _prev_page(self):
+        """显示上一页"""
+        if len(self._page_cursors) > 1:
+            self._page_cursors.pop()
+            self._render_task_list()
+    
+    def _next_page(self):
+        """显示下一页"""
+        if self._next_cursor is not None:
+            self._page_cursors.append(self._next_cursor)
+            self._render_task_list()
     
     def _on_filter_changed(self, value):
         """筛选条件改变时的处理"""
@@ -397,6 +419,9 @@ class HistoryPanel(ctk.CTkFrame):
     
     def _on_search_changed(self, event):
         """搜索条件改变时的处理"""
+        # 光标移动等按键不改变搜索文本，无需重新筛选
+        if self.search_var.get() == self._last_search_text:
+            return
         self._load_task_list()
     
     def _on_task_selected(self, event):
@@ -424,12 +449,10 @@ class HistoryPanel(ctk.CTkFrame):
             self._clear_task_detail()
             return
         
-        progress_data = self.app_manager.get_progress_data()
-        completed_tasks = progress_data.get('completed_tasks', {})
-        completion_dates = progress_data.get('completion_dates', {})
+        completion_dates = self.app_manager.progress['completion_dates']
         
-        is_completed = completed_tasks.get(str(day), False)
-        completed_date = completion_dates.get(str(day), "") if is_completed else ""
+        is_completed = self.app_manager.is_task_completed(day)
+        completed_date = completion_dates.get(task_id_for_day(day), "") if is_completed else ""
         
         # 更新任务信息
         self.detail_day_label.configure(text=f"天数: 第{task['day']}天")
@@ -440,6 +463,11 @@ class HistoryPanel(ctk.CTkFrame):
         self.detail_status_label.configure(text=f"状态: {'✅ 已完成' if is_completed else '⏳ 待完成'}")
         self.detail_completed_label.configure(text=f"完成日期: {completed_date}")
         
+        # 相关任务（预先计算的相似任务）
+        related = self.app_manager.learning_data.get_related_tasks(day, limit=3)
+        related_text = "\n".join(f"第{other['day']}天: {other['title']}" for other in related)
+        self.detail_related_label.configure(text=f"相关任务:\n{related_text}" if related else "相关任务: --")
+        
         # 更新任务内容
         self.detail_content.configure(state="normal")
         self.detail_content.delete("1.0", "end")
@@ -472,6 +500,7 @@ class HistoryPanel(ctk.CTkFrame):
         self.detail_time_label.configure(text="预计时间: --")
         self.detail_status_label.configure(text="状态: --")
         self.detail_completed_label.configure(text="完成日期: --")
+        self.detail_related_label.configure(text="相关任务: --")
         
         self.detail_content.configure(state="normal")
         self.detail_content.delete("1.0", "end")
@@ -529,12 +558,10 @@ class HistoryPanel(ctk.CTkFrame):
         info_frame.pack(padx=20, pady=10, fill="x")
         
         # 任务信息
-        progress_data = self.app_manager.get_progress_data()
-        completed_tasks = progress_data.get('completed_tasks', {})
-        completion_dates = progress_data.get('completion_dates', {})
+        completion_dates = self.app_manager.progress['completion_dates']
         
-        is_completed = completed_tasks.get(str(task['day']), False)
-        completed_date = completion_dates.get(str(task['day']), "") if is_completed else "未完成"
+        is_completed = self.app_manager.is_task_completed(task['day'])
+        completed_date = completion_dates.get(task_id_for_day(task['day']), "") if is_completed else "未完成"
         
         info_items = [
             ("天数", f"第{task['day']}天"),
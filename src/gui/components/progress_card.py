@@ -17,12 +17,18 @@ from ...utils.logger import get_logger
 class ProgressCard(ctk.CTkFrame):
     """学习进度卡片组件"""
     
+    # 详细进度列表每页显示的任务数
+    PAGE_SIZE = 50
+    
     def __init__(self, parent, app_manager: AppManager):
         super().__init__(parent)
         
         self.app_manager = app_manager
         self.logger = get_logger(__name__)
         
+        # 详细进度列表的分页偏移
+        self._page_offset = 0
+        
         # 配置网格
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
@@ -179,6 +185,20 @@ class ProgressCard(ctk.CTkFrame):
         self.tree.grid(row=0, column=0, sticky="nsew")
         scrollbar.grid(row=0, column=1, sticky="ns")
         
+        # 分页控制
+        pager_frame = ctk.CTkFrame(self.detail_frame)
+        pager_frame.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="ew")
+        pager_frame.grid_columnconfigure(1, weight=1)
+        
+        self.prev_page_btn = ctk.CTkButton(pager_frame, text="上一页", command=self._prev_page, width=80)
+        self.prev_page_btn.grid(row=0, column=0, padx=5, pady=5)
+        
+        self.page_label = ctk.CTkLabel(pager_frame, text="")
+        self.page_label.grid(row=0, column=1, padx=5, pady=5)
+        
+        self.next_page_btn = ctk.CTkButton(pager_frame, text="下一页", command=self._next_page, width=80)
+        self.next_page_btn.grid(row=0, column=2, padx=5, pady=5)
+        
         # 绑定双击事件
         self.tree.bind("<Double-1>", self._on_task_double_click)
     
@@ -211,7 +231,12 @@ class ProgressCard(ctk.CTkFrame):
         streak = stats.get('current_streak', 0)
         
         self.completed_label.configure(text=f"已完成: {completed}天")
-        self.remaining_label.configure(text=f"剩余: {remaining}天")
+        projection = self.app_manager.get_time_projection()
+        if projection['max_minutes'] > 0:
+            hours = f"{projection['min_minutes'] / 60:.0f}-{projection['max_minutes'] / 60:.0f}小时"
+            self.remaining_label.configure(text=f"剩余: {remaining}天（约{hours}）")
+        else:
+            self.remaining_label.configure(text=f"剩余: {remaining}天")
         self.streak_label.configure(text=f"连续: {streak}天")
     
     def _update_stage_progress(self):
@@ -220,11 +245,11 @@ class ProgressCard(ctk.CTkFrame):
         for widget in self.stage_container.winfo_children():
             widget.destroy()
         
-        # 获取阶段信息
+        # 获取阶段信息和各阶段进度
         stages = self.app_manager.learning_data.get_all_stages()
-        progress_data = self.app_manager.get_progress_data()
+        stage_progress_list = self.app_manager.get_all_stage_progress()
         
-        for i, stage in enumerate(stages):
+        for i, (stage, progress) in enumerate(zip(stages, stage_progress_list)):
             stage_frame = ctk.CTkFrame(self.stage_container)
             stage_frame.grid(row=i, column=0, padx=5, pady=5, sticky="ew")
             stage_frame.grid_columnconfigure(1, weight=1)
@@ -232,7 +257,7 @@ class ProgressCard(ctk.CTkFrame):
             # 阶段标题
             stage_title = ctk.CTkLabel(
                 stage_frame,
-                text=f"阶段 {stage['stage']}",
+                text=f"阶段 {stage['id']}",
                 font=ctk.CTkFont(size=14, weight="bold")
             )
             stage_title.grid(row=0, column=0, padx=10, pady=5, sticky="w")
@@ -246,11 +271,9 @@ class ProgressCard(ctk.CTkFrame):
             )
             stage_desc.grid(row=1, column=0, columnspan=2, padx=10, pady=2, sticky="w")
             
-            # 计算阶段进度
-            stage_tasks = self.app_manager.learning_data.get_tasks_by_stage(stage['stage'])
-            completed_in_stage = sum(1 for task in stage_tasks 
-                                   if progress_data.get('completed_tasks', {}).get(str(task['day']), False))
-            total_in_stage = len(stage_tasks)
+            # 阶段进度
+            completed_in_stage = progress['completed_days']
+            total_in_stage = progress['total_days']
             stage_progress = completed_in_stage / total_in_stage if total_in_stage > 0 else 0
             
             # 阶段进度条
@@ -276,23 +299,20 @@ class ProgressCard(ctk.CTkFrame):
         for item in self.tree.get_children():
             self.tree.delete(item)
         
-        # 获取所有任务和进度数据
-        all_tasks = self.app_manager.learning_data.get_all_tasks()
-        progress_data = self.app_manager.get_progress_data()
-        completed_tasks = progress_data.get('completed_tasks', {})
+        # 只取出当前页的任务
+        page = self.app_manager.query_tasks(limit=self.PAGE_SIZE, offset=self._page_offset)
+        completion_dates = self.app_manager.progress['completion_dates']
         
         # 添加任务到树形视图
-        for task in all_tasks:
+        for task in page['tasks']:
             day = task['day']
-            is_completed = completed_tasks.get(str(day), False)
+            is_completed = self.app_manager.is_task_completed(day)
             
             # 状态
             status = "✅ 已完成" if is_completed else "⏳ 待完成"
             
             # 完成日期
-            completed_date = ""
-            if is_completed and 'completion_dates' in progress_data:
-                completed_date = progress_data['completion_dates'].get(str(day), "")
+            completed_date = completion_dates.get(f"day_{day}", "") if is_completed else ""
             
             # 插入数据
             item = self.tree.insert("", "end", values=(
@@ -309,6 +329,24 @@ class ProgressCard(ctk.CTkFrame):
                 self.tree.set(item, "status", "✅ 已完成")
             else:
                 self.tree.set(item, "status", "⏳ 待完成")
+        
+        # 更新分页信息
+        total = page['total']
+        page_count = max(1, -(-total // self.PAGE_SIZE))
+        self.page_label.configure(text=f"第{self._page_offset // self.PAGE_SIZE + 1}/{page_count}页")
+        self.prev_page_btn.configure(state="normal" if self._page_offset > 0 else "disabled")
+        self.next_page_btn.configure(state="normal" if page['next_cursor'] is not None else "disabled")
+    
+    def _prev_page(self):
+        """显示上一页"""
+        if self._page_offset > 0:
+            self._page_offset = max(0, self._page_offset - self.PAGE_SIZE)
+            self._update_detailed_progress()
+    
+    def _next_page(self):
+        """显示下一页"""
+        self._page_offset += self.PAGE_SIZE
+        self._update_detailed_progress()
     
     def _on_task_double_click(self, event):
         """处理任务双击事件"""
@@ -9,7 +9,6 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import ttk
 from typing import Dict, List, Optional
-from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
@@ -268,34 +267,7 @@ class StatsPanel(ctk.CTkFrame):
     def _calculate_average_difficulty(self) -> str:
         """计算平均难度"""
         try:
-            progress_data = self.app_manager.get_progress_data()
-            completed_tasks = progress_data.get('completed_tasks', {})
-            
-            if not completed_tasks:
-                return "--"
-            
-            difficulty_map = {'简单': 1, '中等': 2, '困难': 3}
-            total_difficulty = 0
-            count = 0
-            
-            for day_str in completed_tasks:
-                if completed_tasks[day_str]:
-                    task = self.app_manager.learning_data.get_task_by_day(int(day_str))
-                    if task:
-                        difficulty = task.get('difficulty', '中等')
-                        total_difficulty += difficulty_map.get(difficulty, 2)
-                        count += 1
-            
-            if count == 0:
-                return "--"
-            
-            avg = total_difficulty / count
-            if avg <= 1.3:
-                return "简单"
-            elif avg <= 2.3:
-                return "中等"
-            else:
-                return "困难"
+            return self.app_manager.get_task_analytics()['average_difficulty']
                 
         except Exception as e:
             self.logger.error(f"计算平均难度失败: {e}")
@@ -306,44 +278,19 @@ class StatsPanel(ctk.CTkFrame):
         try:
             self.progress_ax.clear()
             
-            # 获取进度数据
-            progress_data = self.app_manager.get_progress_data()
-            completed_tasks = progress_data.get('completed_tasks', {})
-            completion_dates = progress_data.get('completion_dates', {})
+            # 按完成日期统计的累计完成数（由统计引擎增量维护）
+            sorted_dates, cumulative_progress = self.app_manager.get_completion_trend()
             
-            if not completed_tasks:
+            if not self.app_manager.completed:
                 self.progress_ax.text(0.5, 0.5, '暂无数据', ha='center', va='center', transform=self.progress_ax.transAxes)
                 self.progress_canvas.draw()
                 return
             
-            # 按日期统计完成情况
-            date_progress = {}
-            for day_str, is_completed in completed_tasks.items():
-                if is_completed and day_str in completion_dates:
-                    date_str = completion_dates[day_str]
-                    try:
-                        date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                        if date not in date_progress:
-                            date_progress[date] = 0
-                        date_progress[date] += 1
-                    except:
-                        continue
-            
-            if not date_progress:
+            if not sorted_dates:
                 self.progress_ax.text(0.5, 0.5, '暂无完成记录', ha='center', va='center', transform=self.progress_ax.transAxes)
                 self.progress_canvas.draw()
                 return
             
-            # 排序日期
-            sorted_dates = sorted(date_progress.keys())
-            
-            # 计算累积进度
-            cumulative_progress = []
-            total = 0
-            for date in sorted_dates:
-                total += date_progress[date]
-                cumulative_progress.append(total)
-            
             # 绘制图表
             self.progress_ax.plot(sorted_dates, cumulative_progress, marker='o', linewidth=2, markersize=4)
             self.progress_ax.set_title('学习进度趋势')
@@ -370,36 +317,23 @@ class StatsPanel(ctk.CTkFrame):
         try:
             self.difficulty_ax.clear()
             
-            # 获取已完成任务的难度分布
-            progress_data = self.app_manager.get_progress_data()
-            completed_tasks = progress_data.get('completed_tasks', {})
-            
-            difficulty_count = {'简单': 0, '中等': 0, '困难': 0}
-            
-            for day_str, is_completed in completed_tasks.items():
-                if is_completed:
-                    task = self.app_manager.learning_data.get_task_by_day(int(day_str))
-                    if task:
-                        difficulty = task.get('difficulty', '中等')
-                        if difficulty in difficulty_count:
-                            difficulty_count[difficulty] += 1
-            
-            # 如果没有完成的任务，显示全部任务的难度分布
-            if sum(difficulty_count.values()) == 0:
-                all_tasks = self.app_manager.learning_data.get_all_tasks()
-                for task in all_tasks:
-                    difficulty = task.get('difficulty', '中等')
-                    if difficulty in difficulty_count:
-                        difficulty_count[difficulty] += 1
-                
-                title = '全部任务难度分布'
-            else:
+            # 获取已完成任务的难度分布，没有完成的任务时显示全部任务的难度分布
+            analytics = self.app_manager.get_task_analytics()
+            if analytics['completed'] > 0:
+                difficulty_count = analytics['difficulty']
                 title = '已完成任务难度分布'
+            else:
+                difficulty_count = analytics['all_difficulty']
+                title = '全部任务难度分布'
             
-            # 绘制饼图
-            labels = list(difficulty_count.keys())
-            sizes = list(difficulty_count.values())
-            colors = ['#4CAF50', '#FF9800', '#f44336']
+            # 绘制饼图（省略数量为0的难度）
+            palette = ['#4CAF50', '#8BC34A', '#FF9800', '#FF5722', '#f44336']
+            labels, sizes, colors = [], [], []
+            for (difficulty, count), color in zip(difficulty_count.items(), palette):
+                if count > 0:
+                    labels.append(difficulty)
+                    sizes.append(count)
+                    colors.append(color)
             
             if sum(sizes) > 0:
                 wedges, texts, autotexts = self.difficulty_ax.pie(
@@ -428,26 +362,13 @@ class StatsPanel(ctk.CTkFrame):
         try:
             self.stage_ax.clear()
             
-            # 获取阶段信息
-            stages = self.app_manager.learning_data.get_all_stages()
-            progress_data = self.app_manager.get_progress_data()
-            completed_tasks = progress_data.get('completed_tasks', {})
-            
+            # 各阶段进度（一次遍历完成位图得到）
             stage_names = []
             completion_rates = []
             
-            for stage in stages:
-                stage_num = stage['stage']
-                stage_tasks = self.app_manager.learning_data.get_tasks_by_stage(stage_num)
-                
-                completed_in_stage = sum(1 for task in stage_tasks 
-                                       if completed_tasks.get(str(task['day']), False))
-                total_in_stage = len(stage_tasks)
-                
-                completion_rate = (completed_in_stage / total_in_stage * 100) if total_in_stage > 0 else 0
-                
-                stage_names.append(f"阶段{stage_num}")
-                completion_rates.append(completion_rate)
+            for progress in self.app_manager.get_all_stage_progress():
+                stage_names.append(f"阶段{progress['stage_id']}")
+                completion_rates.append(progress['progress_rate'])
             
             # 绘制柱状图
             bars = self.stage_ax.bar(stage_names, completion_rates, color='#2196F3', alpha=0.7)
@@ -477,32 +398,12 @@ class StatsPanel(ctk.CTkFrame):
         try:
             self.time_ax.clear()
             
-            # 获取已完成任务的时间分布
-            progress_data = self.app_manager.get_progress_data()
-            completed_tasks = progress_data.get('completed_tasks', {})
-            
-            time_distribution = {}
-            
-            for day_str, is_completed in completed_tasks.items():
-                if is_completed:
-                    task = self.app_manager.learning_data.get_task_by_day(int(day_str))
-                    if task:
-                        estimated_time = task.get('estimated_time', '')
-                        # 简化时间分类
-                        if '30分钟' in estimated_time or '0.5小时' in estimated_time:
-                            time_category = '30分钟'
-                        elif '1小时' in estimated_time:
-                            time_category = '1小时'
-                        elif '1.5小时' in estimated_time:
-                            time_category = '1.5小时'
-                        elif '2小时' in estimated_time:
-                            time_category = '2小时'
-                        else:
-                            time_category = '其他'
-                        
-                        if time_category not in time_distribution:
-                            time_distribution[time_category] = 0
-                        time_distribution[time_category] += 1
+            # 获取已完成任务的预计时间分布（省略数量为0的分组）
+            time_distribution = {
+                category: count
+                for category, count in self.app_manager.get_task_analytics()['time'].items()
+                if count > 0
+            }
             
             if not time_distribution:
                 self.time_ax.text(0.5, 0.5, '暂无完成记录', ha='center', va='center', transform=self.time_ax.transAxes)
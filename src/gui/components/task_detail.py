@@ -136,6 +136,9 @@ class TaskDetailFrame(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(self.info_container, text="状态: --")
         self.status_label.grid(row=4, column=0, columnspan=2, padx=10, pady=5, sticky="w")
         
+        self.related_label = ctk.CTkLabel(self.info_container, text="相关任务: --", wraplength=250, justify="left")
+        self.related_label.grid(row=5, column=0, columnspan=2, padx=10, pady=5, sticky="w")
+        
         # 进度信息
         progress_frame = ctk.CTkFrame(self.info_frame)
         progress_frame.grid(row=2, column=0, padx=15, pady=10, sticky="ew")
@@ -259,6 +262,7 @@ class TaskDetailFrame(ctk.CTkFrame):
             self.difficulty_label.configure(text="难度: --")
             self.time_label.configure(text="预计时间: --")
             self.status_label.configure(text="状态: ✅ 全部完成")
+            self.related_label.configure(text="相关任务: --")
             
             self.content_textbox.delete("1.0", "end")
             self.content_textbox.insert("1.0", "恭喜你！已经完成了所有的数学建模学习任务。\n\n你可以：\n1. 复习之前的学习内容\n2. 导出学习数据作为备份\n3. 开始新的学习计划")
@@ -279,6 +283,11 @@ class TaskDetailFrame(ctk.CTkFrame):
         self.time_label.configure(text=f"预计时间: {task['estimated_time']}")
         self.status_label.configure(text="状态: ⏳ 待完成")
         
+        # 相关任务（预先计算的相似任务）
+        related = self.app_manager.learning_data.get_related_tasks(task['day'], limit=3)
+        related_text = "\n".join(f"第{other['day']}天: {other['title']}" for other in related)
+        self.related_label.configure(text=f"相关任务:\n{related_text}" if related else "相关任务: --")
+        
         # 更新任务内容
         self.content_textbox.configure(state="normal")
         self.content_textbox.delete("1.0", "end")
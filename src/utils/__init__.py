@@ -5,17 +5,6 @@
 包含各种实用工具和辅助功能
 """
 
-from .logger import (
-    setup_logger,
-    get_logger,
-    set_global_log_level,
-    cleanup_loggers,
-    clear_old_logs,
-    get_log_directory,
-    configure_logging_from_settings,
-    DEBUG, INFO, WARNING, ERROR, CRITICAL
-)
-
 __all__ = [
     'setup_logger',
     'get_logger', 
@@ -25,4 +14,12 @@ __all__ = [
     'get_log_directory',
     'configure_logging_from_settings',
     'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'
-]
\ No newline at end of file
+]
+
+# 日志工具在首次访问时才导入：启动分析器（src.utils.startup_profiler）需在
+# logging 等模块导入之前安装导入计时钩子，导入本包时不能带入 logger
+def __getattr__(name):
+    if name in __all__:
+        from . import logger
+        return getattr(logger, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+启动性能分析
+记录启动各阶段的耗时和每个模块的导入耗时，并与启动时间预算比较。
+只依赖标准库，需在导入Kivy等重量级模块之前创建。
+"""
+
+import importlib.abc
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+# 由分析器处理并从 sys.argv 中移除的命令行参数（避免被Kivy的参数解析拒绝）
+PROFILE_FLAG = '--profile-startup'
+REPORT_OPTION = '--startup-report'
+BUDGET_OPTION = '--startup-budget'
+
+
+class _TimedLoader:
+    """包装模块加载器，统计模块执行（含其导入的子模块）的耗时"""
+
+    def __init__(self, loader, profiler: 'StartupProfiler'):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # 执行期间模块的 __loader__ 是本包装，执行完成后还原为原加载器
+        try:
+            self._profiler._exec_module(self._loader, module)
+        finally:
+            if getattr(module, '__spec__', None) is not None and module.__spec__.loader is self:
+                module.__spec__.loader = self._loader
+            if getattr(module, '__loader__', None) is self:
+                module.__loader__ = self._loader
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """位于 sys.meta_path 最前的查找器，为找到的模块换上计时加载器"""
+
+    def __init__(self, profiler: 'StartupProfiler'):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        if threading.get_ident() != self._profiler._thread_id:
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, 'find_spec', None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, self._profiler)
+        return spec
+
+
+class StartupProfiler:
+    """启动性能分析器
+
+    阶段按顺序记录：mark(name) 记录从上一个标记（或分析器创建）到现在的耗时。
+    未启用时所有方法都不做任何事，可以无条件地在启动代码中调用。
+
+    Attributes:
+        enabled: 是否启用
+        report_path: 报告JSON的输出路径
+        budget_path: 启动时间预算JSON的路径，为None时不检查
+        exit_code: 检查预算后的退出码（超出预算为1）
+    """
+
+    def __init__(self, enabled: bool = False, report_path: Optional[str] = None,
+                 budget_path: Optional[str] = None):
+        self.enabled = enabled
+        self.report_path = report_path
+        self.budget_path = budget_path
+        self.exit_code = 0
+
+        self.phases: Dict[str, float] = {}
+        self.imports: Dict[str, List[float]] = {}  # 模块名 -> [累计耗时ms, 自身耗时ms]
+        self._start = time.perf_counter()
+        self._last_mark = self._start
+        self._stack: List[float] = []
+        self._thread_id = threading.get_ident()
+        self._finder: Optional[_ImportTimer] = None
+
+        if enabled:
+            self._finder = _ImportTimer(self)
+            sys.meta_path.insert(0, self._finder)
+
+    @classmethod
+    def from_argv(cls, argv: List[str]) -> 'StartupProfiler':
+        """根据命令行参数创建分析器，并从 argv 中移除分析器的参数
+
+        支持的参数：--profile-startup、--startup-report PATH、--startup-budget PATH
+        （也可写作 --option=PATH）。
+        """
+        enabled = False
+        options = {REPORT_OPTION: None, BUDGET_OPTION: None}
+        remaining = argv[:1]
+        index = 1
+        while index < len(argv):
+            argument = argv[index]
+            name, separator, value = argument.partition('=')
+            if argument == PROFILE_FLAG:
+                enabled = True
+            elif name in options:
+                if not separator and index + 1 < len(argv):
+                    index += 1
+                    value = argv[index]
+                options[name] = value or None
+            else:
+                remaining.append(argument)
+            index += 1
+        argv[:] = remaining
+
+        return cls(enabled, report_path=options[REPORT_OPTION], budget_path=options[BUDGET_OPTION])
+
+    def _exec_module(self, loader, module):
+        """执行模块并记录累计耗时和自身耗时（不含其中导入的其他模块）"""
+        start = time.perf_counter()
+        self._stack.append(0.0)
+        try:
+            loader.exec_module(module)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            self.imports[module.__name__] = [elapsed, elapsed - children]
+
+    def mark(self, name: str):
+        """结束一个阶段"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases[name] = self.phases.get(name, 0.0) + (now - self._last_mark) * 1000
+        self._last_mark = now
+
+    def stop(self):
+        """停止统计导入耗时"""
+        if self._finder is not None and self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        self._finder = None
+
+    def report(self) -> Dict:
+        """启动报告
+
+        Returns:
+            total_ms: 从分析器创建到最后一个阶段结束的耗时
+            phases: 各阶段耗时（ms）
+            packages: 各顶层包的导入耗时（其所有模块自身耗时之和，ms）
+            imports: 各模块的导入耗时，按累计耗时降序
+        """
+        packages: Dict[str, float] = {}
+        for module_name, (_, self_ms) in self.imports.items():
+            package = module_name.split('.')[0]
+            packages[package] = packages.get(package, 0.0) + self_ms
+
+        return {
+            'total_ms': round((self._last_mark - self._start) * 1000, 3),
+            'phases': {name: round(ms, 3) for name, ms in self.phases.items()},
+            'packages': {name: round(ms, 3) for name, ms in sorted(packages.items(), key=lambda item: -item[1])},
+            'imports': [
+                {'module': module_name, 'cumulative_ms': round(cumulative, 3), 'self_ms': round(self_ms, 3)}
+                for module_name, (cumulative, self_ms) in sorted(self.imports.items(), key=lambda item: -item[1][0])
+            ]
+        }
+
+    def finish(self, limit: int = 15) -> int:
+        """停止分析，打印并保存报告，检查预算，返回退出码"""
+        if not self.enabled:
+            return 0
+
+        self.stop()
+        report = self.report()
+        print_report(report, limit)
+
+        if self.report_path:
+            path = Path(self.report_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+
+        if self.budget_path:
+            violations = check_budget(report, load_budget(self.budget_path))
+            for violation in violations:
+                print(f"超出启动预算: {violation}")
+            self.exit_code = 1 if violations else 0
+        return self.exit_code
+
+
+def load_budget(path: Union[str, Path]) -> Dict:
+    """读取启动时间预算
+
+    格式：{"total_ms": 总耗时, "phases": {阶段: 耗时}, "packages": {顶层包: 导入耗时}}，
+    各项均可省略，单位为毫秒。
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def check_budget(report: Dict, budget: Dict) -> List[str]:
+    """检查启动报告是否超出预算，返回超出的项目说明"""
+    violations = []
+
+    total_budget = budget.get('total_ms')
+    if total_budget is not None and report['total_ms'] > total_budget:
+        violations.append(f"total {report['total_ms']:.1f}ms > {total_budget}ms")
+
+    for section in ('phases', 'packages'):
+        for name, limit in budget.get(section, {}).items():
+            value = report.get(section, {}).get(name)
+            if value is not None and value > limit:
+                violations.append(f"{section}.{name} {value:.1f}ms > {limit}ms")
+    return violations
+
+
+def print_report(report: Dict, limit: int = 15):
+    """打印启动报告"""
+    print(f"启动耗时: {report['total_ms']:.1f}ms")
+    for name, ms in report['phases'].items():
+        print(f"  {name:<24} {ms:>10.1f}ms")
+
+    if report['packages']:
+        print("导入耗时最多的包:")
+        for name, ms in list(report['packages'].items())[:limit]:
+            print(f"  {name:<24} {ms:>10.1f}ms")
+
+    if report['imports']:
+        print("导入耗时最多的模块（累计/自身）:")
+        for entry in report['imports'][:limit]:
+            print(f"  {entry['module']:<40} {entry['cumulative_ms']:>10.1f}ms {entry['self_ms']:>10.1f}ms")
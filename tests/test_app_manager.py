@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AppManager 派生视图缓存和分页查询测试
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from benchmarks.synthetic import generate_curriculum
+from src.core.app_manager import AppManager
+from src.core.statistics import parse_completion_date
+from src.core.storage import JsonProgressStorage
+from src.data.learning_data import LearningData
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = AppManager(storage=JsonProgressStorage(tmp_path / 'progress.json'), learning_data=LearningData())
+    yield manager
+    manager.profile.release()
+
+
+@pytest.fixture
+def paged_manager(tmp_path):
+    manager = AppManager(storage=JsonProgressStorage(tmp_path / 'progress.json'),
+                         learning_data=LearningData(generate_curriculum(days=300, seed=3)))
+    for day in range(1, 301, 3):
+        manager.mark_task_completed(day)
+    # 部分任务改为很早以前完成，使 completed 与 this_week / this_month 的结果不同
+    for day in range(1, 301, 9):
+        manager.progress['completion_dates'][f"day_{day}"] = '2020-01-01T08:00:00'
+    manager._invalidate()
+    yield manager
+    manager.profile.release()
+
+
+FILTER_CASES = [(status, search) for status in AppManager.TASK_FILTERS for search in ('', '函数', 'series')]
+
+
+def expected_days(manager, status, search):
+    """直接遍历 iter_tasks() 逐项筛选，作为分页查询的参照"""
+    today = date.today()
+    period_start = {'this_week': today - timedelta(days=today.weekday()), 'this_month': today.replace(day=1)}
+    completion_dates = manager.progress['completion_dates']
+    days = []
+    for task in manager.learning_data.iter_tasks():
+        if search and search.lower() not in task.title.lower():
+            continue
+        completed = task.day in manager.completed
+        if status == 'completed' and not completed:
+            continue
+        if status == 'incomplete' and completed:
+            continue
+        if status in period_start:
+            completed_on = parse_completion_date(completion_dates.get(f"day_{task.day}"))
+            if not completed or completed_on is None or completed_on < period_start[status]:
+                continue
+        days.append(task.day)
+    return days
+
+
+def test_view_cache_is_bounded(manager):
+    for index in range(AppManager.VIEW_CACHE_SIZE * 3):
+        manager.count_tasks('all', f"keyword-{index}")
+    assert len(manager._view_cache) == AppManager.VIEW_CACHE_SIZE
+
+    # 最近使用的视图保留，最早的被淘汰
+    misses = manager.cache_misses
+    manager.count_tasks('all', f"keyword-{AppManager.VIEW_CACHE_SIZE * 3 - 1}")
+    assert manager.cache_misses == misses
+    manager.count_tasks('all', 'keyword-0')
+    assert manager.cache_misses == misses + 1
+
+
+def test_modification_clears_view_cache(manager):
+    assert manager.count_tasks('completed') == 0
+    manager.get_learning_stats()
+    assert manager._view_cache
+
+    manager.mark_task_completed(1)
+    assert not manager._view_cache
+    assert manager.count_tasks('completed') == 1
+
+
+@pytest.mark.parametrize('status, search', FILTER_CASES)
+def test_query_tasks_offset_paging_matches_filter(paged_manager, status, search):
+    expected = expected_days(paged_manager, status, search)
+    assert expected or status in ('this_week', 'this_month') and search
+    assert paged_manager.count_tasks(status, search) == len(expected)
+
+    days = []
+    while True:
+        page = paged_manager.query_tasks(status, search, limit=7, offset=len(days))
+        assert page['total'] == len(expected)
+        if not page['tasks']:
+            break
+        days.extend(task.day for task in page['tasks'])
+    assert days == expected
+
+
+@pytest.mark.parametrize('status, search', FILTER_CASES)
+def test_query_tasks_keyset_paging_matches_filter(paged_manager, status, search):
+    expected = expected_days(paged_manager, status, search)
+
+    days = []
+    cursor = None
+    while True:
+        # 使用游标时 offset 被忽略
+        page = paged_manager.query_tasks(status, search, limit=7, offset=0 if cursor is None else 5, after_day=cursor)
+        assert len(page['tasks']) <= 7
+        days.extend(task.day for task in page['tasks'])
+        cursor = page['next_cursor']
+        if cursor is None:
+            break
+        assert cursor == days[-1]
+    assert days == expected
+
+
+def test_query_tasks_rejects_unknown_filter(paged_manager):
+    with pytest.raises(ValueError):
+        paged_manager.query_tasks('overdue')
+
+
+def test_repeated_view_hits_cache_until_generation_bump(manager):
+    before = manager.get_cache_stats()
+    first = manager.get_learning_stats()
+    assert manager.get_cache_stats() == dict(before, misses=before['misses'] + 1)
+
+    # 重复查看同一视图命中缓存，返回同一份结果
+    assert manager.get_learning_stats() is first
+    assert manager.get_cache_stats() == dict(before, hits=before['hits'] + 1, misses=before['misses'] + 1)
+
+    # 完成任务使代数递增，下一次查看重新计算
+    assert manager.mark_task_completed(1)
+    stats = manager.get_cache_stats()
+    assert stats['generation'] == before['generation'] + 1
+    updated = manager.get_learning_stats()
+    assert updated is not first
+    assert manager.get_cache_stats() == dict(stats, misses=stats['misses'] + 1)
+    assert updated['completed_days'] == first['completed_days'] + 1
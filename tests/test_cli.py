@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+命令行入口测试
+"""
+
+import argparse
+
+import pytest
+
+from src.cli import load_learning_data, main, parse_days
+
+
+class Settings(dict):
+    def get(self, key, default=None):
+        return super().get(key, default)
+
+
+def test_parse_days():
+    assert parse_days(['3', '1-2', '5,7', '']) == [3, 1, 2, 5, 7]
+
+
+def test_profile_requires_profiles_dir(capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        main(['--profile', 'alice', 'status'])
+    assert exc_info.value.code == 2
+    assert '--profiles-dir' in capsys.readouterr().err
+
+
+def test_broken_content_pack_falls_back_to_builtin(tmp_path):
+    pack_path = tmp_path / 'broken.json'
+    pack_path.write_text('{not json', encoding='utf-8')
+    args = argparse.Namespace(content_pack=str(pack_path))
+
+    data = load_learning_data(args, Settings({'data.content_cache_dir': str(tmp_path / 'cache')}))
+    assert data.get_task_by_day(1) is not None
+    assert data.get_indexed_days() > 0
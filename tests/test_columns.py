@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+任务列式视图测试
+NumPy 实现与纯Python回退实现的统计结果一致
+"""
+
+import random
+
+import pytest
+
+from benchmarks.synthetic import generate_curriculum
+from src.core.completion import CompletionBitmap
+from src.data import columns
+from src.data.columns import TaskColumns
+from src.data.learning_data import LearningData
+
+# 合成路线之外的难度和预计时间：未知难度、无法解析、超过4小时、小数区间、分钟数
+IRREGULAR_FIELDS = [
+    {"difficulty": "未知"},
+    {"estimated_time": ""},
+    {"estimated_time": "大约半天"},
+    {"estimated_time": "5小时"},
+    {"estimated_time": "1.5~2小时"},
+    {"estimated_time": "90分钟", "difficulty": ""},
+]
+
+
+@pytest.fixture(scope='module')
+def tasks():
+    data = LearningData(generate_curriculum(days=700, stages=6, seed=5))
+    rng = random.Random(0)
+    for day in rng.sample(range(1, 701), 120):
+        data.update_task(day, rng.choice(IRREGULAR_FIELDS))
+    return list(data.iter_tasks())
+
+
+def summarize(task_columns, completed):
+    """列式视图全部统计接口的结果（掩码转换为列表以便比较）"""
+    mask = task_columns.completion_mask(completed)
+    pending = task_columns.pending_mask(completed)
+    results = {
+        'len': len(task_columns),
+        'day': [int(day) for day in task_columns.day],
+        'completion_mask': [bool(selected) for selected in mask],
+        'pending_mask': [bool(selected) for selected in pending],
+    }
+    for name, selection in (('all', None), ('completed', mask), ('pending', pending)):
+        results[name] = (
+            task_columns.count(selection),
+            task_columns.difficulty_counts(selection),
+            task_columns.average_difficulty(selection),
+            task_columns.time_distribution(selection),
+            task_columns.total_minutes(selection),
+            task_columns.minutes_range(selection),
+            task_columns.week_load(selection),
+        )
+    return results
+
+
+@pytest.mark.parametrize('completed_days', [
+    [],
+    list(range(1, 701, 3)) + [705, 2000],  # 包含超出课程范围的天数
+    list(range(1, 701)),
+])
+def test_numpy_matches_pure_python(tasks, completed_days, monkeypatch):
+    pytest.importorskip('numpy')
+    completed = CompletionBitmap(completed_days)
+
+    monkeypatch.setattr(columns, 'np', None)
+    monkeypatch.setattr(columns, '_numpy_loaded', False)
+    with_numpy = TaskColumns(tasks)
+    assert columns.np is not None
+    expected = summarize(with_numpy, completed)
+
+    # 模拟未安装NumPy：不再尝试导入
+    monkeypatch.setattr(columns, 'np', None)
+    monkeypatch.setattr(columns, '_numpy_loaded', True)
+    pure_python = TaskColumns(tasks)
+    assert not hasattr(pure_python.day, 'dtype')
+
+    assert summarize(pure_python, completed) == expected
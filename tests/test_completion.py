@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+任务完成位图测试
+"""
+
+import random
+
+import pytest
+
+from src.core.completion import CompletionBitmap
+
+
+def test_bitmap_matches_set():
+    rng = random.Random(0)
+    bitmap = CompletionBitmap()
+    expected = set()
+    for _ in range(5000):
+        day = rng.randint(0, 700)
+        if rng.random() < 0.6:
+            assert bitmap.add(day) == (day not in expected)
+            expected.add(day)
+        else:
+            assert bitmap.discard(day) == (day in expected)
+            expected.discard(day)
+
+    assert len(bitmap) == len(expected)
+    assert list(bitmap) == sorted(expected)
+    assert all((day in bitmap) == (day in expected) for day in range(-2, 720))
+    for start in (0, 1, 7, 8, 9, 333, 699):
+        assert list(bitmap.iter_from(start)) == sorted(day for day in expected if day >= start)
+
+
+def test_count_range_matches_scan():
+    rng = random.Random(1)
+    days = set(rng.sample(range(1, 300), 120))
+    bitmap = CompletionBitmap(days)
+    for _ in range(500):
+        start = rng.randint(-5, 310)
+        end = rng.randint(start - 3, 320)
+        assert bitmap.count_range(start, end) == sum(1 for day in days if start <= day <= end)
+
+
+def test_task_id_round_trip():
+    bitmap = CompletionBitmap([3, 1, 17])
+    assert bitmap.to_task_ids() == ['day_1', 'day_3', 'day_17']
+    assert list(CompletionBitmap.from_task_ids(['day_17', 'day_1', 'day_3'])) == [1, 3, 17]
+
+
+def test_remap_drops_unmapped_days():
+    bitmap = CompletionBitmap([1, 2, 3])
+    assert list(bitmap.remap({1: 5, 3: 2})) == [2, 5]
+
+
+def test_add_rejects_negative_day():
+    with pytest.raises(ValueError):
+        CompletionBitmap().add(-1)
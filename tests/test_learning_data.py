@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LearningData 查询测试
+在10000天的合成学习路线上，将各索引查询与直接遍历原始数据的结果比较
+"""
+
+import json
+import random
+import time
+
+import pytest
+
+from benchmarks.synthetic import generate_curriculum
+from src.data.learning_data import LearningData
+
+DAYS = 10000
+
+
+@pytest.fixture(scope='module')
+def learning_path():
+    # 每周5天、9个阶段，使周和阶段边界不与7天对齐
+    return generate_curriculum(days=DAYS, stages=9, days_per_week=5, tasks_per_day=2, code_lines=2, seed=1)
+
+
+@pytest.fixture(scope='module')
+def data(learning_path):
+    return LearningData(learning_path)
+
+
+@pytest.fixture(scope='module')
+def pack_path(learning_path, tmp_path_factory):
+    path = tmp_path_factory.mktemp('pack') / 'synthetic.json'
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(learning_path, f, ensure_ascii=False)
+    return path
+
+
+def scan(learning_path):
+    """逐天遍历原始数据，返回 [(天数, 阶段, 周, 当天数据), ...]"""
+    rows = []
+    day = 1
+    for stage in learning_path["stages"]:
+        for week_detail in stage["weeks_detail"]:
+            for day_data in week_detail["days"]:
+                rows.append((day, stage, week_detail, day_data))
+                day += 1
+    return rows
+
+
+def sample_days():
+    rng = random.Random(0)
+    return [0, 1, 2, DAYS - 1, DAYS, DAYS + 1, -3] + rng.sample(range(1, DAYS + 1), 500)
+
+
+def test_indexed_days(data):
+    assert data.get_indexed_days() == DAYS
+    assert data.get_total_days() == DAYS
+
+
+def test_get_task_by_day_matches_scan(data, learning_path):
+    rows = {day: row for day, *row in scan(learning_path)}
+    for day in sample_days():
+        task = data.get_task_by_day(day)
+        if day not in rows:
+            assert task is None
+            continue
+        stage, week_detail, day_data = rows[day]
+        assert task.day == day
+        assert task.title == day_data["title"]
+        assert task.content == day_data["content"]
+        assert list(task.tasks) == day_data["tasks"]
+        assert task.stage_id == stage["id"]
+        assert task.week == week_detail["week"]
+
+
+def test_get_stage_by_day_matches_scan(data, learning_path):
+    rows = {day: row for day, *row in scan(learning_path)}
+    for day in sample_days():
+        stage_info = data.get_stage_by_day(day)
+        if day not in rows:
+            assert stage_info is None
+            continue
+        stage, week_detail, _ = rows[day]
+        assert stage_info == {
+            "stage_id": stage["id"],
+            "stage_name": stage["name"],
+            "week": week_detail["week"]
+        }
+
+
+def test_get_week_tasks_matches_scan(data, learning_path):
+    week_days = {}
+    for day, _, week_detail, _ in scan(learning_path):
+        week_days.setdefault(week_detail["week"], []).append(day)
+
+    for week, days in week_days.items():
+        assert [task.day for task in data.get_week_tasks(week)] == days
+    assert data.get_week_tasks(max(week_days) + 1) == []
+
+
+def test_stage_ranges_match_scan(data, learning_path):
+    stage_days = {}
+    for day, stage, _, _ in scan(learning_path):
+        stage_days.setdefault(stage["id"], []).append(day)
+
+    for stage_id, days in stage_days.items():
+        assert data.get_stage_day_range(stage_id) == (days[0], days[-1])
+        assert [task.day for task in data.get_tasks_by_stage(stage_id)] == days
+        progress = data.get_stage_progress(stage_id, days[0] + 2)
+        assert progress["total_days"] == len(days)
+        assert progress["completed_days"] == 3
+
+
+def test_cached_pack_matches_in_memory(data, pack_path, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    LearningData.from_content_pack(pack_path, cache_dir)
+    cached = LearningData.from_content_pack(pack_path, cache_dir)
+    assert list(cache_dir.iterdir())
+
+    for day in sample_days():
+        assert cached.get_task_by_day(day) == data.get_task_by_day(day)
+        assert cached.get_stage_by_day(day) == data.get_stage_by_day(day)
+    assert [task.day for task in cached.search_tasks('阶段', 20)] == [task.day for task in data.search_tasks('阶段', 20)]
+
+
+def test_cached_pack_loads_faster_than_parsing(pack_path, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    LearningData.from_content_pack(pack_path, cache_dir)
+
+    def best_of(cache):
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            LearningData.from_content_pack(pack_path, cache)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    # 主缓存只有天数索引和任务记录，搜索索引留到首次搜索时再读取
+    assert best_of(cache_dir) < best_of(None)
+    assert LearningData.from_content_pack(pack_path, cache_dir)._search_index is None
+
+
+def test_search_index_cache_written_on_first_search(data, pack_path, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    LearningData.from_content_pack(pack_path, cache_dir).search_tasks('阶段', 1)
+    assert len(list(cache_dir.glob('synthetic-*.search.pickle'))) == 1
+
+    cached = LearningData.from_content_pack(pack_path, cache_dir)
+    assert [task.day for task in cached.search_tasks('阶段', 20)] == [task.day for task in data.search_tasks('阶段', 20)]
+
+    # 修改任务后不再写回对应旧内容的缓存
+    cached.update_task(1, {"title": "x"})
+    assert cached._search_cache is None
+
+
+def test_memory_mapped_matches_in_memory(data, pack_path, tmp_path):
+    mapped = LearningData.from_content_pack(pack_path, tmp_path / 'cache', memory_mapped=True)
+    try:
+        assert mapped.get_indexed_days() == DAYS
+        for day in sample_days():
+            expected = data.get_task_by_day(day)
+            task = mapped.get_task_by_day(day)
+            if expected is None:
+                assert task is None
+                continue
+            assert (task.day, task.title, task.content, tuple(task.tasks), task.estimated_time, task.difficulty,
+                    task.stage_id, task.week) == \
+                   (expected.day, expected.title, expected.content, tuple(expected.tasks), expected.estimated_time,
+                    expected.difficulty, expected.stage_id, expected.week)
+            assert list(task.code_examples) == list(expected.code_examples)
+            assert mapped.get_stage_by_day(day) == data.get_stage_by_day(day)
+
+        for week in (1, 2, DAYS // 10, DAYS // 5):
+            assert [task.day for task in mapped.get_week_tasks(week)] == \
+                   [task.day for task in data.get_week_tasks(week)]
+        assert mapped.update_task(1, {"title": "x"}) is False
+    finally:
+        mapped.close()
+
+
+def per_call_seconds(func, arguments, repeat=5):
+    """逐个参数调用 func，返回多轮中最快一轮的平均单次耗时"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for argument in arguments:
+            func(argument)
+        best = min(best, (time.perf_counter() - start) / len(arguments))
+    return best
+
+
+def test_lookup_cost_flat_as_days_grow(data):
+    # 天数增加10倍，按天、按周和阶段进度查询的单次耗时应基本不变（允许4倍波动，线性耗时会增长约10倍）
+    small = LearningData(generate_curriculum(days=DAYS // 10, stages=9, days_per_week=5, tasks_per_day=2,
+                                             code_lines=2, seed=1))
+    rng = random.Random(0)
+
+    def costs(learning_data):
+        total_days = learning_data.get_indexed_days()
+        days = [rng.randint(1, total_days) for _ in range(20000)]
+        weeks = [learning_data.get_week_number(day) for day in days[:2000]]
+        progress = [(learning_data.get_stage_id(day), day) for day in days[:5000]]
+        return [
+            per_call_seconds(learning_data.get_task_by_day, days),
+            per_call_seconds(learning_data.get_stage_by_day, days),
+            per_call_seconds(learning_data.get_week_tasks, weeks),
+            per_call_seconds(lambda arguments: learning_data.get_stage_progress(*arguments), progress)
+        ]
+
+    for small_cost, large_cost in zip(costs(small), costs(data)):
+        assert large_cost < small_cost * 4
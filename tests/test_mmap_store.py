@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+内存映射存储测试
+按需加载的阶段与原始学习路线一致，阶段数据的LRU缓存保持有界
+"""
+
+import pytest
+
+from benchmarks.synthetic import generate_curriculum
+from src.data.mmap_store import CurriculumStore
+
+STAGES = 9
+
+
+@pytest.fixture(scope='module')
+def learning_path():
+    return generate_curriculum(days=600, stages=STAGES, days_per_week=5, seed=4)
+
+
+@pytest.fixture
+def store(learning_path, tmp_path):
+    path = tmp_path / 'curriculum.lcur'
+    CurriculumStore.build(learning_path, path)
+    store = CurriculumStore(path, stage_cache_size=2)
+    yield store
+    store.close()
+
+
+def test_lazy_stage_keys_consistent(store, learning_path):
+    stages = store.learning_path()["stages"]
+    stage = stages[0]
+    expected = learning_path["stages"][0]
+
+    # 判断键是否存在、遍历键和取长度都不解码 weeks_detail
+    assert "weeks_detail" in stage
+    assert "missing" not in stage
+    assert set(stage) == set(stage.keys()) == set(expected)
+    assert len(stage) == len(expected)
+    assert store.resident_stages() == []
+
+    assert dict(stage) == expected
+    assert [dict(stage) for stage in stages] == learning_path["stages"]
+
+
+def test_stage_body_cache_bounded(store):
+    stages = store.learning_path()["stages"]
+    for index, stage in enumerate(stages):
+        stage["weeks_detail"]
+        assert len(store.resident_stages()) == min(index + 1, store.stage_cache_size)
+    assert store.resident_stages() == [STAGES - 2, STAGES - 1]
+
+    # 命中的阶段移到最近使用的位置，并返回同一份解码结果
+    body = stages[STAGES - 2]["weeks_detail"]
+    assert stages[STAGES - 2]["weeks_detail"] is body
+    assert store.resident_stages() == [STAGES - 1, STAGES - 2]
+
+    stages[0]["weeks_detail"]
+    assert store.resident_stages() == [STAGES - 2, 0]
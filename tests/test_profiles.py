@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+学习者档案管理测试
+"""
+
+import pytest
+
+from src.core.profiles import JOURNAL_BACKEND, JSON_BACKEND, ProfileManager
+from src.data.learning_data import LearningData
+
+
+@pytest.fixture(scope='module')
+def learning_data():
+    return LearningData()
+
+
+def create_profiles(learning_data, profiles_dir, backend, names):
+    manager = ProfileManager(learning_data, profiles_dir, backend_factory=backend, auto_save=False)
+    for name in names:
+        manager.get(name).completed.add(1)
+    manager.close()
+
+
+def test_list_profiles_only_includes_backend_files(learning_data, tmp_path):
+    create_profiles(learning_data, tmp_path, None, ['alice', 'bob'])
+    create_profiles(learning_data, tmp_path, JSON_BACKEND, ['carol'])
+    create_profiles(learning_data, tmp_path, JOURNAL_BACKEND, ['dave'])
+    (tmp_path / 'backup').mkdir()
+    (tmp_path / 'README.txt').write_text('', encoding='utf-8')
+
+    assert ProfileManager(learning_data, tmp_path).list_profiles() == ['alice', 'bob']
+    assert ProfileManager(learning_data, tmp_path, backend_factory=JSON_BACKEND).list_profiles() == ['carol']
+    assert ProfileManager(learning_data, tmp_path, backend_factory=JOURNAL_BACKEND).list_profiles() == ['dave']
+
+
+def test_plain_factory_lists_loaded_profiles(learning_data, tmp_path):
+    create_profiles(learning_data, tmp_path, None, ['alice'])
+    manager = ProfileManager(learning_data, tmp_path, backend_factory=lambda path: JSON_BACKEND(path))
+    assert manager.list_profiles() == []
+    manager.get('erin')
+    assert manager.list_profiles() == ['erin']
+    manager.close()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+相关任务索引测试
+"""
+
+import pytest
+
+from benchmarks.synthetic import generate_curriculum
+from src.data.learning_data import LearningData
+from src.data.related import DEFAULT_TOP_K, RelatedTasks
+from src.data.search_index import extract_fields
+
+
+@pytest.fixture(scope='module')
+def data():
+    return LearningData(generate_curriculum(days=300, seed=2))
+
+
+def documents(data):
+    return [(task.day, extract_fields(task)) for task in data.iter_tasks()]
+
+
+def build(data):
+    related = RelatedTasks()
+    related.sync(documents(data))
+    return related
+
+
+def test_update_only_rebuilds_changed_rows(data, monkeypatch):
+    related = build(data)
+    first = dict(documents(data)[0][1])
+    copied = dict(documents(data)[150][1])
+
+    def fail():
+        raise AssertionError("不应全量构建矩阵")
+
+    monkeypatch.setattr(related, '_build_matrix', fail)
+    postings_before = {term: dict(postings) for term, postings in related._columns.items()}
+    updated = related.update_document(1, copied)
+
+    assert 0 < updated < len(related) * 0.2
+    assert related.related(1)[0][0] == 151
+    assert related.related(151)[0][0] == 1
+    # 未变化任务的倒排项保持不变
+    for term, postings in related._columns.items():
+        for day, weight in postings.items():
+            if day != 1:
+                assert postings_before[term][day] == weight
+
+    # 改回原文本
+    related.update_document(1, first)
+    assert related.related(151)[0][0] != 1
+
+
+def test_accumulated_changes_trigger_full_rebuild(data):
+    related = build(data)
+    rebuilds = []
+    build_matrix = related._build_matrix
+    related._build_matrix = lambda: (rebuilds.append(1), build_matrix())
+
+    docs = documents(data)
+    for index, (day, fields) in enumerate(docs[:int(len(docs) * 0.2) + 1]):
+        related.update_document(day, dict(fields, title=fields['title'] + f" 修订{index}"))
+    assert len(rebuilds) == 1
+    assert related._stale_rows == 0
+
+
+def test_renumber_matches_fresh_build(data):
+    related = build(data)
+    docs = documents(data)
+    # 在开头插入一天：所有天数后移一天
+    inserted = {'title': '新增', 'content': '', 'tasks': '', 'code_examples': ''}
+    related.apply_diff({day: day + 1 for day, _ in docs}, [], {})
+
+    fresh = RelatedTasks()
+    fresh.sync([(day + 1, fields) for day, fields in docs])
+    for day, _ in docs:
+        assert related.related(day + 1) == fresh.related(day + 1)
+    assert related.related(1) == ()
+
+    related.apply_diff({}, [], {1: inserted})
+    assert len(related) == len(docs) + 1
+
+
+def test_related_tasks_limit(data):
+    assert len(data.get_related_tasks(10, limit=DEFAULT_TOP_K)) == DEFAULT_TOP_K
+    assert len(data.get_related_tasks(10, limit=2)) == 2
+    with pytest.raises(ValueError):
+        data.get_related_tasks(10, limit=DEFAULT_TOP_K + 1)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+搜索索引测试
+在小型内容包上检查中文二元组分词、中英文混合查询和BM25排序，
+以及标题增量搜索与逐个比较标题的结果是否一致
+"""
+
+import math
+import random
+
+import pytest
+
+from benchmarks.synthetic import generate_curriculum
+from src.data.learning_data import LearningData
+from src.data.search_index import FIELD_WEIGHTS, IncrementalSearch, SearchIndex, extract_fields, tokenize
+
+DAYS = [
+    {"title": "线性回归", "content": "回归分析基础", "tasks": ["最小二乘法"]},
+    {"title": "逻辑回归", "content": "分类模型", "tasks": ["使用sklearn"]},
+    {"title": "数据可视化", "content": "用Matplotlib展示线性回归的结果", "tasks": ["绘制散点图"]},
+    {"title": "NumPy数组", "content": "numpy数组的创建和索引", "tasks": ["数组切片", "数组广播"],
+     "code_examples": [{"title": "创建数组", "code": "import numpy as np"}]},
+    {"title": "Pandas数据处理", "content": "DataFrame与数组的转换", "tasks": ["读取CSV"]},
+    {"title": "回归回归回归", "content": "重复标题", "tasks": []},
+]
+
+
+@pytest.fixture
+def learning_path():
+    days = [dict(day, estimated_time="2小时", difficulty="基础") for day in DAYS]
+    return {
+        "total_days": len(days),
+        "stages": [
+            {"id": 1, "name": "阶段一", "weeks_detail": [{"week": 1, "title": "第一周", "days": days[:3]}]},
+            {"id": 2, "name": "阶段二", "weeks_detail": [{"week": 2, "title": "第二周", "days": days[3:]}]},
+        ]
+    }
+
+
+@pytest.fixture
+def data(learning_path):
+    return LearningData(learning_path)
+
+
+def reference_scores(query, k1=1.5, b=0.75):
+    """直接按BM25公式逐文档计算得分（所有查询词项都须命中，英文词项按前缀匹配）"""
+    doc_terms = {}
+    for day, day_data in enumerate(DAYS, 1):
+        freqs = {}
+        for field, text in extract_fields(day_data).items():
+            for token in tokenize(text):
+                freqs[token] = freqs.get(token, 0.0) + FIELD_WEIGHTS[field]
+        doc_terms[day] = freqs
+    avg_length = sum(sum(freqs.values()) for freqs in doc_terms.values()) / len(doc_terms)
+
+    scores = {}
+    for day, freqs in doc_terms.items():
+        score = 0.0
+        for query_term in dict.fromkeys(tokenize(query, for_query=True)):
+            terms = [term for term in freqs if term == query_term or (query_term.isascii() and term.startswith(query_term))]
+            if not terms:
+                break
+            for term in terms:
+                doc_freq = sum(1 for other in doc_terms.values() if term in other)
+                idf = math.log(1 + (len(doc_terms) - doc_freq + 0.5) / (doc_freq + 0.5))
+                norm = k1 * (1 - b + b * sum(freqs.values()) / avg_length)
+                score += idf * freqs[term] * (k1 + 1) / (freqs[term] + norm)
+        else:
+            scores[day] = score
+    return scores
+
+
+def test_tokenize_cjk_bigrams():
+    assert tokenize("数学建模") == ["数", "学", "建", "模", "数学", "学建", "建模"]
+    # 查询时中文只用二元组，单字片段保留单字
+    assert tokenize("数学建模", for_query=True) == ["数学", "学建", "建模"]
+    assert tokenize("数", for_query=True) == ["数"]
+
+
+def test_tokenize_mixed_latin_and_cjk():
+    assert tokenize("NumPy数组 v2_api，测试") == ["numpy", "数", "组", "数组", "v2_api", "测", "试", "测试"]
+    assert tokenize("用Matplotlib画图", for_query=True) == ["用", "matplotlib", "画图"]
+    assert tokenize("  ,.!  ") == []
+
+
+@pytest.mark.parametrize('query', ["回归", "线性回归", "数组", "numpy 数组", "num", "NumPy数组", "数据", "分析"])
+def test_bm25_matches_reference(query):
+    index = SearchIndex.build((day, extract_fields(day_data)) for day, day_data in enumerate(DAYS, 1))
+    expected = reference_scores(query)
+    results = index.search(query)
+
+    assert [day for day, _ in results] == sorted(expected, key=lambda day: (-expected[day], day))
+    for day, score in results:
+        assert score == pytest.approx(expected[day])
+
+
+def test_bm25_ranking_order(data):
+    # 标题命中（权重3.0）高于只在内容中命中；标题中多次出现的排在最前
+    assert [task.day for task in data.search_tasks("回归")] == [6, 1, 2, 3]
+    assert [task.day for task in data.search_tasks("线性回归")] == [1, 3]
+    assert [task.day for task in data.search_tasks("线性回归", limit=1)] == [1]
+
+
+def test_mixed_query_requires_every_term(data):
+    # 英文词项按前缀匹配，中英文词项都必须命中
+    assert [task.day for task in data.search_tasks("numpy 数组")] == [4]
+    assert [task.day for task in data.search_tasks("NUM数组")] == [4]
+    assert [task.day for task in data.search_tasks("dataframe 数组")] == [5]
+    assert data.search_tasks("numpy 回归") == []
+    assert data.search_tasks("不存在") == []
+
+
+def test_search_follows_task_updates(data):
+    assert [task.day for task in data.search_tasks("逻辑")] == [2]
+    data.update_task(2, {"title": "决策树"})
+    assert data.search_tasks("逻辑") == []
+    assert [task.day for task in data.search_tasks("决策树")] == [2]
+
+
+def scan_titles(titles, query):
+    """逐个标题做子串比较（HistoryPanel 原先的过滤方式）"""
+    return {key for key, title in titles if query.lower() in title.lower()}
+
+
+@pytest.fixture
+def titles():
+    return [(day, day_data["title"]) for day, day_data in enumerate(DAYS, 1)] + \
+           [(7, "Python基础"), (8, "Python进阶"), (9, "PyTorch入门"), (10, "数据结构")]
+
+
+def test_incremental_search_narrows_previous_results(titles):
+    search = IncrementalSearch(titles)
+    assert search.search("py") == {4, 7, 8, 9}
+
+    # 追加字符时只在上一次的结果中筛选，不再查倒排表
+    search._grams = {}
+    assert search.search("pyt") == {7, 8, 9}
+    assert search.search("pyth") == {7, 8}
+    assert search.search("python进") == {8}
+
+
+def test_incremental_search_backspace(titles):
+    search = IncrementalSearch(titles)
+    assert search.search("数据结") == {10}
+    # 删除字符后结果集变大，需要重新查倒排表
+    assert search.search("数据") == {3, 5, 10}
+    assert search.search("数") == {3, 4, 5, 10}
+    assert search.search("") == {key for key, _ in titles}
+    assert search.search("x") == set()
+    assert search.search("") == {key for key, _ in titles}
+
+
+def test_incremental_search_after_update_task(data):
+    assert data.search_titles("回归") == {1, 2, 6}
+    assert data.search_titles("逻辑回归") == {2}
+
+    # 修改标题后，相同查询和追加字符的查询都反映新标题
+    data.update_task(2, {"title": "决策树"})
+    assert data.search_titles("逻辑回归") == set()
+    assert data.search_titles("回归") == {1, 6}
+    data.update_task(1, {"title": "岭回归"})
+    assert data.search_titles("回") == {1, 6}
+    assert data.search_titles("岭回") == {1}
+    assert data.search_titles("决策") == {2}
+
+
+def test_incremental_search_matches_fresh_search():
+    # 随机模拟输入、退格和清空，每次结果都与全新索引和逐个比较的结果一致
+    learning_data = LearningData(generate_curriculum(days=300, seed=2))
+    titles = [(task.day, task.title) for task in learning_data.iter_tasks()]
+    search = IncrementalSearch(titles)
+    rng = random.Random(0)
+    alphabet = "".join(sorted({char for _, title in titles for char in title.lower()}))
+
+    query = ""
+    for _ in range(500):
+        action = rng.random()
+        if action < 0.6 and len(query) < 6:
+            # 多数时候从现有标题中取下一个字符，使查询保持有结果
+            matched = sorted(search.search(query))
+            title = dict(titles)[rng.choice(matched)].lower() if matched else alphabet
+            position = title.find(query) + len(query) if matched else -1
+            query += title[position] if 0 <= position < len(title) else rng.choice(alphabet)
+        elif action < 0.9:
+            query = query[:-1]
+        else:
+            query = ""
+
+        expected = scan_titles(titles, query)
+        assert search.search(query) == expected
+        assert IncrementalSearch(titles).search(query) == expected
+        assert learning_data.search_titles(query) == expected
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+启动性能分析器测试
+命令行参数解析，以及启动报告与预算的比较
+"""
+
+import importlib
+import json
+import sys
+
+import pytest
+
+from src.utils.startup_profiler import StartupProfiler, check_budget
+
+REPORT = {
+    'total_ms': 1200.0,
+    'phases': {'import_app': 250.0, 'build': 600.0},
+    'packages': {'kivy': 800.0, 'src': 90.0},
+    'imports': []
+}
+
+
+@pytest.fixture
+def profilers():
+    """测试中创建的分析器，结束时从 sys.meta_path 中移除"""
+    created = []
+    yield created
+    for profiler in created:
+        profiler.stop()
+
+
+def test_check_budget_passes_within_limits():
+    budget = {'total_ms': 1200, 'phases': {'import_app': 300, 'build': 600}, 'packages': {'kivy': 1000}}
+    assert check_budget(REPORT, budget) == []
+    # 预算中未出现的项目和报告中没有的项目都不检查
+    assert check_budget(REPORT, {}) == []
+    assert check_budget(REPORT, {'phases': {'fonts': 1}, 'packages': {'numpy': 1}}) == []
+
+
+def test_check_budget_reports_each_violation():
+    budget = {'total_ms': 1000, 'phases': {'import_app': 300, 'build': 500}, 'packages': {'kivy': 1000, 'src': 50}}
+    assert check_budget(REPORT, budget) == [
+        "total 1200.0ms > 1000ms",
+        "phases.build 600.0ms > 500ms",
+        "packages.src 90.0ms > 50ms",
+    ]
+
+
+def test_from_argv_disabled_by_default(profilers):
+    argv = ['main.py', '--size', '800x600']
+    profiler = StartupProfiler.from_argv(argv)
+    profilers.append(profiler)
+
+    assert not profiler.enabled
+    assert profiler.report_path is None and profiler.budget_path is None
+    assert argv == ['main.py', '--size', '800x600']
+    assert profiler.finish() == 0
+
+
+def test_from_argv_strips_profiler_options(profilers):
+    argv = ['main.py', '--profile-startup', '--size', '800x600',
+            '--startup-report', 'report.json', '--startup-budget=budget.json', 'extra']
+    profiler = StartupProfiler.from_argv(argv)
+    profilers.append(profiler)
+
+    assert profiler.enabled
+    assert profiler.report_path == 'report.json'
+    assert profiler.budget_path == 'budget.json'
+    # 其余参数原样保留给应用（Kivy）解析
+    assert argv == ['main.py', '--size', '800x600', 'extra']
+
+
+def test_from_argv_option_without_value(profilers):
+    # "--option=" 的值为空，不会把下一个参数当作路径
+    argv = ['main.py', '--startup-report=', '--startup-budget']
+    profiler = StartupProfiler.from_argv(argv)
+    profilers.append(profiler)
+
+    assert not profiler.enabled
+    assert profiler.report_path is None and profiler.budget_path is None
+    assert argv == ['main.py']
+
+
+@pytest.mark.parametrize('total_budget, exit_code', [(60000, 0), (0, 1)])
+def test_finish_checks_budget(tmp_path, profilers, capsys, total_budget, exit_code):
+    budget_path = tmp_path / 'budget.json'
+    budget_path.write_text(json.dumps({'total_ms': total_budget}), encoding='utf-8')
+    report_path = tmp_path / 'out' / 'report.json'
+    argv = ['main.py', '--profile-startup', '--startup-report', str(report_path), '--startup-budget', str(budget_path)]
+    profiler = StartupProfiler.from_argv(argv)
+    profilers.append(profiler)
+
+    # 在分析器启用期间导入一个模块
+    sys.modules.pop('json.tool', None)
+    importlib.import_module('json.tool')
+    profiler.mark('import_app')
+
+    assert profiler.finish() == exit_code
+    assert profiler.exit_code == exit_code
+    report = json.loads(report_path.read_text(encoding='utf-8'))
+    assert 'import_app' in report['phases']
+    assert 'json.tool' in [entry['module'] for entry in report['imports']]
+    assert ("超出启动预算" in capsys.readouterr().out) == bool(exit_code)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LearningStatistics 测试
+连续学习天数的增量维护，以及增量计数与 rebuild 重建结果的一致性
+"""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from src.core.statistics import LearningStatistics
+from src.data.learning_data import LearningData
+
+TODAY = date(2026, 3, 10)
+
+
+def on(days_ago: int) -> str:
+    """距 TODAY 若干天的完成时间"""
+    return f"{(TODAY - timedelta(days=days_ago)).isoformat()}T20:00:00"
+
+
+@pytest.fixture(scope='module')
+def learning_data():
+    return LearningData()
+
+
+@pytest.fixture
+def stats(learning_data):
+    return LearningStatistics(learning_data)
+
+
+def snapshot(stats):
+    """统计引擎的全部对外可见状态（计数为0的阶段/周视为不存在）"""
+    return (
+        stats.completed_count,
+        stats.total_minutes,
+        {stage: count for stage, count in stats.stage_completed.items() if count},
+        {week: count for week, count in stats.week_completed.items() if count},
+        stats.daily_counts(),
+        stats.current_streak(TODAY)
+    )
+
+
+def test_streak_across_gap(stats):
+    # 3天前、2天前连续学习，昨天中断，今天重新开始
+    stats.on_completed(1, on(3))
+    stats.on_completed(2, on(2))
+    assert stats.current_streak(TODAY - timedelta(days=2)) == 2
+    assert stats.current_streak(TODAY) == 0
+
+    stats.on_completed(3, on(0))
+    assert stats.current_streak(TODAY) == 1
+
+    # 补上中断的一天后，连续天数跨过原来的空缺
+    stats.on_completed(4, on(1))
+    assert stats.current_streak(TODAY) == 4
+
+
+def test_uncompleting_last_day_of_streak(stats):
+    for day, days_ago in ((1, 2), (2, 1), (3, 0)):
+        stats.on_completed(day, on(days_ago))
+    assert stats.current_streak(TODAY) == 3
+
+    # 取消今天的完成后，截至昨天的连续天数仍然有效
+    stats.on_uncompleted(3, on(0))
+    assert stats.current_streak(TODAY) == 2
+    stats.on_uncompleted(2, on(1))
+    assert stats.current_streak(TODAY) == 0
+    assert stats.current_streak(TODAY - timedelta(days=1)) == 1
+    stats.on_uncompleted(1, on(2))
+    assert stats.current_streak(TODAY) == 0
+    assert stats.daily_counts() == []
+
+
+def test_multiple_completions_on_same_date(stats):
+    stats.on_completed(1, on(1))
+    stats.on_completed(2, on(0))
+    stats.on_completed(3, on(0))
+    stats.on_completed(4, on(0))
+    assert stats.daily_counts() == [(TODAY - timedelta(days=1), 1), (TODAY, 3)]
+    assert stats.current_streak(TODAY) == 2
+
+    # 同一天还有其他完成记录时，取消其中一项不影响连续天数
+    stats.on_uncompleted(3, on(0))
+    stats.on_uncompleted(2, on(0))
+    assert stats.daily_counts() == [(TODAY - timedelta(days=1), 1), (TODAY, 1)]
+    assert stats.current_streak(TODAY) == 2
+    assert stats.completed_count == 2
+
+
+def test_rebuild_matches_incremental(stats, learning_data):
+    rng = random.Random(0)
+    total_days = learning_data.get_indexed_days()
+    completion_dates = {}
+
+    for _ in range(300):
+        day = rng.randint(1, total_days)
+        key = f"day_{day}"
+        if key in completion_dates:
+            stats.on_uncompleted(day, completion_dates.pop(key))
+        else:
+            # 完成时间不按顺序到达，且部分记录没有完成时间
+            completion_dates[key] = on(rng.randint(0, 6)) if rng.random() < 0.9 else None
+            stats.on_completed(day, completion_dates[key])
+
+        rebuilt = LearningStatistics(learning_data)
+        completed_days = sorted(int(key[4:]) for key in completion_dates)
+        rebuilt.rebuild(completed_days, completion_dates)
+        assert snapshot(stats) == snapshot(rebuilt)
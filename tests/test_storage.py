@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+进度存储后端测试
+"""
+
+import pytest
+
+from src.core.storage import (JournalProgressStorage, JsonProgressStorage, SqliteProgressStorage,
+                              WriteBehindStorage)
+
+BACKENDS = {
+    'json': lambda directory: JsonProgressStorage(directory / 'progress.json'),
+    'sqlite': lambda directory: SqliteProgressStorage(directory / 'progress.db', legacy_json_path=None),
+    'journal': lambda directory: JournalProgressStorage(directory / 'journal', compact_threshold=4),
+}
+
+
+class FailingStorage(JsonProgressStorage):
+    """提交时抛出异常的存储（模拟磁盘已满）"""
+
+    def __init__(self, file_path):
+        super().__init__(file_path)
+        self.fail = True
+
+    def _commit(self):
+        if self.fail:
+            raise OSError("disk full")
+        super()._commit()
+
+
+def test_write_behind_keeps_pending_after_failed_flush(tmp_path):
+    backend = FailingStorage(tmp_path / 'progress.json')
+    storage = WriteBehindStorage(backend, interval=300, auto_save=False)
+    storage.set_task_completed(1, True, '2024-01-01T10:00:00')
+    storage.set_task_note(1, 'note')
+    storage.set_current_day(2)
+    assert storage.pending_count == 3
+
+    with pytest.raises(OSError):
+        storage.flush()
+    assert storage.pending_count == 3
+
+    # 失败后的新修改与放回队列的修改按键合并
+    storage.set_task_note(1, 'newer note')
+    assert storage.pending_count == 3
+
+    backend.fail = False
+    storage.flush()
+    assert storage.pending_count == 0
+
+    progress = JsonProgressStorage(tmp_path / 'progress.json').load()
+    assert progress['completed_tasks'] == ['day_1']
+    assert progress['task_notes'] == {'day_1': 'newer note'}
+    assert progress['current_day'] == 2
+
+
+def apply_edits(storage):
+    storage.set_task_completed(1, True, '2024-01-01T10:00:00')
+    storage.set_task_completed(3, True, '2024-01-02T10:00:00')
+    storage.set_task_completed(2, True, '2024-01-02T11:00:00')
+    storage.set_task_completed(3, False)
+    storage.set_task_note(2, '# 笔记')
+    storage.set_task_note(2, '# 笔记\n- 修改')
+    storage.set_current_day(4)
+    storage.set_statistics({'total_study_time': 90})
+    with storage.batch():
+        storage.set_task_completed(5, True, '2024-01-03T09:00:00')
+        storage.set_current_day(6)
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+@pytest.mark.parametrize('write_behind', [False, True])
+def test_backends_reload_same_progress(tmp_path, backend, write_behind):
+    storage = BACKENDS[backend](tmp_path)
+    if write_behind:
+        storage = WriteBehindStorage(storage, interval=300, auto_save=False)
+    assert storage.load() is None
+    apply_edits(storage)
+    storage.close()
+
+    reloaded = BACKENDS[backend](tmp_path)
+    try:
+        progress = reloaded.load()
+        assert sorted(progress['completed_tasks']) == ['day_1', 'day_2', 'day_5']
+        assert progress['completion_dates'] == {
+            'day_1': '2024-01-01T10:00:00',
+            'day_2': '2024-01-02T11:00:00',
+            'day_5': '2024-01-03T09:00:00'
+        }
+        assert progress['task_notes'] == {'day_2': '# 笔记\n- 修改'}
+        assert progress['current_day'] == 6
+        assert progress['statistics'] == {'total_study_time': 90}
+
+        assert 'task_notes' not in reloaded.load(include_notes=False)
+        assert reloaded.load_notes() == {'day_2': '# 笔记\n- 修改'}
+    finally:
+        reloaded.close()
+
+
+def test_journal_reload_closes_open_segment(tmp_path):
+    storage = JournalProgressStorage(tmp_path / 'journal')
+    assert storage.load() is None
+    storage.set_task_completed(1, True, '2024-01-01T10:00:00')
+    storage.set_task_note(1, 'note')
+    segment_file = storage._file
+
+    progress = storage.load()
+    assert segment_file.closed
+    assert progress['completed_tasks'] == ['day_1']
+    assert progress['task_notes'] == {'day_1': 'note'}
+
+    # 重新加载后的修改写入新的日志段，且不会重复计入已重放的事件
+    storage.set_current_day(2)
+    assert storage._events_since_compaction == 3
+    storage.close()
+
+    reloaded = JournalProgressStorage(tmp_path / 'journal')
+    assert reloaded.load()['current_day'] == 2
+    reloaded.close()
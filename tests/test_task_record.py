@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+预计学习时间解析测试
+"""
+
+import pytest
+
+from src.data.learning_data import parse_estimated_minutes
+from src.data.task_record import EstimatedTime, parse_estimated_time
+
+
+@pytest.mark.parametrize('text, expected', [
+    # 单个数值：小时和分钟
+    ("2小时", (120, 120)),
+    ("30分钟", (30, 30)),
+    ("1.5小时", (90, 90)),
+    ("90 分钟", (90, 90)),
+    # 区间：各种连接符，单位写在区间末尾
+    ("2-3小时", (120, 180)),
+    ("1.5~2小时", (90, 120)),
+    ("1～2小时", (60, 120)),
+    ("2到3小时", (120, 180)),
+    ("45至60分钟", (45, 60)),
+    ("2 - 3 小时", (120, 180)),
+    # 前后有其他文字时取第一处时间
+    ("约2-3小时（含练习）", (120, 180)),
+    ("每天30分钟，共2小时", (30, 30)),
+])
+def test_parse_estimated_time(text, expected):
+    estimate = parse_estimated_time(text)
+    assert (estimate.min_minutes, estimate.max_minutes) == expected
+    assert estimate.minutes == round(sum(expected) / 2)
+    assert estimate
+
+
+@pytest.mark.parametrize('text', [
+    "", None, "   ", "待定", "大约半天", "两小时", "2 hours", "30min", "2-3", "小时",
+])
+def test_unparsable_estimated_time(text):
+    estimate = parse_estimated_time(text)
+    assert estimate == EstimatedTime(0, 0)
+    assert not estimate
+    assert estimate.minutes == 0
+
+
+def test_parse_estimated_minutes_takes_midpoint():
+    assert parse_estimated_minutes("2-3小时") == 150
+    assert parse_estimated_minutes("1-2分钟") == 2  # 1.5 四舍五入到偶数
+    assert parse_estimated_minutes("garbage") == 0
+
+
+def test_parse_estimated_time_reuses_result():
+    assert parse_estimated_time("2-3小时") is parse_estimated_time("2-3小时")
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+学习路线版本比较测试
+"""
+
+from src.data.versioning import diff_days
+
+
+def signature(title, content, stable_id=None):
+    return (stable_id, title, f"hash-{content}")
+
+
+def test_identical_versions_have_no_diff():
+    old = [signature('a', 1), signature('b', 2)]
+    diff = diff_days(old, list(old))
+    assert not diff
+    assert diff.day_map == {1: 1, 2: 2}
+
+
+def test_inserted_day_moves_following_days():
+    old = [signature('a', 1), signature('b', 2), signature('c', 3)]
+    new = [signature('a', 1), signature('new', 9), signature('b', 2), signature('c', 3)]
+    diff = diff_days(old, new)
+    assert diff.added == [2]
+    assert diff.removed == []
+    assert diff.changed == []
+    assert diff.moved == {2: 3, 3: 4}
+
+
+def test_changed_and_removed_days():
+    old = [signature('a', 1), signature('b', 2), signature('c', 3)]
+    new = [signature('a', 1), signature('c', 30)]
+    diff = diff_days(old, new)
+    assert diff.day_map == {1: 1, 3: 2}
+    assert diff.changed == [2]
+    assert diff.removed == [2]
+    assert diff.nearest_day(2) == 2
+    assert diff.nearest_day(10) == 9
+
+
+def test_duplicate_content_matches_in_order():
+    old = [signature('x', 1), signature('x', 1)]
+    new = [signature('y', 0), signature('x', 1), signature('x', 1)]
+    diff = diff_days(old, new)
+    assert diff.day_map == {1: 2, 2: 3}
+    assert diff.added == [1]
+
+
+def test_stable_id_takes_precedence():
+    old = [signature('a', 1, 'id-1'), signature('b', 2, 'id-2')]
+    new = [signature('b', 2, 'id-1'), signature('a', 1, 'id-2')]
+    diff = diff_days(old, new)
+    assert diff.day_map == {1: 1, 2: 2}
+    assert diff.changed == [1, 2]